@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import User, Posts, Comments, Likes, Followers
+from .models import User, Posts, Comments, Likes, Followers, TimelineEntries, Counters, LikeCounterShards, Jobs
 
 # Register your models here.
 admin.site.register(User)
@@ -7,3 +7,7 @@ admin.site.register(Posts)
 admin.site.register(Comments)
 admin.site.register(Likes)
 admin.site.register(Followers)
+admin.site.register(TimelineEntries)
+admin.site.register(Counters)
+admin.site.register(LikeCounterShards)
+admin.site.register(Jobs)
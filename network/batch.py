@@ -0,0 +1,155 @@
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import cache, counters, events, graph, jobs, search
+from .models import User, Posts, Likes, Followers
+from .likes import apply_pending_likes
+from .ranking import rescored
+from .timeline import serialize_new_post
+
+
+BATCH_SIZE = 1000
+
+
+# Largest number of items a batch request may hold
+def max_items():
+    return getattr(settings, "BATCH_WRITE_MAX_ITEMS", 5000)
+
+
+# The integer under "key" of a batch item, or None if it has none
+def item_id(item, key):
+    try:
+        return int(item[key])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
+# Inserts a row of "model" for each value of "column" in "values", with "fixed" in
+# the other columns and the current time as "timestamp", skipping the rows that
+# already exist, and returns the values of the rows it inserted. The values come from
+# the INSERT itself with RETURNING, so a row another transaction commits in the
+# meantime is never taken for one of ours.
+def insert_new(model, fixed, column, values):
+    values = sorted(values)
+    if not values:
+        return set()
+    opts = model._meta
+    columns = [*fixed, column, "timestamp"]
+    timestamp = connection.ops.adapt_datetimefield_value(timezone.now())
+    inserted = set()
+    with connection.cursor() as cursor:
+        for i in range(0, len(values), BATCH_SIZE):
+            batch = values[i:i + BATCH_SIZE]
+            rows = ", ".join(["(" + ", ".join(["%s"] * len(columns)) + ")"] * len(batch))
+            params = [param for value in batch for param in (*fixed.values(), value, timestamp)]
+            cursor.execute(
+                f"INSERT INTO {connection.ops.quote_name(opts.db_table)} "
+                f"({', '.join(map(connection.ops.quote_name, columns))}) VALUES {rows} "
+                f"ON CONFLICT DO NOTHING RETURNING {connection.ops.quote_name(column)}",
+                params,
+            )
+            inserted.update(row[0] for row in cursor.fetchall())
+    return inserted
+
+
+def invalid(error):
+    return {"status": "invalid", "error": error}
+
+
+# Splits the ids of a batch into the results of the items that are already decided
+# and the index of the first item of each remaining id. Repeated ids are "exists".
+def first_items(ids, error):
+    results = [None] * len(ids)
+    first = {}
+    for i, obj_id in enumerate(ids):
+        if obj_id is None:
+            results[i] = invalid(error)
+        elif obj_id in first:
+            results[i] = {"status": "exists"}
+        else:
+            first[obj_id] = i
+    return results, first
+
+
+# Writes the posts of "user" with the texts of "items" in one transaction and returns
+# a result per item. Posts are inserted and counted in bulk, and fanned out and
+# tagged by one job, so the number of queries does not grow with the number of posts.
+def create_posts(user, items):
+    results = [None] * len(items)
+    posts = []
+    for i, item in enumerate(items):
+        text = item.get("text") if isinstance(item, dict) else None
+        if not isinstance(text, str) or not text.strip() or len(text) > 280:
+            results[i] = invalid("Text must be 1 to 280 characters long.")
+        else:
+            posts.append((i, Posts(user=user, text=text)))
+    with transaction.atomic():
+        # bulk_create sends no post_save, so the versions bumped by signals.py are bumped here
+        created = Posts.objects.bulk_create([post for i, post in posts], batch_size=BATCH_SIZE)
+        if created:
+            User.objects.filter(pk=user.id).update(post_count=F("post_count") + len(created))
+            cache.invalidate_users([user.id])
+            counters.increment(counters.POSTS, len(created))
+            cache.bump_versions([cache.POSTS_VERSION, cache.user_version(user.id)])
+            search.changed([post.id for post in created])
+            jobs.enqueue("posts_created", {"post_ids": [post.id for post in created]})
+    for (i, post), saved in zip(posts, created):
+        data = serialize_new_post(saved, user)
+        events.post_created(data)
+        results[i] = {"status": "created", "post": data}
+    return results
+
+
+# Likes the posts with the "post_id" of each of "items" for "user" in one transaction
+# and returns a result per item: "created", "exists" if it was already liked,
+# "not_found" or "invalid". The likes are inserted with one bulk insert and every
+# liked post gets its like with one UPDATE, whatever write-behind mode likes.py is in.
+def like_posts(user, items):
+    results, first = first_items([item_id(item, "post_id") for item in items], "post_id must be an integer.")
+    with transaction.atomic():
+        found = set(Posts.objects.filter(id__in=list(first)).values_list("id", flat=True))
+        created = insert_new(Likes, {"user_id": user.id}, "post_id", found)
+        if created:
+            Posts.objects.filter(id__in=created).update(likeNumber=F("likeNumber") + 1, score=rescored(likes=1))
+            authors = Posts.objects.filter(id__in=created).values_list("user_id", flat=True).distinct()
+            cache.bump_versions([cache.POSTS_VERSION, *map(cache.user_version, authors)])
+            # Published by the request, like likes.like_count_changed()
+            liked = list(Posts.objects.filter(id__in=created).only("id", "user", "likeNumber"))
+            apply_pending_likes(liked)
+            for post in liked:
+                events.like_count_changed(post)
+    for post_id, i in first.items():
+        if post_id not in found:
+            results[i] = {"status": "not_found"}
+        else:
+            results[i] = {"status": "created" if post_id in created else "exists"}
+    return results
+
+
+# Follows the users with the "user_id" of each of "items" for "follower" in one
+# transaction and returns a result per item like like_posts(). The follows are
+# inserted with one bulk insert, the counters updated with one UPDATE per side and the follower's home
+# timeline backfilled from all the followed users by one job.
+def follow_users(follower, items):
+    results, first = first_items([item_id(item, "user_id") for item in items], "user_id must be an integer.")
+    if follower.id in first:
+        results[first.pop(follower.id)] = invalid("Users can not follow themselves.")
+    with transaction.atomic():
+        found = set(User.objects.filter(id__in=list(first)).values_list("id", flat=True))
+        created = insert_new(Followers, {"follower_id": follower.id}, "user_id", found)
+        if created:
+            User.objects.filter(pk=follower.id).update(following_count=F("following_count") + len(created))
+            User.objects.filter(id__in=created).update(follower_count=F("follower_count") + 1)
+            cache.invalidate_users([follower.id, *created])
+            cache.bump_versions(list(map(cache.user_version, [follower.id, *created])))
+            # The rows are inserted without post_save, so the graph index is told here
+            graph.changed("add", [(follower.id, user_id) for user_id in sorted(created)])
+            jobs.enqueue("backfill_timeline", {"follower_id": follower.id, "user_ids": sorted(created)})
+    for user_id, i in first.items():
+        if user_id not in found:
+            results[i] = {"status": "not_found"}
+        else:
+            results[i] = {"status": "created" if user_id in created else "exists"}
+    return results
@@ -0,0 +1,187 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .images import variant_url
+from .models import User, Posts
+
+
+# Bump these when the shape of a cached card changes
+POST_CARD_VERSION = 1
+USER_CARD_VERSION = 2
+
+# Name of the version of every list of posts; each user also has user_version(id)
+POSTS_VERSION = "posts"
+
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def get_cache():
+    return caches[getattr(settings, "NETWORK_CACHE_ALIAS", "default")]
+
+
+def timeout():
+    return getattr(settings, "NETWORK_CACHE_TIMEOUT", 3600)
+
+
+def post_key(post_id):
+    return f"network:post:{post_id}:v{POST_CARD_VERSION}"
+
+
+def user_key(user_id):
+    return f"network:user:{user_id}:v{USER_CARD_VERSION}"
+
+
+def version_key(name):
+    return f"network:version:{name}"
+
+
+def user_version(user_id):
+    return f"user:{user_id}"
+
+
+def record(hits, misses):
+    with _stats_lock:
+        _stats["hits"] += hits
+        _stats["misses"] += misses
+
+
+# Hit and miss counts of this process since it started
+def stats():
+    with _stats_lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            "hits": _stats["hits"],
+            "misses": _stats["misses"],
+            "hit_rate": _stats["hits"] / lookups if lookups else None,
+        }
+
+
+# Reads the cards of "ids" with one multi-get and loads the missing ones with "load"
+def get_cards(ids, key, load):
+    keys = {key(obj_id): obj_id for obj_id in set(ids)}
+    cache = get_cache()
+    cards = {keys[k]: card for k, card in cache.get_many(list(keys)).items()}
+    missing = [obj_id for obj_id in keys.values() if obj_id not in cards]
+    record(len(cards), len(missing))
+    if missing:
+        loaded = load(missing)
+        cache.set_many({key(obj_id): card for obj_id, card in loaded.items()}, timeout())
+        cards.update(loaded)
+    return cards
+
+
+# The viewer-independent part of a post. likeNumber is left out because it changes
+# too often; it is read from the post row instead.
+def load_post_cards(post_ids):
+    return {
+        post["id"]: {
+            "id": post["id"],
+            "text": post["text"],
+            "timestamp": post["timestamp"],
+            "userId": post["user_id"],
+        }
+        for post in Posts.objects.filter(id__in=post_ids).values("id", "text", "timestamp", "user_id")
+    }
+
+
+# The public profile of a user, as shown in profile headers and next to their posts
+def load_user_cards(user_ids):
+    cards = {}
+    for user in User.objects.filter(id__in=user_ids):
+        cards[user.id] = {
+            "id": user.id,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "username": user.username,
+            "bio": user.bio,
+            "date_joined": user.date_joined,
+            "postCount": user.post_count,
+            "followerCount": user.follower_count,
+            "followingCount": user.following_count,
+            "profile_image": variant_url(user, "profile_image", "profile"),
+            "avatar": variant_url(user, "profile_image", "avatar"),
+            "profile_banner": variant_url(user, "profile_banner", "banner"),
+        }
+    return cards
+
+
+def post_cards(post_ids):
+    return get_cards(post_ids, post_key, load_post_cards)
+
+
+def user_cards(user_ids):
+    return get_cards(user_ids, user_key, load_user_cards)
+
+
+def user_card(user_id):
+    return user_cards([user_id]).get(user_id)
+
+
+# Cards are dropped once the transaction that changed them commits, so a concurrent
+# reader cannot put the old version back in the cache
+def invalidate_posts(post_ids):
+    transaction.on_commit(lambda: get_cache().delete_many([post_key(post_id) for post_id in post_ids]))
+
+
+def invalidate_users(user_ids):
+    transaction.on_commit(lambda: get_cache().delete_many([user_key(user_id) for user_id in user_ids]))
+
+
+# Versions tag the content behind conditional GETs. A version is the time of the
+# last change in nanoseconds; one that is missing from the cache starts again from
+# the current time, so it never repeats a value a client may hold.
+def get_versions(names):
+    cache = get_cache()
+    keys = {version_key(name): name for name in names}
+    versions = {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+    for key, name in keys.items():
+        if name not in versions:
+            cache.add(key, time.time_ns(), None)
+            # Another process may have added the key first
+            versions[name] = cache.get(key) or time.time_ns()
+    return versions
+
+
+def bump_versions(names):
+    transaction.on_commit(
+        lambda: get_cache().set_many({version_key(name): time.time_ns() for name in names}, None)
+    )
+
+
+def change_key(name, version):
+    return f"network:changes:{name}:{version}"
+
+
+# Logged versions count the changes made to an in-memory index, so that the other
+# processes replay them rather than rebuilding. A count missing from the cache starts
+# again from the current time in nanoseconds, far ahead of any version it had reached.
+def logged_version(name):
+    key = version_key(name)
+    get_cache().add(key, time.time_ns(), None)
+    return get_cache().get(key) or 0
+
+
+# Increments the logged version "name" and stores "change" under the new version,
+# which it returns. Without a change nothing is stored, so that every index is rebuilt.
+def log_change(name, change=None):
+    key = version_key(name)
+    get_cache().add(key, time.time_ns(), None)
+    version = get_cache().incr(key)
+    if change is not None:
+        get_cache().set(change_key(name, version), change, timeout())
+    return version
+
+
+# The changes logged after version "since" up to "until", oldest first, or None if
+# some of them are no longer in the cache
+def logged_changes(name, since, until):
+    keys = [change_key(name, version) for version in range(since + 1, until + 1)]
+    changes = get_cache().get_many(keys)
+    if len(changes) < len(keys):
+        return None
+    return [changes[key] for key in keys]
@@ -0,0 +1,99 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from . import cache, events
+from .models import Posts, Comments
+from .ranking import rescored
+
+
+# Columns of Comments needed to serialize one; the authors come from the cache
+COMMENT_FIELDS = ("id", "post", "user", "text", "timestamp")
+
+
+# Number of the newest comments shown under each post on timelines
+def preview_size():
+    return getattr(settings, "COMMENT_PREVIEW_SIZE", 3)
+
+
+def add_to_comment_count(post, delta):
+    Posts.objects.filter(pk=post.id).update(comment_count=F("comment_count") + delta, score=rescored(comments=delta))
+    cache.bump_versions([cache.POSTS_VERSION, cache.user_version(post.user_id)])
+
+
+# Saves a comment of "user" on "post" and bumps its comment_count in the same
+# transaction, then tells live clients the new count
+def add_comment(user, post, text):
+    with transaction.atomic():
+        comment = Comments.objects.create(user=user, post=post, text=text)
+        add_to_comment_count(post, 1)
+        post.refresh_from_db(fields=["comment_count"])
+        events.comment_count_changed(post)
+    return comment
+
+
+# Deletes "comment" and decrements the comment_count of its post in the same
+# transaction. Returns False if a concurrent request deleted it first.
+def delete_comment(comment):
+    post = comment.post
+    with transaction.atomic():
+        deleted, _ = Comments.objects.filter(pk=comment.id).delete()
+        if not deleted:
+            return False
+        add_to_comment_count(post, -1)
+        post.refresh_from_db(fields=["comment_count"])
+        events.comment_count_changed(post)
+    return True
+
+
+def serialize_comment(comment, author_card):
+    return {
+        "id": comment.id,
+        "postId": comment.post_id,
+        "userId": comment.user_id,
+        "name": author_card["first_name"]+" "+author_card["last_name"],
+        "username": author_card["username"],
+        "profile_image": author_card["avatar"],
+        "text": comment.text,
+        "timestamp": comment.timestamp,
+    }
+
+
+def assemble_comments(comments, author_cards):
+    return [
+        serialize_comment(comment, author_cards[comment.user_id])
+        for comment in comments
+        if comment.user_id in author_cards
+    ]
+
+
+# Serializes a page of comments with their authors read from the cache in one multi-get
+def serialize_comments(comments):
+    comments = list(comments)
+    return assemble_comments(comments, cache.user_cards([comment.user_id for comment in comments]))
+
+
+# The newest preview_size() comments of each of "posts" by post id, newest first.
+# The whole page is read with one query that numbers the comments of each post over
+# comments_post_timestamp_id_idx; posts without comments are left out of it.
+def latest_comments(posts):
+    post_ids = [post.id for post in posts if post.comment_count > 0]
+    size = preview_size()
+    if not post_ids or size <= 0:
+        return {}
+    comments = (Comments.objects
+        .filter(post_id__in=post_ids)
+        .annotate(position=Window(
+            RowNumber(),
+            partition_by=[F("post")],
+            order_by=[F("timestamp").desc(), F("id").desc()],
+        ))
+        .filter(position__lte=size)
+        .only(*COMMENT_FIELDS)
+        .order_by())
+    latest = {}
+    # Sorted here rather than by the database, which would sort the numbered rows again
+    for comment in sorted(comments, key=lambda comment: comment.position):
+        latest.setdefault(comment.post_id, []).append(comment)
+    return latest
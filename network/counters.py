@@ -0,0 +1,83 @@
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from . import cache, ranking
+from .models import User, Posts, Likes, Comments, Followers, Counters, LikeCounterShards
+
+
+POSTS = "posts"
+
+
+# Atomically adds "delta" to the site-wide counter "name"
+def increment(name, delta=1):
+    if not Counters.objects.filter(name=name).update(value=F("value") + delta):
+        Counters.objects.get_or_create(name=name)
+        Counters.objects.filter(name=name).update(value=F("value") + delta)
+
+
+def get(name):
+    return Counters.objects.filter(name=name).values_list("value", flat=True).first() or 0
+
+
+def post_created(user):
+    User.objects.filter(pk=user.id).update(post_count=F("post_count") + 1)
+    cache.invalidate_users([user.id])
+    increment(POSTS)
+
+
+def post_deleted(user):
+    User.objects.filter(pk=user.id).update(post_count=F("post_count") - 1)
+    cache.invalidate_users([user.id])
+    increment(POSTS, -1)
+
+
+def followed(follower, user):
+    User.objects.filter(pk=follower.id).update(following_count=F("following_count") + 1)
+    User.objects.filter(pk=user.id).update(follower_count=F("follower_count") + 1)
+    cache.invalidate_users([follower.id, user.id])
+    cache.bump_versions([cache.user_version(follower.id), cache.user_version(user.id)])
+
+
+def unfollowed(follower, user):
+    User.objects.filter(pk=follower.id).update(following_count=F("following_count") - 1)
+    User.objects.filter(pk=user.id).update(follower_count=F("follower_count") - 1)
+    cache.invalidate_users([follower.id, user.id])
+    cache.bump_versions([cache.user_version(follower.id), cache.user_version(user.id)])
+
+
+# Subquery counting the rows of "model" whose "field" points at the outer row
+def count_of(model, field):
+    counts = model.objects.filter(**{field: OuterRef("pk")}).order_by().values(field).annotate(n=Count("pk")).values("n")
+    return Coalesce(Subquery(counts), Value(0))
+
+
+# Recomputes every counter, including Posts.likeNumber and comment_count, from the
+# posts, likes, comments and follow tables
+def rebuild_counters():
+    User.objects.update(
+        post_count=count_of(Posts, "user"),
+        follower_count=count_of(Followers, "user"),
+        following_count=count_of(Followers, "follower"),
+    )
+    user_ids = list(User.objects.values_list("id", flat=True))
+    cache.invalidate_users(user_ids)
+    cache.bump_versions([cache.POSTS_VERSION, *map(cache.user_version, user_ids)])
+    with transaction.atomic():
+        # The recount already includes the likes still waiting in the write-behind shards
+        Posts.objects.update(likeNumber=count_of(Likes, "post"), comment_count=count_of(Comments, "post"))
+        LikeCounterShards.objects.all().delete()
+        rescore_posts()
+    Counters.objects.update_or_create(name=POSTS, defaults={"value": Posts.objects.count()})
+
+
+# Recomputes the top feed score of every post from its likes, comments and creation time
+def rescore_posts(batch_size=1000):
+    batch = []
+    for post in Posts.objects.only("id", "likeNumber", "comment_count", "timestamp").iterator(chunk_size=batch_size):
+        post.score = ranking.score(post.likeNumber, post.timestamp, post.comment_count)
+        batch.append(post)
+        if len(batch) == batch_size:
+            Posts.objects.bulk_update(batch, ["score"])
+            batch = []
+    Posts.objects.bulk_update(batch, ["score"])
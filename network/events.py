@@ -0,0 +1,163 @@
+import asyncio
+import itertools
+import json
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+# Every event is published to the channel of the post's author and to ALL
+ALL = "all"
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def author_channel(user_id):
+    return f"author:{user_id}"
+
+
+# A subscriber's undelivered events. Events with the same key replace each other,
+# so a burst of likes on one post costs one slot. When a slow consumer falls
+# "size" events behind its queue is dropped and it gets a single reset event
+# telling the client to reload instead.
+class Subscription:
+    def __init__(self, channels, size):
+        self.channels = channels
+        self.size = size
+        self.loop = asyncio.get_running_loop()
+        self.pending = OrderedDict()
+        self.ready = asyncio.Event()
+        self.overflowed = False
+        self.sequence = itertools.count()
+
+    # Runs on the subscriber's event loop
+    def put(self, event):
+        key = event.get("key") or next(self.sequence)
+        if key in self.pending:
+            self.pending[key] = event
+        elif len(self.pending) >= self.size:
+            self.pending.clear()
+            self.overflowed = True
+        else:
+            self.pending[key] = event
+        self.ready.set()
+
+    async def get(self):
+        await self.ready.wait()
+        if self.overflowed:
+            self.overflowed = False
+            # Events put after the overflow are still waiting to be read
+            if not self.pending:
+                self.ready.clear()
+            return {"type": "reset", "data": {}}
+        key, event = self.pending.popitem(last=False)
+        if not self.pending:
+            self.ready.clear()
+        return event
+
+
+# Delivers events to the subscribers of this process. A broker that connects several
+# processes subclasses it, sends events to its server in publish() and calls
+# deliver() with the events it receives.
+class LocalBroker:
+    def __init__(self):
+        self.subscribers = {}
+        self.lock = threading.Lock()
+
+    def publish(self, channels, event):
+        self.deliver(channels, event)
+
+    def deliver(self, channels, event):
+        with self.lock:
+            subscriptions = {
+                subscription
+                for channel in channels
+                for subscription in self.subscribers.get(channel, ())
+            }
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                # The subscriber's event loop has been closed
+                self.unsubscribe(subscription)
+
+    def subscribe(self, channels):
+        subscription = Subscription(channels, getattr(settings, "EVENT_QUEUE_SIZE", 100))
+        with self.lock:
+            for channel in channels:
+                self.subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            for channel in subscription.channels:
+                subscribers = self.subscribers.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self.subscribers[channel]
+
+
+def get_broker():
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = import_string(getattr(settings, "EVENT_BROKER", "network.events.LocalBroker"))()
+        return _broker
+
+
+# Publishes an event about a post of "author_id" once the current transaction commits.
+# Events with a "key" may be coalesced with earlier undelivered events of the same key.
+def publish(author_id, event_type, data, key=None):
+    event = {"type": event_type, "data": data}
+    if key is not None:
+        event["key"] = key
+    transaction.on_commit(lambda: get_broker().publish([author_channel(author_id), ALL], event))
+
+
+def post_created(post_data):
+    publish(post_data["userId"], "post", post_data)
+
+
+def post_edited(post):
+    publish(post.user_id, "edit", {"id": post.id, "text": post.text})
+
+
+def post_deleted(post):
+    publish(post.user_id, "delete", {"id": post.id})
+
+
+def like_count_changed(post):
+    publish(post.user_id, "like", {"id": post.id, "likeNumber": post.likeNumber}, key=f"like:{post.id}")
+
+
+def comment_count_changed(post):
+    publish(post.user_id, "comment", {"id": post.id, "commentCount": post.comment_count}, key=f"comment:{post.id}")
+
+
+# Formats an event as a Server-Sent Events message
+def encode(event):
+    return f"event: {event['type']}\ndata: {json.dumps(event['data'], cls=DjangoJSONEncoder)}\n\n"
+
+
+# Yields the events of "channels" as Server-Sent Events until the client goes away,
+# with a comment line every EVENT_KEEPALIVE seconds to keep proxies from closing
+# an idle connection
+async def stream(channels):
+    broker = get_broker()
+    subscription = broker.subscribe(channels)
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), getattr(settings, "EVENT_KEEPALIVE", 15))
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+            else:
+                yield encode(event)
+    finally:
+        broker.unsubscribe(subscription)
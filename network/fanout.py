@@ -0,0 +1,157 @@
+import asyncio
+
+from django.conf import settings
+from django.db.models import Sum
+
+from . import graph, jobs
+from .models import User, Posts, Followers, TimelineEntries
+from .pagination import apaginate, merge_pages
+from .timeline import POST_FIELDS
+
+
+# Authors with more followers than this are not fanned out on write; their posts
+# are merged into their followers' home timelines when the timeline is read.
+CELEBRITY_THRESHOLD = getattr(settings, "HOME_TIMELINE_CELEBRITY_THRESHOLD", 10000)
+
+# How many of an author's latest posts are copied into a timeline on follow or rebuild
+BACKFILL = getattr(settings, "HOME_TIMELINE_BACKFILL", 800)
+
+BATCH_SIZE = 1000
+
+
+def is_celebrity(user):
+    return user.follower_count > CELEBRITY_THRESHOLD
+
+
+# Ids of the accounts followed by "user" whose posts are fanned out on read
+def followed_celebrity_ids(user):
+    return list(followed_celebrities(user))
+
+
+async def afollowed_celebrity_ids(user):
+    index = graph.get_index()
+    if index is not None:
+        return [
+            user_id for user_id in index.followee_ids(user.id)
+            if index.follower_count(user_id) > CELEBRITY_THRESHOLD
+        ]
+    return [user_id async for user_id in followed_celebrities(user)]
+
+
+def followed_celebrities(user):
+    return (User.objects.filter(followers__follower=user, follower_count__gt=CELEBRITY_THRESHOLD)
+        .values_list("id", flat=True))
+
+
+def add_entries(posts_by_owner):
+    TimelineEntries.objects.bulk_create(
+        [
+            TimelineEntries(owner_id=owner_id, post_id=post.id, timestamp=post.timestamp)
+            for owner_id, posts in posts_by_owner
+            for post in posts
+        ],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+# Pushes a new post into its author's and their followers' home timelines
+def fan_out_post(post):
+    fan_out_posts(post.user, [post])
+
+
+# Pushes new posts of "user" into their and their followers' home timelines
+def fan_out_posts(user, posts):
+    owners = [user.id]
+    if not is_celebrity(user):
+        owners += Followers.objects.filter(user_id=user.id).values_list("follower_id", flat=True)
+    add_entries((owner_id, posts) for owner_id in owners)
+
+
+# Copies the latest posts of "user" into the home timeline of their new follower
+def backfill_timeline(follower, user):
+    if is_celebrity(user):
+        return
+    posts = Posts.objects.filter(user=user).order_by("-timestamp", "-id")[:BACKFILL]
+    add_entries([(follower.id, posts)])
+
+
+# Copies the latest posts of the users of "user_ids", BACKFILL of them in all, into the
+# home timeline of their new follower with one query
+def backfill_timeline_from(follower, user_ids):
+    authors = User.objects.filter(id__in=user_ids, follower_count__lte=CELEBRITY_THRESHOLD).values("id")
+    posts = Posts.objects.filter(user_id__in=authors).order_by("-timestamp", "-id")[:BACKFILL]
+    add_entries([(follower.id, posts)])
+
+
+# Copies the latest posts of "user" into the home timelines of all their followers,
+# for an author whose posts were merged on read and no longer are. Followers are
+# taken in chunks so that each bulk insert holds about BATCH_SIZE entries.
+def backfill_followers(user):
+    posts = list(Posts.objects.filter(user=user).order_by("-timestamp", "-id")[:BACKFILL])
+    if not posts:
+        return
+    follower_ids = list(Followers.objects.filter(user=user).values_list("follower_id", flat=True))
+    chunk = max(1, BATCH_SIZE // len(posts))
+    for i in range(0, len(follower_ids), chunk):
+        add_entries((owner_id, posts) for owner_id in follower_ids[i:i + chunk])
+
+
+# Called in the transaction of an unfollow of "user". When it takes them back down
+# to CELEBRITY_THRESHOLD followers their posts, which were not fanned out while they
+# were above it, are copied into their followers' home timelines by a job. Entries
+# fanned out before an author crossed the threshold upwards are kept; reads merge
+# them with the author's posts without duplicates.
+def follower_removed(user):
+    follower_count = User.objects.filter(pk=user.id).values_list("follower_count", flat=True).first()
+    if follower_count == CELEBRITY_THRESHOLD:
+        jobs.enqueue("celebrity_demoted", {"user_id": user.id}, key=f"celebrity_demoted:{user.id}")
+
+
+# Removes the posts of "user" from the home timeline of a former follower
+def remove_from_timeline(follower, user):
+    TimelineEntries.objects.filter(owner=follower, post__user=user).delete()
+
+
+# Rebuilds the home timeline of "user" from the posts of the accounts they follow
+def rebuild_timeline(user):
+    TimelineEntries.objects.filter(owner=user).delete()
+    authors = [user.id]
+    authors += Followers.objects.filter(follower=user).exclude(
+        user_id__in=followed_celebrity_ids(user)
+    ).values_list("user_id", flat=True)
+    posts = Posts.objects.filter(user_id__in=authors).order_by("-timestamp", "-id")[:BACKFILL]
+    add_entries([(user.id, posts)])
+
+
+# Returns a page of the home timeline of "user", the cursor for the next page and
+# the number of posts in the timeline. Fanned out posts are read with one range scan
+# over the user's timeline entries and merged with the posts of the celebrities the
+# user follows. Reads that do not depend on each other are awaited together.
+async def ahome_timeline(user, request):
+    entries = TimelineEntries.objects.filter(owner=user)
+    posts = entries.select_related("post").only("timestamp", *(f"post__{field}" for field in POST_FIELDS))
+    (page, next_cursor), celebrity_ids = await asyncio.gather(
+        apaginate(posts, request, id_field="post_id"),
+        afollowed_celebrity_ids(user),
+    )
+    results = [([entry.post for entry in page], next_cursor)]
+
+    if not celebrity_ids:
+        post_count = await entries.acount()
+    else:
+        # The posts of celebrities are counted from their post_count, and their
+        # entries fanned out before they became celebrities are left out of the
+        # count of the entries, so that no post is counted twice
+        posts = Posts.objects.filter(user_id__in=celebrity_ids).only(*POST_FIELDS)
+        result, post_count, celebrity_count = await asyncio.gather(
+            apaginate(posts, request),
+            entries.exclude(post__user_id__in=celebrity_ids).acount(),
+            User.objects.filter(id__in=celebrity_ids).aaggregate(total=Sum("post_count")),
+        )
+        results.append(result)
+        post_count += celebrity_count["total"] or 0
+
+    page, next_cursor = merge_pages(results, request)
+    return page, next_cursor, post_count
+
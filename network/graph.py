@@ -0,0 +1,284 @@
+import heapq
+import logging
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count
+
+from . import cache
+from .models import Followers
+
+
+logger = logging.getLogger(__name__)
+
+# Logged version of the follow graph in the cache, incremented by every committed
+# batch of follows and unfollows, which are logged under it (see cache.log_change)
+GRAPH_VERSION = "graph"
+
+BATCH_SIZE = 10000
+
+# Largest number of versions an index catches up with by replaying the change log;
+# an index further behind is rebuilt
+MAX_REPLAY = 1000
+
+_index = None
+_index_lock = threading.Lock()
+_building = False
+# Follows and unfollows made in this process while the index is being rebuilt
+_replay = None
+_checked_at = 0
+
+
+# The follow graph held in memory as two sorted arrays of user ids per user, one of
+# the accounts they follow and one of their followers, at 8 bytes per id. Lookups
+# are binary searches; writes take a lock and readers never block.
+class GraphIndex:
+    def __init__(self, version=None):
+        self.following = {}
+        self.followers = {}
+        self.version = version
+        self.lock = threading.Lock()
+
+    # Reads every follow from the database in one pass over the follower index
+    @classmethod
+    def build(cls, version=None):
+        index = cls(version)
+        rows = Followers.objects.order_by("follower_id", "user_id").values_list("follower_id", "user_id")
+        for follower_id, user_id in rows.iterator(chunk_size=BATCH_SIZE):
+            index.following.setdefault(follower_id, array("q")).append(user_id)
+            index.followers.setdefault(user_id, array("q")).append(follower_id)
+        # Followers arrive ordered by follower, so each list is already sorted
+        return index
+
+    # Marks the index as up to date with "version" if it was with the one before it
+    def advance(self, version):
+        with self.lock:
+            if self.version == version - 1:
+                self.version = version
+
+    def add(self, follower_id, user_id):
+        with self.lock:
+            if not self.is_following(follower_id, user_id):
+                insort(self.following.setdefault(follower_id, array("q")), user_id)
+                insort(self.followers.setdefault(user_id, array("q")), follower_id)
+
+    def remove(self, follower_id, user_id):
+        with self.lock:
+            if self.is_following(follower_id, user_id):
+                discard(self.following, follower_id, user_id)
+                discard(self.followers, user_id, follower_id)
+
+    def is_following(self, follower_id, user_id):
+        ids = self.following.get(follower_id)
+        if not ids:
+            return False
+        i = bisect_left(ids, user_id)
+        return i < len(ids) and ids[i] == user_id
+
+    def followee_ids(self, user_id):
+        return list(self.following.get(user_id, ()))
+
+    def follower_ids(self, user_id):
+        return list(self.followers.get(user_id, ()))
+
+    def follower_count(self, user_id):
+        return len(self.followers.get(user_id, ()))
+
+    # Accounts followed by the accounts "user_id" follows, with how many of those
+    # follow each of them, most shared first
+    def suggestions(self, user_id, limit):
+        followees = self.following.get(user_id, ())
+        counts = Counter()
+        for followee_id in followees:
+            counts.update(self.following.get(followee_id, ()))
+        for excluded_id in (user_id, *followees):
+            counts.pop(excluded_id, None)
+        return heapq.nsmallest(limit, counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def stats(self):
+        edges = sum(len(ids) for ids in self.following.values())
+        size = sum(
+            sys.getsizeof(ids) for adjacency in (self.following, self.followers) for ids in adjacency.values()
+        ) + sys.getsizeof(self.following) + sys.getsizeof(self.followers)
+        return {"users": len(self.following.keys() | self.followers.keys()), "follows": edges, "bytes": size}
+
+
+def discard(adjacency, key, value):
+    ids = adjacency[key]
+    del ids[bisect_left(ids, value)]
+    if not ids:
+        del adjacency[key]
+
+
+def enabled():
+    return getattr(settings, "GRAPH_INDEX", False)
+
+
+# The current version of the follow graph
+def current_version():
+    return cache.logged_version(GRAPH_VERSION)
+
+
+# Records that the follows ("add") or unfollows ("remove") of the (follower id, user
+# id) pairs of "pairs" were made in the current transaction. Once it commits they get
+# a new version, are logged under it and applied to the index of this process.
+def changed(change, pairs):
+    pairs = [list(pair) for pair in pairs]
+    transaction.on_commit(lambda: commit(change, pairs))
+
+
+# Records that the follow graph was changed without going through changed(), such as
+# by bulk inserts: the version is bumped with no log entry, so every index is rebuilt
+def reset():
+    transaction.on_commit(lambda: cache.log_change(GRAPH_VERSION))
+
+
+def commit(change, pairs):
+    version = cache.log_change(GRAPH_VERSION, pairs)
+    with _index_lock:
+        if _replay is not None:
+            _replay.extend((change, follower_id, user_id) for follower_id, user_id in pairs)
+        index = _index
+    if index is not None:
+        for follower_id, user_id in pairs:
+            getattr(index, change)(follower_id, user_id)
+        index.advance(version)
+
+
+# Brings "index" up to "version" by replaying the changes logged after its own
+# version. The follows touched by them are read again from the database, as the
+# changes of different processes may be logged out of the order they committed in.
+# Returns False if the log does not go back far enough.
+def catch_up(index, version):
+    versions = range(index.version + 1, version + 1)
+    if len(versions) > MAX_REPLAY:
+        return False
+    entries = cache.logged_changes(GRAPH_VERSION, index.version, version)
+    if entries is None:
+        return False
+    pairs = {tuple(pair) for entry in entries for pair in entry}
+    rows = Followers.objects.filter(
+        follower_id__in={follower_id for follower_id, user_id in pairs},
+        user_id__in={user_id for follower_id, user_id in pairs},
+    ).values_list("follower_id", "user_id")
+    followed = pairs.intersection(rows.iterator(chunk_size=BATCH_SIZE))
+    for follower_id, user_id in pairs:
+        if (follower_id, user_id) in followed:
+            index.add(follower_id, user_id)
+        else:
+            index.remove(follower_id, user_id)
+    with index.lock:
+        index.version = max(index.version, version)
+    return True
+
+
+# Builds a new index and swaps it in, replaying the follows and unfollows this
+# process made during the build, which may be missing from what it read
+def rebuild():
+    global _index, _replay, _checked_at
+    with _index_lock:
+        _replay = []
+    version = current_version()
+    index = GraphIndex.build(version)
+    with _index_lock:
+        for change, follower_id, user_id in _replay:
+            getattr(index, change)(follower_id, user_id)
+        _index, _replay, _checked_at = index, None, time.monotonic()
+    return index
+
+
+# Brings the index of this process up to "version", from the change log when it
+# can and with a rebuild otherwise
+def refresh(index, version):
+    global _building
+    try:
+        if index is None or version < index.version or not catch_up(index, version):
+            rebuild()
+    except Exception:
+        logger.exception("Could not refresh the follow graph index")
+    finally:
+        _building = False
+        connection.close()
+
+
+# Returns the index of this process, or None while it is disabled or not yet built.
+# The index is built in a background thread the first time it is asked for. At most
+# every GRAPH_INDEX_REFRESH seconds it is checked against the version of the graph,
+# and brought up to date in the background when other processes have changed it.
+# The previous index keeps serving meanwhile.
+def get_index():
+    global _building, _checked_at
+    if not enabled():
+        return None
+    index = _index
+    now = time.monotonic()
+    if index is not None and now - _checked_at < getattr(settings, "GRAPH_INDEX_REFRESH", 60):
+        return index
+    with _index_lock:
+        if _building:
+            return index
+        _checked_at = now
+        version = current_version()
+        if index is not None and version == index.version:
+            return index
+        _building = True
+    threading.Thread(target=refresh, args=(index, version), name="graph-index", daemon=True).start()
+    return index
+
+
+def is_following(follower_id, user_id):
+    index = get_index()
+    if index is not None:
+        return index.is_following(follower_id, user_id)
+    return Followers.objects.filter(follower_id=follower_id, user_id=user_id).exists()
+
+
+# Ids of the users in "user_ids" that "follower_id" follows
+def followed_ids(follower_id, user_ids):
+    index = get_index()
+    if index is not None:
+        return {user_id for user_id in user_ids if index.is_following(follower_id, user_id)}
+    return set(
+        Followers.objects.filter(follower_id=follower_id, user_id__in=user_ids).values_list("user_id", flat=True)
+    )
+
+
+def followee_ids(user_id):
+    index = get_index()
+    if index is not None:
+        return index.followee_ids(user_id)
+    return list(Followers.objects.filter(follower_id=user_id).values_list("user_id", flat=True))
+
+
+async def afollowee_ids(user_id):
+    index = get_index()
+    if index is not None:
+        return index.followee_ids(user_id)
+    return [
+        followee_id async for followee_id in
+        Followers.objects.filter(follower_id=user_id).values_list("user_id", flat=True)
+    ]
+
+
+# Who "user_id" might follow: the accounts followed by the most of the accounts they
+# follow, as (user id, how many of those follow them) pairs
+def suggestions(user_id, limit):
+    index = get_index()
+    if index is not None:
+        return index.suggestions(user_id, limit)
+    followees = Followers.objects.filter(follower_id=user_id).values("user_id")
+    return list(
+        Followers.objects.filter(follower_id__in=followees)
+        .exclude(user_id__in=followees)
+        .exclude(user_id=user_id)
+        .values("user_id")
+        .annotate(mutual=Count("id"))
+        .order_by("-mutual", "user_id")
+        .values_list("user_id", "mutual")[:limit]
+    )
@@ -0,0 +1,161 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .models import User
+
+
+logger = logging.getLogger(__name__)
+
+# Fixed-size variants of each uploaded image, as (width, height) cropped to fill
+SIZES = {
+    "profile_image": {"profile": (400, 400), "avatar": (48, 48)},
+    "profile_banner": {"banner": (1500, 500), "banner_small": (600, 200)},
+}
+
+# Every variant is written in each of these formats; IMAGE_FORMAT picks the one served
+FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 85, "optimize": True, "progressive": True}),
+}
+
+# Formats accepted for uploads
+UPLOAD_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "IMAGE_PROCESSING_WORKERS", 2), thread_name_prefix="images"
+            )
+        return _executor
+
+
+def max_pixels():
+    return getattr(settings, "IMAGE_MAX_PIXELS", 40_000_000)
+
+
+# Checks an uploaded image from its header alone, before anything is decoded, and
+# returns the reason it is refused or None
+def check_upload(upload):
+    try:
+        with Image.open(upload) as image:
+            format, (width, height) = image.format, image.size
+    except (UnidentifiedImageError, Image.DecompressionBombError):
+        return "Unsupported media type"
+    finally:
+        upload.seek(0)
+    if format not in UPLOAD_FORMATS:
+        return "Unsupported media type"
+    if width * height > max_pixels():
+        return "Image dimensions are too large"
+    return None
+
+
+# URL of the "size" variant of the image in "field" of "user". Falls back to the
+# uploaded image until its variants have been written.
+def variant_url(user, field, size):
+    image = getattr(user, field)
+    if not image:
+        return None
+    variants = user.image_variants.get(field, {})
+    if variants.get("source") != image.name or size not in variants:
+        return image.url
+    return image.storage.url(variants[size][getattr(settings, "IMAGE_FORMAT", "webp")])
+
+
+# Decodes an image once and returns the encoded bytes of each of its variants
+def render_variants(file, sizes):
+    with Image.open(file) as image:
+        # Uploads are checked when they arrive; this guards images stored before that
+        if image.width * image.height > max_pixels():
+            raise ValueError(f"Image of {image.width}x{image.height} pixels is too large to resize.")
+        # Lets JPEG decoding scale down by itself to just above the largest variant
+        largest = max(max(dimensions) for dimensions in sizes.values())
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, "white")
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+
+        rendered = {}
+        for size, dimensions in sizes.items():
+            variant = ImageOps.fit(image, dimensions, Image.LANCZOS)
+            for format, (pil_format, options) in FORMATS.items():
+                buffer = BytesIO()
+                variant.save(buffer, pil_format, **options)
+                rendered[size, format] = buffer.getvalue()
+        return rendered
+
+
+# Writes the variants of the image in "field" of the user and records them on the
+# user, unless the image was replaced in the meantime
+def process_image(user_id, field):
+    user = User.objects.filter(pk=user_id).first()
+    if user is None or not getattr(user, field):
+        return
+    image = getattr(user, field)
+    with image.open("rb") as file:
+        rendered = render_variants(file, SIZES[field])
+
+    directory, filename = os.path.split(image.name)
+    stem = os.path.splitext(filename)[0]
+    variants = {"source": image.name}
+    for (size, format), content in rendered.items():
+        name = os.path.join(directory, "variants", f"{stem}_{size}.{'jpg' if format == 'jpeg' else format}")
+        variants.setdefault(size, {})[format] = image.storage.save(name, ContentFile(content))
+
+    with transaction.atomic():
+        user = User.objects.select_for_update().get(pk=user_id)
+        current = getattr(user, field).name == image.name
+        if current:
+            replaced = user.image_variants.get(field)
+            user.image_variants[field] = variants
+            user.save(update_fields=["image_variants"])
+    # Either the variants of the previous image or, if this one was replaced, its own
+    unused = replaced if current else variants
+    if unused:
+        delete_variants(image.storage, unused)
+
+
+def delete_variants(storage, variants):
+    for size, names in variants.items():
+        if size != "source":
+            for name in names.values():
+                storage.delete(name)
+
+
+def run(user_id, field):
+    try:
+        process_image(user_id, field)
+    except Exception:
+        logger.exception("Could not process the %s of user %s", field, user_id)
+    finally:
+        connection.close()
+
+
+# Processes the uploaded images in "fields" of "user" in the thread pool once the
+# upload is committed, so the request does not wait for the encoding. With
+# IMAGE_PROCESSING_WORKERS set to 0 they are processed right away instead.
+def schedule(user, fields):
+    for field in fields:
+        if getattr(settings, "IMAGE_PROCESSING_WORKERS", 2) == 0:
+            transaction.on_commit(lambda field=field: process_image(user.id, field))
+        else:
+            transaction.on_commit(lambda field=field: get_executor().submit(run, user.id, field))
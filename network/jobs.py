@@ -0,0 +1,189 @@
+import logging
+import os
+import socket
+import threading
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, close_old_connections, connection, transaction
+from django.db.models import Count, F, Min
+from django.utils import timezone
+
+from .models import Jobs
+
+
+logger = logging.getLogger(__name__)
+
+_handlers = {}
+
+
+# With JOB_QUEUE on, the side effects of writes are queued as Jobs rows in the
+# transaction of the write and run by "manage.py runworker"; with it off they run
+# in the request as before.
+def enabled():
+    return getattr(settings, "JOB_QUEUE", False)
+
+
+def max_attempts():
+    return getattr(settings, "JOB_MAX_ATTEMPTS", 5)
+
+
+def retry_delay():
+    return getattr(settings, "JOB_RETRY_DELAY", 10)
+
+
+# Running jobs whose worker has not finished them after this many seconds are
+# assumed to have died with it and are queued again
+def timeout():
+    return getattr(settings, "JOB_TIMEOUT", 300)
+
+
+# Registers the decorated function as the handler of the jobs named "name". It is
+# called with the payload of the job as keyword arguments, in a transaction that
+# also deletes the job, so the effects of a job that succeeds are committed once.
+def handler(name):
+    def decorator(func):
+        _handlers[name] = func
+        return func
+    return decorator
+
+
+# Queues the job "name" with "payload", a dict of JSON values, in the current
+# transaction, or runs it right away with JOB_QUEUE off. A job with a "key" is
+# skipped while a job with the same key is waiting to run.
+def enqueue(name, payload, key=None):
+    if not enabled():
+        _handlers[name](**payload)
+        return
+    try:
+        with transaction.atomic():
+            Jobs.objects.create(name=name, payload=payload, key=key)
+    except IntegrityError:
+        pass
+
+
+# Marks up to "limit" due jobs as run by "worker" and returns them. On PostgreSQL
+# they are picked with SELECT ... FOR UPDATE SKIP LOCKED so concurrent workers skip
+# each other's rows without waiting. Elsewhere a job goes to the worker whose
+# UPDATE moves it out of "queued" first; each UPDATE commits on its own, as SQLite
+# cannot turn the read lock of a transaction into a write lock while others read.
+def claim(worker, limit=1):
+    now = timezone.now()
+    due = Jobs.objects.filter(status=Jobs.QUEUED, run_at__lte=now).order_by("run_at", "id")
+    claimed = {"status": Jobs.RUNNING, "locked_at": now, "locked_by": worker, "attempts": F("attempts") + 1}
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            ids = list(due.select_for_update(skip_locked=True).values_list("id", flat=True)[:limit])
+            Jobs.objects.filter(id__in=ids).update(**claimed)
+    else:
+        ids = [
+            job_id for job_id in due.values_list("id", flat=True)[:limit]
+            if Jobs.objects.filter(id=job_id, status=Jobs.QUEUED).update(**claimed)
+        ]
+    return list(Jobs.objects.filter(id__in=ids).order_by("run_at", "id"))
+
+
+# Runs a claimed job and returns whether it succeeded. A job that fails is queued
+# again after JOB_RETRY_DELAY seconds, doubled at each attempt, and kept as
+# "failed" after JOB_MAX_ATTEMPTS attempts.
+def run(job):
+    try:
+        with transaction.atomic():
+            if job.name not in _handlers:
+                raise LookupError(f"No handler is registered for {job.name!r} jobs.")
+            _handlers[job.name](**job.payload)
+            job.delete()
+    except Exception:
+        logger.exception("Job %s %s failed on attempt %d", job.id, job.name, job.attempts)
+        failed(job, traceback.format_exc())
+        return False
+    return True
+
+
+def failed(job, error):
+    job.last_error = error
+    if job.attempts >= max_attempts():
+        job.status = Jobs.FAILED
+    else:
+        job.status = Jobs.QUEUED
+        job.run_at = timezone.now() + timedelta(seconds=retry_delay() * 2 ** (job.attempts - 1))
+    try:
+        with transaction.atomic():
+            job.save(update_fields=["status", "run_at", "last_error"])
+    except IntegrityError:
+        # A job with the same key was queued meanwhile and will do the work
+        job.delete()
+
+
+# Queues again the running jobs of workers that stopped without finishing them and
+# returns how many were
+def requeue_stale():
+    cutoff = timezone.now() - timedelta(seconds=timeout())
+    requeued = 0
+    for job in Jobs.objects.filter(status=Jobs.RUNNING, locked_at__lt=cutoff).only("id"):
+        try:
+            with transaction.atomic():
+                requeued += Jobs.objects.filter(id=job.id, status=Jobs.RUNNING).update(status=Jobs.QUEUED, locked_by="")
+        except IntegrityError:
+            # A job with the same key was queued meanwhile and will do the work
+            job.delete()
+    return requeued
+
+
+# Number of jobs per status and how long the oldest due job has been waiting
+def stats():
+    counts = dict(Jobs.objects.order_by().values_list("status").annotate(count=Count("id")))
+    oldest = Jobs.objects.filter(status=Jobs.QUEUED, run_at__lte=timezone.now()).aggregate(oldest=Min("run_at"))["oldest"]
+    return {
+        "queued": counts.get(Jobs.QUEUED, 0),
+        "running": counts.get(Jobs.RUNNING, 0),
+        "failed": counts.get(Jobs.FAILED, 0),
+        "oldest_queued_seconds": (timezone.now() - oldest).total_seconds() if oldest else None,
+    }
+
+
+def worker_name(thread):
+    return f"{socket.gethostname()}:{os.getpid()}:{thread}"
+
+
+# Runs the due jobs one at a time in this thread until none is left, or "stop" is
+# set, and returns how many were run
+def drain(worker, stop=None):
+    ran = 0
+    while stop is None or not stop.is_set():
+        jobs = claim(worker)
+        if not jobs and not requeue_stale():
+            return ran
+        for job in jobs:
+            run(job)
+            ran += 1
+    return ran
+
+
+# Drains the queue every "poll" seconds until "stop" is set, in a thread of its own
+def work(worker, stop, poll):
+    try:
+        while not stop.is_set():
+            close_old_connections()
+            try:
+                ran = drain(worker, stop)
+            except DatabaseError:
+                logger.exception("Job worker %s could not read the queue", worker)
+                ran = 0
+            if not ran:
+                stop.wait(poll)
+    finally:
+        connection.close()
+
+
+# Runs jobs in "threads" threads of this process until "stop" is set
+def run_worker(threads, stop, poll):
+    pool = [
+        threading.Thread(target=work, args=(worker_name(n), stop, poll), name=f"job-worker-{n}")
+        for n in range(threads)
+    ]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
@@ -0,0 +1,112 @@
+import random
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+
+from . import cache, events
+from .ranking import rescored
+from .models import Posts, Likes, LikeCounterShards
+
+
+FLUSH_BATCH_SIZE = 1000
+
+
+# With LIKE_COUNTER_WRITE_BEHIND on, likes add to a LikeCounterShards row instead of
+# updating Posts.likeNumber, and flush_like_counters() moves the deltas over later.
+def write_behind_enabled():
+    return getattr(settings, "LIKE_COUNTER_WRITE_BEHIND", False)
+
+
+def add_to_like_number(post, delta):
+    cache.bump_versions([cache.POSTS_VERSION, cache.user_version(post.user_id)])
+    if not write_behind_enabled():
+        Posts.objects.filter(pk=post.id).update(likeNumber=F("likeNumber") + delta, score=rescored(likes=delta))
+        return
+
+    shard = random.randrange(getattr(settings, "LIKE_COUNTER_SHARDS", 16))
+    shards = LikeCounterShards.objects.filter(post=post, shard=shard)
+    if shards.update(delta=F("delta") + delta):
+        return
+    try:
+        with transaction.atomic():
+            LikeCounterShards.objects.create(post=post, shard=shard, delta=delta)
+    except IntegrityError:
+        shards.update(delta=F("delta") + delta)
+
+
+# Tells live clients the new like count of "post" once the transaction of the like
+# commits. It is published by the request rather than a job, as the broker of a
+# worker process may not reach the clients subscribed to this one.
+def like_count_changed(post):
+    post.refresh_from_db(fields=["likeNumber"])
+    apply_pending_likes([post])
+    events.like_count_changed(post)
+
+
+# Records that "user" likes "post" and bumps its counter in the same transaction.
+# Returns False if the post was already liked; the unique constraint on Likes makes
+# this safe against concurrent requests.
+def like_post(user, post):
+    try:
+        with transaction.atomic():
+            Likes.objects.create(user=user, post=post)
+            add_to_like_number(post, 1)
+            like_count_changed(post)
+    except IntegrityError:
+        return False
+    return True
+
+
+# Removes the like of "user" on "post" and decrements its counter in the same transaction.
+# Returns False if the post was not liked.
+def unlike_post(user, post):
+    with transaction.atomic():
+        deleted, _ = Likes.objects.filter(user=user, post=post).delete()
+        if not deleted:
+            return False
+        add_to_like_number(post, -1)
+        like_count_changed(post)
+    return True
+
+
+# Adds the unflushed like deltas to the likeNumber of the given posts with one query
+def apply_pending_likes(posts):
+    if not write_behind_enabled() or not posts:
+        return
+    pending = dict(
+        LikeCounterShards.objects.filter(post__in=posts)
+        .values("post")
+        .annotate(total=Sum("delta"))
+        .values_list("post", "total")
+    )
+    for post in posts:
+        post.likeNumber += pending.get(post.id, 0)
+
+
+# Moves the unflushed like deltas into Posts.likeNumber and returns the number of
+# shards flushed. Shards that are being written to are skipped until the next flush.
+def flush_like_counters(batch_size=FLUSH_BATCH_SIZE):
+    flushed = 0
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            shards = list(
+                LikeCounterShards.objects.select_for_update(skip_locked=True)
+                .filter(id__gt=last_id)
+                .exclude(delta=0)
+                .order_by("id")[:batch_size]
+            )
+            if not shards:
+                return flushed
+
+            totals = defaultdict(int)
+            for shard in shards:
+                totals[shard.post_id] += shard.delta
+                LikeCounterShards.objects.filter(pk=shard.pk).update(delta=F("delta") - shard.delta)
+            for post_id, total in totals.items():
+                Posts.objects.filter(pk=post_id).update(likeNumber=F("likeNumber") + total, score=rescored(likes=total))
+
+        last_id = shards[-1].id
+        flushed += len(shards)
@@ -0,0 +1,176 @@
+import json
+import subprocess
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from network.models import User, Posts, Likes
+
+
+ENDPOINTS = ("home_info", "user_info", "all_posts", "search_posts", "manage_likes", "create_post")
+
+
+# Nearest-rank percentile of a sorted list
+def percentile(values, fraction):
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=settings.BASE_DIR
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = ("Drives the main endpoints through the test client against the current database and "
+            "reports latency percentiles, queries per request and peak memory. Writes made by "
+            "the benchmark are rolled back. Seed a database first with seed_network.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Measured requests per endpoint.")
+        parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per endpoint.")
+        parser.add_argument("--memory-requests", type=int, default=5,
+                            help="Requests per endpoint traced for peak memory.")
+        parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=ENDPOINTS)
+        parser.add_argument("--user", help="Username of the viewer; defaults to the user following the most accounts.")
+        parser.add_argument("--output", help="Writes the results as JSON to this file.")
+        parser.add_argument("--compare", help="A JSON file written by an earlier run to compare against.")
+
+    def handle(self, *args, **options):
+        viewer = self.pick_viewer(options["user"])
+        profile = User.objects.order_by("-follower_count", "id").first()
+        runs = options["warmup"] + options["requests"] + options["memory_requests"]
+
+        client = Client()
+        client.force_login(viewer)
+        unliked = iter(
+            Posts.objects.exclude(id__in=Likes.objects.filter(user=viewer).values("post_id"))
+            .order_by("-id").values_list("id", flat=True)[:runs]
+        )
+        requests = {
+            "home_info": lambda: client.get(reverse("home_info")),
+            "user_info": lambda: client.get(reverse("user_info", args=[profile.id])),
+            "all_posts": lambda: client.get(reverse("all_posts")),
+            # Two of the words seed_network writes posts with
+            "search_posts": lambda: client.get(reverse("search_posts"), {"q": "python timeline"}),
+            "manage_likes": lambda: client.post(
+                reverse("manage_likes"), {"post_id": next(unliked)}, content_type="application/json"
+            ),
+            "create_post": lambda: client.post(
+                reverse("create_post"), {"text": "benchmark"}, content_type="application/json"
+            ),
+        }
+        if "manage_likes" in options["endpoints"] and Posts.objects.count() - Likes.objects.filter(user=viewer).count() < runs:
+            raise CommandError(f"manage_likes needs {runs} posts not yet liked by {viewer.username}.")
+
+        results = {}
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            with transaction.atomic():
+                for name in options["endpoints"]:
+                    results[name] = self.measure(requests[name], options)
+                    self.report(name, results[name])
+                transaction.set_rollback(True)
+
+        output = {
+            "commit": current_commit(),
+            "timestamp": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "viewer": viewer.username,
+            "requests": options["requests"],
+            "data": {
+                "users": User.objects.count(),
+                "posts": Posts.objects.count(),
+                "likes": Likes.objects.count(),
+            },
+            "results": results,
+        }
+        if options["compare"]:
+            with open(options["compare"]) as f:
+                self.compare(json.load(f), output)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(output, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+    def pick_viewer(self, username):
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f"User {username} does not exist.")
+        viewer = User.objects.annotate(follows=Count("following")).order_by("-follows", "id").first()
+        if viewer is None:
+            raise CommandError("The database has no users; run seed_network first.")
+        return viewer
+
+    def send(self, request):
+        response = request()
+        if response.status_code >= 400:
+            raise CommandError(f"{response.request['PATH_INFO']} returned {response.status_code}.")
+        # Streamed bodies are only produced when they are read
+        response.getvalue()
+
+    def measure(self, request, options):
+        for _ in range(options["warmup"]):
+            self.send(request)
+
+        latencies = []
+        queries = []
+        for _ in range(options["requests"]):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                self.send(request)
+                latencies.append((time.perf_counter() - start) * 1000)
+            queries.append(len(context.captured_queries))
+
+        # Tracing slows every allocation down, so memory is measured on separate requests
+        peaks = []
+        tracemalloc.start()
+        try:
+            for _ in range(options["memory_requests"]):
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                self.send(request)
+                peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        finally:
+            tracemalloc.stop()
+
+        latencies.sort()
+        return {
+            "p50_ms": round(percentile(latencies, 0.50), 3),
+            "p95_ms": round(percentile(latencies, 0.95), 3),
+            "p99_ms": round(percentile(latencies, 0.99), 3),
+            "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "queries": max(queries, default=None),
+            "peak_memory_kb": round(max(peaks) / 1024, 1) if peaks else None,
+        }
+
+    def report(self, name, result):
+        self.stdout.write(
+            f"{name:>14}: p50 {result['p50_ms']:.2f}ms  p95 {result['p95_ms']:.2f}ms  "
+            f"p99 {result['p99_ms']:.2f}ms  {result['queries']} queries  "
+            f"{result['peak_memory_kb']}KB peak"
+        )
+
+    def compare(self, baseline, output):
+        self.stdout.write(f"Compared with {baseline.get('commit') or 'baseline'}:")
+        for name, result in output["results"].items():
+            before = baseline.get("results", {}).get(name)
+            if not before:
+                continue
+            change = (result["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 if before["p95_ms"] else 0
+            self.stdout.write(
+                f"{name:>14}: p95 {before['p95_ms']:.2f}ms -> {result['p95_ms']:.2f}ms ({change:+.0f}%)  "
+                f"queries {before['queries']} -> {result['queries']}"
+            )
@@ -0,0 +1,154 @@
+import asyncio
+import io
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from network.models import User
+
+
+# Nearest-rank percentile of a sorted list
+def percentile(values, fraction):
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+class Command(BaseCommand):
+    help = ("Compares the concurrent throughput of the read endpoints in one process when they "
+            "are served through Django's WSGI handler from a thread pool and through its ASGI "
+            "handler on an event loop, as gunicorn threads and uvicorn would call them.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Requests per server interface.")
+        parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight at once.")
+        parser.add_argument("--output", help="Writes the results as JSON to this file.")
+
+    def handle(self, *args, **options):
+        viewer = User.objects.annotate(follows=Count("following")).order_by("-follows", "id").first()
+        profile = User.objects.order_by("-follower_count", "id").first()
+        if viewer is None:
+            raise CommandError("The database has no users; run seed_network first.")
+
+        client = Client()
+        client.force_login(viewer)
+        cookie = f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+        paths = [
+            reverse("home_info"),
+            reverse("user_info", args=[profile.id]),
+            reverse("all_posts"),
+            reverse("user_timeline", args=[profile.id]),
+            reverse("lookup_user_followers", args=[profile.id]),
+        ]
+        plan = [paths[i % len(paths)] for i in range(options["requests"])]
+
+        results = {}
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            results["wsgi"] = self.run_wsgi(plan, cookie, options["concurrency"])
+            results["asgi"] = asyncio.run(self.run_asgi(plan, cookie, options["concurrency"]))
+        for interface, result in results.items():
+            self.stdout.write(
+                f"{interface}: {result['requests_per_second']:.0f} requests/s  "
+                f"p50 {result['p50_ms']:.2f}ms  p95 {result['p95_ms']:.2f}ms"
+            )
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump({"concurrency": options["concurrency"], "results": results}, f, indent=2)
+
+    def summarize(self, latencies, elapsed):
+        latencies.sort()
+        return {
+            "requests_per_second": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 0.50), 3),
+            "p95_ms": round(percentile(latencies, 0.95), 3),
+        }
+
+    def run_wsgi(self, plan, cookie, concurrency):
+        application = get_wsgi_application()
+
+        def get(path):
+            environ = {
+                "REQUEST_METHOD": "GET",
+                "PATH_INFO": path,
+                "QUERY_STRING": "",
+                "SERVER_NAME": "testserver",
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": "testserver",
+                "HTTP_COOKIE": cookie,
+                "wsgi.version": (1, 0),
+                "wsgi.url_scheme": "http",
+                "wsgi.input": io.BytesIO(),
+                "wsgi.errors": sys.stderr,
+                "wsgi.multithread": True,
+                "wsgi.multiprocess": False,
+                "wsgi.run_once": False,
+            }
+            status = []
+            start = time.perf_counter()
+            response = application(environ, lambda s, headers: status.append(s))
+            try:
+                b"".join(response)
+            finally:
+                response.close()
+            if not status[0].startswith("200"):
+                raise CommandError(f"{path} returned {status[0]} through WSGI.")
+            return (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies = list(executor.map(get, plan))
+        return self.summarize(latencies, time.perf_counter() - start)
+
+    async def run_asgi(self, plan, cookie, concurrency):
+        application = get_asgi_application()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get(path):
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": path,
+                "raw_path": path.encode(),
+                "query_string": b"",
+                "root_path": "",
+                "headers": [(b"host", b"testserver"), (b"cookie", cookie.encode())],
+                "client": ("127.0.0.1", 0),
+                "server": ("testserver", 80),
+            }
+            received = asyncio.Event()
+            status = []
+
+            async def receive():
+                # The request has no body; after it the client just waits for the response
+                if received.is_set():
+                    await asyncio.Future()
+                received.set()
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    status.append(message["status"])
+
+            async with semaphore:
+                start = time.perf_counter()
+                await application(scope, receive, send)
+                elapsed = (time.perf_counter() - start) * 1000
+            if status[0] != 200:
+                raise CommandError(f"{path} returned {status[0]} through ASGI.")
+            return elapsed
+
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(get(path) for path in plan))
+        return self.summarize(list(latencies), time.perf_counter() - start)
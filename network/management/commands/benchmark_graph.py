@@ -0,0 +1,72 @@
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+
+from network import graph
+from network.graph import GraphIndex
+from network.models import User
+
+
+# Nearest-rank percentile of a sorted list
+def percentile(values, fraction):
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+class Command(BaseCommand):
+    help = ("Compares follow checks, followee lists and follow suggestions answered by the "
+            "in-memory follow graph index with the same lookups made through the ORM, on the "
+            "current database. Seed a database first with seed_network.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--samples", type=int, default=200, help="Lookups per operation and path.")
+        parser.add_argument("--seed", type=int, default=0, help="Seed for picking the sampled users.")
+        parser.add_argument("--output", help="Writes the results as JSON to this file.")
+
+    def handle(self, *args, **options):
+        user_ids = list(User.objects.values_list("id", flat=True))
+        if len(user_ids) < 2:
+            raise CommandError("The database has too few users; run seed_network first.")
+        rng = random.Random(options["seed"])
+        pairs = [tuple(rng.sample(user_ids, 2)) for _ in range(options["samples"])]
+
+        start = time.perf_counter()
+        index = GraphIndex.build()
+        build_seconds = time.perf_counter() - start
+        stats = index.stats()
+        self.stdout.write(
+            f"Built the index of {stats['follows']} follows in {build_seconds:.2f}s "
+            f"({stats['bytes'] / 1024 / 1024:.1f}MB)"
+        )
+
+        operations = {
+            "is_following": (lambda a, b: index.is_following(a, b), graph.is_following),
+            "followees": (lambda a, b: index.followee_ids(a), lambda a, b: graph.followee_ids(a)),
+            "suggestions": (lambda a, b: index.suggestions(a, 10), lambda a, b: graph.suggestions(a, 10)),
+        }
+        results = {}
+        # With the index disabled the lookups of the graph module go to the database
+        with override_settings(GRAPH_INDEX=False):
+            for name, (indexed, orm) in operations.items():
+                results[name] = {"index": self.measure(indexed, pairs), "orm": self.measure(orm, pairs)}
+                index_p50, orm_p50 = results[name]["index"]["p50_us"], results[name]["orm"]["p50_us"]
+                self.stdout.write(
+                    f"{name:>14}: index p50 {index_p50:.1f}us  orm p50 {orm_p50:.1f}us  "
+                    f"({orm_p50 / index_p50 if index_p50 else float('inf'):.0f}x)"
+                )
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump({"build_seconds": round(build_seconds, 3), "index": stats, "results": results}, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+    def measure(self, lookup, pairs):
+        latencies = []
+        for a, b in pairs:
+            start = time.perf_counter()
+            lookup(a, b)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+        latencies.sort()
+        return {"p50_us": round(percentile(latencies, 0.50), 1), "p95_us": round(percentile(latencies, 0.95), 1)}
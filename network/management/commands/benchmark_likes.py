@@ -0,0 +1,54 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+
+from network.likes import like_post, flush_like_counters
+from network.models import User, Posts
+
+
+class Command(BaseCommand):
+    help = ("Measures like throughput on a single hot post with and without the "
+            "write-behind like counter. Creates temporary users and removes them afterwards.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--likes", type=int, default=1000, help="Number of likes per run.")
+        parser.add_argument("--threads", type=int, default=16, help="Number of concurrent writers.")
+
+    def handle(self, *args, **options):
+        prefix = f"bench{uuid.uuid4().hex[:8]}"
+        User.objects.bulk_create([User(username=f"{prefix}_{i}") for i in range(options["likes"] + 1)])
+        users = list(User.objects.filter(username__startswith=prefix).order_by("id"))
+        author, likers = users[0], users[1:]
+        try:
+            for write_behind in (False, True):
+                with override_settings(LIKE_COUNTER_WRITE_BEHIND=write_behind):
+                    self.run(author, likers, options["threads"], write_behind)
+        finally:
+            User.objects.filter(username__startswith=prefix).delete()
+
+    def run(self, author, likers, threads, write_behind):
+        post = Posts.objects.create(user=author, text="benchmark")
+
+        def like(user):
+            try:
+                like_post(user, post)
+            finally:
+                connection.close()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(like, likers))
+        elapsed = time.perf_counter() - start
+        if write_behind:
+            flush_like_counters()
+
+        post.refresh_from_db()
+        mode = "write-behind" if write_behind else "direct"
+        self.stdout.write(
+            f"{mode:>12}: {len(likers)} likes in {elapsed:.2f}s "
+            f"({len(likers) / elapsed:.0f} likes/s), likeNumber={post.likeNumber}"
+        )
@@ -0,0 +1,59 @@
+import gzip
+import json
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from network import wire
+from network.models import Posts
+from network.pagination import MAX_PAGE_SIZE
+from network.timeline import POST_FIELDS, serialize_posts
+
+
+class Command(BaseCommand):
+    help = ("Compares the size and encoding time of a page of the all posts timeline in the "
+            "v1 format and in the compact v2 format with each available encoder and compression. "
+            "Seed a database first with seed_network.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=MAX_PAGE_SIZE, help="Posts in the page.")
+        parser.add_argument("--repeat", type=int, default=200, help="Encodings timed per format.")
+        parser.add_argument("--output", help="Writes the results as JSON to this file.")
+
+    def handle(self, *args, **options):
+        posts = list(Posts.objects.only(*POST_FIELDS).order_by("-timestamp", "-id")[:options["size"]])
+        if not posts:
+            raise CommandError("The database has no posts; run seed_network first.")
+        content = {"postCount": len(posts), "post": serialize_posts(posts, AnonymousUser()), "next_cursor": None}
+
+        formats = {
+            "v1 json": lambda: json.dumps(content, cls=DjangoJSONEncoder).encode(),
+            "v2 json": lambda: json.dumps(wire.to_v2(content, "post"), separators=(",", ":")).encode(),
+        }
+        if wire.orjson is not None:
+            formats["v2 orjson"] = lambda: wire.orjson.dumps(wire.to_v2(content, "post"))
+        if wire.msgpack is not None:
+            formats["v2 msgpack"] = lambda: wire.msgpack.packb(wire.to_v2(content, "post"))
+        formats["v1 json gzip"] = lambda: gzip.compress(formats["v1 json"](), 6)
+        formats["v2 json gzip"] = lambda: gzip.compress(formats["v2 json"](), 6)
+        if wire.brotli is not None:
+            formats["v2 json brotli"] = lambda: wire.brotli.compress(formats["v2 json"](), quality=4)
+
+        results = {}
+        for name, encode in formats.items():
+            size = len(encode())
+            start = time.perf_counter()
+            for _ in range(options["repeat"]):
+                encode()
+            results[name] = {
+                "bytes": size,
+                "encode_us": round((time.perf_counter() - start) / options["repeat"] * 1_000_000, 1),
+            }
+            self.stdout.write(f"{name:>15}: {size:>7} bytes  {results[name]['encode_us']:>8.1f}us")
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump({"posts": len(posts), "results": results}, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
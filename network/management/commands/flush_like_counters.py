@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from network.likes import flush_like_counters
+
+
+class Command(BaseCommand):
+    help = "Adds the buffered like deltas to Posts.likeNumber."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interval", type=float, default=0,
+                            help="Keep running and flush every INTERVAL seconds.")
+
+    def handle(self, *args, **options):
+        while True:
+            flushed = flush_like_counters()
+            self.stdout.write(f"Flushed {flushed} like counter shards.")
+            if not options["interval"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from network.images import SIZES, run
+from network.models import User
+
+
+class Command(BaseCommand):
+    help = ("Writes the resized variants of the profile images and banners that do not have "
+            "current ones, such as images uploaded before variants existed.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Rewrites the variants of every image.")
+
+    def handle(self, *args, **options):
+        jobs = []
+        for user in User.objects.only("id", "image_variants", *SIZES).iterator():
+            for field in SIZES:
+                image = getattr(user, field)
+                # Default images are shared by many users and are not resized
+                if not image or image.name == User._meta.get_field(field).default:
+                    continue
+                if options["all"] or user.image_variants.get(field, {}).get("source") != image.name:
+                    jobs.append((user.id, field))
+
+        with ThreadPoolExecutor(max_workers=max(1, getattr(settings, "IMAGE_PROCESSING_WORKERS", 2))) as executor:
+            list(executor.map(lambda job: run(*job), jobs))
+        self.stdout.write(self.style.SUCCESS(f"Processed {len(jobs)} images."))
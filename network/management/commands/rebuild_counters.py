@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from network.counters import rebuild_counters
+
+
+class Command(BaseCommand):
+    help = "Recomputes the post, follower, following and like counters from the database."
+
+    def handle(self, *args, **options):
+        rebuild_counters()
+        self.stdout.write(self.style.SUCCESS("Counters rebuilt."))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from network.tags import rebuild_tags
+
+
+class Command(BaseCommand):
+    help = ("Extracts the hashtags and mentions of every post again and recounts the trending "
+            "tag counts, e.g. for posts written before hashtags were extracted.")
+
+    def handle(self, *args, **options):
+        tags, mentions = rebuild_tags()
+        self.stdout.write(self.style.SUCCESS(f"Recorded {tags} hashtags and {mentions} mentions."))
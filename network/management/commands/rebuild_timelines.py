@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from network.fanout import rebuild_timeline
+from network.models import User
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the materialized home timelines from the posts and follow graph."
+
+    def add_arguments(self, parser):
+        parser.add_argument("usernames", nargs="*", help="Only rebuild these users' timelines.")
+
+    def handle(self, *args, **options):
+        users = User.objects.all()
+        if options["usernames"]:
+            users = users.filter(username__in=options["usernames"])
+
+        count = 0
+        for user in users.iterator():
+            rebuild_timeline(user)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} home timelines."))
@@ -0,0 +1,65 @@
+import multiprocessing
+import signal
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from network import jobs
+
+
+class Command(BaseCommand):
+    help = ("Runs the queued jobs, the side effects of writes made with JOB_QUEUE on, in a pool "
+            "of worker threads and processes until it is stopped with SIGTERM or Ctrl-C.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=getattr(settings, "JOB_WORKER_THREADS", 4),
+                            help="Worker threads per process.")
+        parser.add_argument("--processes", type=int, default=getattr(settings, "JOB_WORKER_PROCESSES", 1),
+                            help="Worker processes, each with its own threads.")
+        parser.add_argument("--poll", type=float, default=getattr(settings, "JOB_POLL_INTERVAL", 1),
+                            help="Seconds to wait before looking again when no job is due.")
+        parser.add_argument("--burst", action="store_true",
+                            help="Run the due jobs in this process and exit once none is left.")
+
+    def handle(self, *args, **options):
+        if options["burst"]:
+            ran = jobs.drain(jobs.worker_name(0))
+            self.stdout.write(f"Ran {ran} jobs. {self.depth()}")
+            return
+
+        self.stdout.write(
+            f"Running jobs in {options['processes']} processes of {options['threads']} threads. {self.depth()}"
+        )
+        # The workers are forked, whatever the default start method of the platform,
+        # so they inherit the loaded apps and settings; they must not share the
+        # connections of this process
+        connections.close_all()
+        fork = multiprocessing.get_context("fork")
+        workers = [
+            fork.Process(target=serve, args=(options["threads"], options["poll"]), name=f"job-worker-{n}")
+            for n in range(options["processes"] - 1)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            serve(options["threads"], options["poll"])
+        finally:
+            for worker in workers:
+                worker.terminate()
+                worker.join()
+        self.stdout.write(f"Stopped. {self.depth()}")
+
+    def depth(self):
+        stats = jobs.stats()
+        return f"{stats['queued']} queued, {stats['running']} running, {stats['failed']} failed."
+
+
+# Runs the worker threads of one process until it gets SIGTERM or SIGINT; the jobs
+# being run are finished first
+def serve(threads, poll):
+    stop = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda signum, frame: stop.set())
+    jobs.run_worker(threads, stop, poll)
@@ -0,0 +1,102 @@
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+
+from network import graph, search
+from network.counters import rebuild_counters
+from network.fanout import rebuild_timeline
+from network.models import User, Posts, Likes, Followers
+
+
+WORDS = (
+    "the quick brown fox jumps over lazy dog network post today just shipped new "
+    "release coffee morning weekend python django react timeline follow like reply"
+).split()
+
+
+class Command(BaseCommand):
+    help = ("Seeds the database with a synthetic social graph for load testing: users with a "
+            "power-law follower distribution, posts and likes, inserted in batches.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--posts", type=int, default=10000)
+        parser.add_argument("--likes", type=int, default=50000)
+        parser.add_argument("--follows", type=int, default=20, help="Average accounts followed per user.")
+        parser.add_argument("--alpha", type=float, default=1.2,
+                            help="Power-law exponent of account popularity; higher is more skewed.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--prefix", default="seed", help="Prefix of the generated usernames.")
+        parser.add_argument("--seed", type=int, default=None, help="Random seed, for repeatable data.")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        prefix = options["prefix"]
+
+        password = make_password(None)
+        self.insert(User, (
+            User(username=f"{prefix}{i}", first_name=prefix.capitalize(), last_name=str(i), password=password)
+            for i in range(options["users"])
+        ))
+        user_ids = list(User.objects.filter(username__startswith=prefix).values_list("id", flat=True))
+        if not user_ids:
+            self.stdout.write("No users to seed.")
+            return
+
+        # Account popularity follows a power law over a random ranking of the users
+        ranking = user_ids[:]
+        self.rng.shuffle(ranking)
+        popularity = [1 / (rank + 1) ** options["alpha"] for rank in range(len(ranking))]
+
+        self.insert(Followers, self.follows(user_ids, ranking, popularity, options["follows"]))
+        self.insert(Posts, (
+            Posts(user_id=self.rng.choice(user_ids), text=self.text()) for _ in range(options["posts"])
+        ))
+        post_ids = list(Posts.objects.filter(user_id__in=user_ids).values_list("id", flat=True))
+        if post_ids:
+            self.insert(Likes, (
+                Likes(user_id=self.rng.choice(user_ids), post_id=self.rng.choice(post_ids))
+                for _ in range(options["likes"])
+            ))
+
+        self.stdout.write("Rebuilding counters and home timelines...")
+        rebuild_counters()
+        # Bulk inserts send no signals, so the follow graph and search indexes are told to rebuild
+        graph.reset()
+        search.reset()
+        for user in User.objects.filter(id__in=user_ids).iterator():
+            rebuild_timeline(user)
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(user_ids)} users, {len(post_ids)} posts and their follows and likes."
+        ))
+
+    # Each user follows an exponentially distributed number of accounts picked by popularity
+    def follows(self, user_ids, ranking, popularity, average):
+        for user_id in user_ids:
+            count = min(len(user_ids) - 1, int(self.rng.expovariate(1 / average)) if average else 0)
+            followees = set()
+            while len(followees) < count:
+                followees.update(self.rng.choices(ranking, popularity, k=count - len(followees)))
+                followees.discard(user_id)
+            for followee in followees:
+                yield Followers(follower_id=user_id, user_id=followee)
+
+    def text(self):
+        return " ".join(self.rng.choices(WORDS, k=self.rng.randint(3, 30)))[:280]
+
+    # Inserts the generated rows in batches, skipping duplicates
+    def insert(self, model, rows):
+        batch = []
+        total = 0
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                model.objects.bulk_create(batch, ignore_conflicts=True)
+                total += len(batch)
+                batch = []
+        if batch:
+            model.objects.bulk_create(batch, ignore_conflicts=True)
+            total += len(batch)
+        self.stdout.write(f"Inserted {total} {model.__name__} rows.")
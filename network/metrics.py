@@ -0,0 +1,199 @@
+import functools
+import json
+import logging
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in milliseconds of the latency histogram buckets
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000)
+BUCKET_LABELS = [f"<={bound}ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+
+# Metrics of the request being handled. Context variables follow a request into the
+# threads of sync_to_async, so the queries of async views are counted too.
+_current = ContextVar("request_metrics", default=None)
+
+_samples = {}
+_samples_lock = threading.Lock()
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = []
+        self.timings = Counter()
+
+    def add_query(self, sql, seconds):
+        self.queries.append((sql, seconds))
+
+    def db_seconds(self):
+        return sum(seconds for sql, seconds in self.queries)
+
+    # Statements run at least REQUEST_METRICS_DUPLICATE_QUERIES times, the usual
+    # sign of a query made once per item of a list
+    def duplicate_queries(self):
+        threshold = getattr(settings, "REQUEST_METRICS_DUPLICATE_QUERIES", 5)
+        counts = Counter(sql for sql, seconds in self.queries)
+        return {sql: count for sql, count in counts.items() if count >= threshold}
+
+
+# Database execute wrapper timing every query made for the current request
+def record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.add_query(sql, time.perf_counter() - start)
+
+
+# Adds record_query to the connections of the current thread, which keep it across
+# reconnects. Async views query from the thread that sync_to_async runs the request's
+# database calls in, so they install it from there.
+def install():
+    for connection in connections.all():
+        if record_query not in connection.execute_wrappers:
+            connection.execute_wrappers.append(record_query)
+
+
+# Adds the time spent in the decorated function to the "name" timing of the request
+def timed(name):
+    def decorator(func):
+        if iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    add_time(name, time.perf_counter() - start)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    add_time(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def add_time(name, seconds):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.timings[name] += seconds
+
+
+def record_sample(view, sample):
+    with _samples_lock:
+        if view not in _samples:
+            _samples[view] = deque(maxlen=getattr(settings, "REQUEST_METRICS_WINDOW", 1000))
+        _samples[view].append(sample)
+
+
+# Nearest-rank percentile of a sorted list
+def percentile(values, fraction):
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+# Latency percentiles and histogram, query counts and database time of the last
+# REQUEST_METRICS_WINDOW requests of each view in this process
+def stats():
+    with _samples_lock:
+        samples = {view: list(view_samples) for view, view_samples in _samples.items()}
+    views = {}
+    for view, view_samples in samples.items():
+        latencies = sorted(sample["wall_ms"] for sample in view_samples)
+        histogram = Counter(
+            next((label for bound, label in zip(BUCKETS_MS, BUCKET_LABELS) if latency <= bound), BUCKET_LABELS[-1])
+            for latency in latencies
+        )
+        views[view] = {
+            "requests": len(view_samples),
+            "p50_ms": percentile(latencies, 0.50),
+            "p95_ms": percentile(latencies, 0.95),
+            "p99_ms": percentile(latencies, 0.99),
+            "histogram": {label: histogram[label] for label in BUCKET_LABELS},
+            "mean_queries": round(sum(sample["queries"] for sample in view_samples) / len(view_samples), 2),
+            "max_queries": max(sample["queries"] for sample in view_samples),
+            "mean_db_ms": round(sum(sample["db_ms"] for sample in view_samples) / len(view_samples), 3),
+        }
+    return {"views": views}
+
+
+# Measures the queries, database time, serialization time, response size and wall
+# time of every request. Each response gets a Server-Timing header, each request a
+# JSON log line on the "network.metrics" logger and a sample in the histogram of
+# its view, and requests that repeat a query are logged as warnings. Only installed
+# with REQUEST_METRICS on.
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_METRICS", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        install()
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        await sync_to_async(install)()
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        wall_ms = (time.perf_counter() - metrics.start) * 1000
+        db_ms = metrics.db_seconds() * 1000
+        serialize_ms = metrics.timings["serialize"] * 1000
+        view = request.resolver_match.view_name if request.resolver_match else "unresolved"
+        sample = {
+            "view": view,
+            "method": request.method,
+            "status": response.status_code,
+            "queries": len(metrics.queries),
+            "db_ms": round(db_ms, 3),
+            "serialize_ms": round(serialize_ms, 3),
+            "wall_ms": round(wall_ms, 3),
+            # Streamed bodies are produced after the view returns and are not measured
+            "bytes": None if response.streaming else len(response.content),
+        }
+        response["Server-Timing"] = (
+            f'db;dur={db_ms:.1f};desc="{len(metrics.queries)} queries", '
+            f"serialize;dur={serialize_ms:.1f}, total;dur={wall_ms:.1f}"
+        )
+        logger.info(json.dumps(sample))
+        for sql, count in metrics.duplicate_queries().items():
+            logger.warning("%s ran the same query %d times: %s", view, count, sql)
+        record_sample(view, sample)
+        return response
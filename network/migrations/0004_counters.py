@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:58
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_counters(apps, schema_editor):
+    User = apps.get_model("network", "User")
+    Posts = apps.get_model("network", "Posts")
+    Followers = apps.get_model("network", "Followers")
+    Counters = apps.get_model("network", "Counters")
+
+    def count_of(model, field):
+        counts = model.objects.filter(**{field: OuterRef("pk")}).order_by().values(field).annotate(n=Count("pk")).values("n")
+        return Coalesce(Subquery(counts), Value(0))
+
+    User.objects.update(
+        post_count=count_of(Posts, "user"),
+        follower_count=count_of(Followers, "user"),
+        following_count=count_of(Followers, "follower"),
+    )
+    Counters.objects.create(name="posts", value=Posts.objects.count())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('network', '0003_timelineentries'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Counters',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='follower_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='following_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='post_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
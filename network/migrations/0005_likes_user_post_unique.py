@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:59
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+# Keeps the oldest like of every (user, post) pair so the unique constraint can be added
+def remove_duplicate_likes(apps, schema_editor):
+    Likes = apps.get_model("network", "Likes")
+    duplicates = (Likes.objects.values("user", "post")
+        .annotate(first_id=Min("id"), n=Count("id"))
+        .filter(n__gt=1))
+    for duplicate in duplicates:
+        (Likes.objects.filter(user=duplicate["user"], post=duplicate["post"])
+            .exclude(id=duplicate["first_id"])
+            .delete())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('network', '0004_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_likes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='likes',
+            constraint=models.UniqueConstraint(fields=('user', 'post'), name='likes_user_post_unique'),
+        ),
+    ]
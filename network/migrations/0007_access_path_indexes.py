@@ -0,0 +1,79 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+# Keeps the first of any duplicate follows so the unique constraint can be added,
+# then recounts the follow counters that the duplicates inflated
+def remove_duplicate_follows(apps, schema_editor):
+    User = apps.get_model("network", "User")
+    Followers = apps.get_model("network", "Followers")
+    duplicates = (Followers.objects.values("follower", "user")
+        .annotate(first_id=Min("id"), n=Count("id"))
+        .filter(n__gt=1))
+    if not duplicates.exists():
+        return
+    for duplicate in duplicates:
+        (Followers.objects.filter(follower=duplicate["follower"], user=duplicate["user"])
+            .exclude(id=duplicate["first_id"])
+            .delete())
+
+    def count_of(field):
+        counts = Followers.objects.filter(**{field: OuterRef("pk")}).order_by().values(field).annotate(n=Count("pk")).values("n")
+        return Coalesce(Subquery(counts), Value(0))
+
+    User.objects.update(follower_count=count_of("user"), following_count=count_of("follower"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('network', '0006_likecountershards'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_follows, migrations.RunPython.noop),
+        # Build the composite indexes before dropping the single column ones they replace
+        migrations.AddIndex(
+            model_name='followers',
+            index=models.Index(fields=['user', 'follower'], name='followers_user_follower_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='followers',
+            constraint=models.UniqueConstraint(fields=('follower', 'user'), name='followers_follower_user_unique'),
+        ),
+        migrations.AlterField(
+            model_name='followers',
+            name='follower',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='following', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='followers',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='followers', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='likecountershards',
+            name='post',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='like_counter_shards', to='network.posts'),
+        ),
+        migrations.AlterField(
+            model_name='likes',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='posts',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='timelineentries',
+            name='owner',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='timeline', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
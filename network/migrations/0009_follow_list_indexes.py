@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('network', '0008_user_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='followers',
+            index=models.Index(fields=['user', '-timestamp', '-id'], name='followers_user_timestamp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='followers',
+            index=models.Index(fields=['follower', '-timestamp', '-id'], name='followers_follower_ts_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# The GIN index and the trigger that fills search_vector only exist on PostgreSQL;
+# other databases search posts with the in-memory index of search.py
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX posts_search_vector_idx ON network_posts USING gin (search_vector)"
+    )
+    schema_editor.execute(
+        "CREATE TRIGGER posts_search_vector_update BEFORE INSERT OR UPDATE OF text ON network_posts "
+        "FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger(search_vector, 'pg_catalog.english', text)"
+    )
+    schema_editor.execute("UPDATE network_posts SET search_vector = to_tsvector('pg_catalog.english', text)")
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP TRIGGER IF EXISTS posts_search_vector_update ON network_posts")
+    schema_editor.execute("DROP INDEX IF EXISTS posts_search_vector_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('network', '0009_follow_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='posts',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='posts',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='posts_search_vector_idx'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('network', '0010_posts_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TagCounts',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.CharField(max_length=64)),
+                ('bucket', models.DateTimeField()),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('bucket', 'tag'), name='tag_counts_bucket_tag_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Hashtags',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.CharField(max_length=64)),
+                ('timestamp', models.DateTimeField()),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='hashtags', to='network.posts')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['tag', '-timestamp', '-post'], name='hashtags_tag_timestamp_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'tag'), name='hashtags_post_tag_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Mentions',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timestamp', models.DateTimeField()),
+                ('post', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='mentions', to='network.posts')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='mentions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-timestamp', '-post'], name='mentions_user_timestamp_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'user'), name='mentions_post_user_unique')],
+            },
+        ),
+    ]
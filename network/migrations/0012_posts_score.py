@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:36
+
+import network.ranking
+from django.db import migrations, models
+
+
+# Scores the existing posts from their likes and creation time, see ranking.py
+def score_posts(apps, schema_editor):
+    Posts = apps.get_model("network", "Posts")
+    batch = []
+    for post in Posts.objects.only("id", "likeNumber", "timestamp").iterator(chunk_size=1000):
+        post.score = network.ranking.score(post.likeNumber, post.timestamp)
+        batch.append(post)
+        if len(batch) == 1000:
+            Posts.objects.bulk_update(batch, ["score"])
+            batch = []
+    Posts.objects.bulk_update(batch, ["score"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('network', '0011_hashtags_mentions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='posts',
+            name='score',
+            field=models.FloatField(default=network.ranking.initial_score),
+        ),
+        migrations.RunPython(score_posts, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(fields=['-score', '-id'], name='posts_score_id_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:39
+
+import django.db.models.deletion
+import network.ranking
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+
+
+# Counts the comments of the existing posts and rescores those that have any, see ranking.py
+def count_comments(apps, schema_editor):
+    Posts = apps.get_model("network", "Posts")
+    Comments = apps.get_model("network", "Comments")
+    counts = Comments.objects.filter(post=OuterRef("pk")).order_by().values("post").annotate(n=Count("pk")).values("n")
+    Posts.objects.filter(id__in=Comments.objects.values("post")).update(comment_count=Subquery(counts))
+    batch = []
+    for post in Posts.objects.filter(comment_count__gt=0).only("id", "likeNumber", "comment_count", "timestamp").iterator(chunk_size=1000):
+        post.score = network.ranking.score(post.likeNumber, post.timestamp, post.comment_count)
+        batch.append(post)
+        if len(batch) == 1000:
+            Posts.objects.bulk_update(batch, ["score"])
+            batch = []
+    Posts.objects.bulk_update(batch, ["score"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('network', '0012_posts_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='posts',
+            name='comment_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(count_comments, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='comments',
+            name='post',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='network.posts'),
+        ),
+        migrations.AddIndex(
+            model_name='comments',
+            index=models.Index(fields=['post', '-timestamp', '-id'], name='comments_post_timestamp_id_idx'),
+        ),
+    ]
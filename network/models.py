@@ -1,22 +1,60 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.utils import timezone
 from PIL import Image
 
+from .ranking import initial_score
+
 
 
 class User(AbstractUser):
     bio = models.CharField(max_length=160)
     profile_image = models.ImageField(default="default_profile_400x400.png", upload_to="profile_images")
     profile_banner = models.ImageField(default="", upload_to="profile_banners")
+    # Resized copies of the images above, written by images.py
+    image_variants = models.JSONField(default=dict, blank=True)
+    # Denormalized counters, kept in sync by counters.py
+    post_count = models.IntegerField(default=0)
+    follower_count = models.IntegerField(default=0)
+    following_count = models.IntegerField(default=0)
+
+
 
 
+# Site-wide counters such as the total number of posts, one row per name
+class Counters(models.Model):
+    name = models.CharField(max_length=64, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
 
 
 class Posts(models.Model):
-    user = models.ForeignKey("User", on_delete=models.CASCADE)
+    # Indexed by posts_user_timestamp_id_idx
+    user = models.ForeignKey("User", on_delete=models.CASCADE, db_index=False)
     text = models.CharField(max_length=280)
     timestamp = models.DateTimeField(auto_now_add=True)
     likeNumber = models.IntegerField(default=0)
+    # Denormalized number of comments, kept in sync by comments.py
+    comment_count = models.IntegerField(default=0)
+    # Rank in the top feed, updated with likeNumber and comment_count, see ranking.py
+    score = models.FloatField(default=initial_score)
+    # Kept current from "text" by a PostgreSQL trigger, see search.py; unused elsewhere
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination over (timestamp, id), see pagination.py
+            models.Index(fields=["-timestamp", "-id"], name="posts_timestamp_id_idx"),
+            models.Index(fields=["user", "-timestamp", "-id"], name="posts_user_timestamp_id_idx"),
+            # Keyset pagination of the top feed over (score, id)
+            models.Index(fields=["-score", "-id"], name="posts_score_id_idx"),
+            # Only created on PostgreSQL, see migration 0010
+            GinIndex(fields=["search_vector"], name="posts_search_vector_idx"),
+        ]
 
     def serialize(self):
         return {
@@ -34,15 +72,31 @@ class Posts(models.Model):
 
 class Comments(models.Model):
     user = models.ForeignKey("User", on_delete=models.CASCADE)
-    post = models.ForeignKey("Posts", on_delete=models.CASCADE)
+    # Indexed by comments_post_timestamp_id_idx
+    post = models.ForeignKey("Posts", on_delete=models.CASCADE, related_name="comments", db_index=False)
     text = models.CharField(max_length=280)
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination of the comments of a post, and their newest few per post
+            models.Index(fields=["post", "-timestamp", "-id"], name="comments_post_timestamp_id_idx"),
+        ]
+
+    def __str__(self):
+        return f"Comment {self.id} by {self.user_id} on post {self.post_id}"
+
 class Likes(models.Model):
-    user = models.ForeignKey("User", on_delete=models.CASCADE)
+    # Indexed by likes_user_post_unique
+    user = models.ForeignKey("User", on_delete=models.CASCADE, db_index=False)
     post = models.ForeignKey("Posts", on_delete=models.CASCADE)
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "post"], name="likes_user_post_unique"),
+        ]
+
     def serialize(self):
         return {
                 "name": self.user.first_name+" "+self.user.last_name,
@@ -55,12 +109,147 @@ class Likes(models.Model):
         return f"{self.id}, {self.user.username} liked {self.post.id}"
 
 
+# Unflushed like/unlike deltas for a post, spread over a few rows so that concurrent
+# likes on a hot post do not all wait on the same row lock. See likes.py.
+class LikeCounterShards(models.Model):
+    # Indexed by like_counter_post_shard_unique
+    post = models.ForeignKey("Posts", on_delete=models.CASCADE, related_name="like_counter_shards", db_index=False)
+    shard = models.PositiveSmallIntegerField()
+    delta = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["post", "shard"], name="like_counter_post_shard_unique"),
+        ]
+
+
+class TimelineEntries(models.Model):
+    # Indexed by timeline_owner_post_unique and timeline_owner_timestamp_idx
+    owner = models.ForeignKey("User", on_delete=models.CASCADE, related_name="timeline", db_index=False)
+    post = models.ForeignKey("Posts", on_delete=models.CASCADE, related_name="timeline_entries")
+    # Copy of post.timestamp so home feeds are read with one range scan on (owner, timestamp)
+    timestamp = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["owner", "post"], name="timeline_owner_post_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["owner", "-timestamp", "-post"], name="timeline_owner_timestamp_idx"),
+        ]
+
+    def __str__(self):
+        return f"Post {self.post_id} in {self.owner_id}'s home timeline"
+
+
+class Hashtags(models.Model):
+    # Indexed by hashtags_post_tag_unique and hashtags_tag_timestamp_idx
+    post = models.ForeignKey("Posts", on_delete=models.CASCADE, related_name="hashtags", db_index=False)
+    # Lowercased, without the "#"
+    tag = models.CharField(max_length=64)
+    # Copy of post.timestamp so tag timelines are read with one range scan on (tag, timestamp)
+    timestamp = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["post", "tag"], name="hashtags_post_tag_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["tag", "-timestamp", "-post"], name="hashtags_tag_timestamp_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.tag} in post {self.post_id}"
+
+
+class Mentions(models.Model):
+    # Indexed by mentions_post_user_unique and mentions_user_timestamp_idx
+    post = models.ForeignKey("Posts", on_delete=models.CASCADE, related_name="mentions", db_index=False)
+    user = models.ForeignKey("User", on_delete=models.CASCADE, related_name="mentions", db_index=False)
+    # Copy of post.timestamp so mention feeds are read with one range scan on (user, timestamp)
+    timestamp = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["post", "user"], name="mentions_post_user_unique"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "-timestamp", "-post"], name="mentions_user_timestamp_idx"),
+        ]
+
+    def __str__(self):
+        return f"User {self.user_id} mentioned in post {self.post_id}"
+
+
+# Number of posts written with a hashtag in each hour, kept current as posts are
+# written, edited and deleted
+class TagCounts(models.Model):
+    tag = models.CharField(max_length=64)
+    # Start of the hour
+    bucket = models.DateTimeField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # Also serves the range scans over recent buckets
+            models.UniqueConstraint(fields=["bucket", "tag"], name="tag_counts_bucket_tag_unique"),
+        ]
+
+    def __str__(self):
+        return f"#{self.tag} at {self.bucket}: {self.count}"
+
+
 class Followers(models.Model):
-    follower = models.ForeignKey("User", on_delete=models.CASCADE,related_name="following")
-    user = models.ForeignKey("User", on_delete=models.CASCADE, related_name="followers")
+    # Indexed by followers_follower_user_unique and the indexes below
+    follower = models.ForeignKey("User", on_delete=models.CASCADE,related_name="following", db_index=False)
+    user = models.ForeignKey("User", on_delete=models.CASCADE, related_name="followers", db_index=False)
     timestamp = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["follower", "user"], name="followers_follower_user_unique"),
+        ]
+        indexes = [
+            # Followers of a user, for fan-out and follow checks
+            models.Index(fields=["user", "follower"], name="followers_user_follower_idx"),
+            # Follower and following lists, newest first, with keyset pagination
+            models.Index(fields=["user", "-timestamp", "-id"], name="followers_user_timestamp_idx"),
+            models.Index(fields=["follower", "-timestamp", "-id"], name="followers_follower_ts_idx"),
+        ]
         
     def __str__(self):
         return f"{self.follower} is following {self.user}"
-    
 
+
+# Work left to a background worker after the request that caused it, see jobs.py.
+# Jobs are deleted once they have run; those that keep failing stay as "failed".
+class Jobs(models.Model):
+    QUEUED = "queued"
+    RUNNING = "running"
+    FAILED = "failed"
+
+    # Name of the handler registered with jobs.handler()
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    # Idempotency key: a job is not queued while another with the same key waits
+    key = models.CharField(max_length=200, null=True, blank=True)
+    status = models.CharField(max_length=16, default=QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Not run before this time, later than the creation time for retries
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True, default="")
+    last_error = models.TextField(blank=True, default="")
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["key"], condition=models.Q(status="queued"), name="jobs_queued_key_unique"),
+        ]
+        indexes = [
+            # Dequeuing the jobs that are due, oldest first, and finding stale running jobs
+            models.Index(fields=["status", "run_at", "id"], name="jobs_status_run_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"Job {self.id} {self.name} ({self.status})"
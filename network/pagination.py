@@ -0,0 +1,140 @@
+import base64
+import binascii
+from datetime import datetime
+
+
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+# Encodes the (timestamp, id) position of "obj" as an opaque cursor
+def encode_cursor(obj, id_field="id"):
+    raw = f"{obj.timestamp.isoformat()}|{getattr(obj, id_field)}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+# Decodes a cursor made by encode_cursor back into a (timestamp, id) pair
+def decode_cursor(cursor):
+    try:
+        timestamp, obj_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(obj_id)
+    except (ValueError, UnicodeError, binascii.Error):
+        raise InvalidCursor("Invalid cursor.")
+
+
+# Encodes the (score, id) position of an item of a ranked list as an opaque cursor.
+# Scores are floats, which repr() writes out exactly.
+def encode_rank_cursor(rank, obj_id):
+    return base64.urlsafe_b64encode(f"{rank!r}|{obj_id}".encode()).decode()
+
+
+def decode_rank_cursor(cursor):
+    try:
+        rank, obj_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return float(rank), int(obj_id)
+    except (ValueError, UnicodeError, binascii.Error):
+        raise InvalidCursor("Invalid cursor.")
+
+
+# Reads the page size from the "limit" query parameter
+def page_size(request, default=PAGE_SIZE):
+    try:
+        limit = int(request.GET.get("limit", default))
+    except ValueError:
+        raise InvalidCursor("Limit must be an integer.")
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+# Returns one page of "queryset", newest first, and the cursor for the next page.
+# The queryset must have a "timestamp" field and an "id_field" (the primary key by
+# default) that breaks ties between equal timestamps. With "before" the page holds
+# the items older than the cursor, with "after" the items newer than the cursor;
+# "next_cursor" continues in the same direction and is None once there is nothing left.
+# Both directions seek on the (timestamp, id) index, so every page costs the same.
+def paginate(queryset, request, default_size=PAGE_SIZE, id_field="id"):
+    queryset, size = seek(queryset, request, default_size, id_field)
+    return finish_page(list(queryset[:size + 1]), size, request, id_field)
+
+
+async def apaginate(queryset, request, default_size=PAGE_SIZE, id_field="id"):
+    queryset, size = seek(queryset, request, default_size, id_field)
+    return finish_page([obj async for obj in queryset[:size + 1]], size, request, id_field)
+
+
+# Returns one page of "queryset" by descending "rank_field", then id, and the cursor
+# for the next page, which seeks on a (rank_field, id) index like paginate(). Ranks
+# change, so a ranked list is only read forwards with "before".
+async def apaginate_ranked(queryset, request, rank_field, default_size=PAGE_SIZE):
+    size = page_size(request, default_size)
+    before = request.GET.get("before")
+    if before:
+        rank, obj_id = decode_rank_cursor(before)
+        queryset = (queryset
+            .filter(**{f"{rank_field}__lte": rank})
+            .exclude(**{rank_field: rank, "id__gte": obj_id}))
+    page = [obj async for obj in queryset.order_by(f"-{rank_field}", "-id")[:size + 1]]
+    has_more = len(page) > size
+    page = page[:size]
+    next_cursor = encode_rank_cursor(getattr(page[-1], rank_field), page[-1].id) if has_more else None
+    return page, next_cursor
+
+
+# Narrows "queryset" to the rows after the request's cursor, ordered so that the
+# page is its first "size" rows
+def seek(queryset, request, default_size, id_field):
+    size = page_size(request, default_size)
+    before = request.GET.get("before")
+    after = request.GET.get("after")
+
+    if after:
+        timestamp, obj_id = decode_cursor(after)
+        queryset = (queryset
+            .filter(timestamp__gte=timestamp)
+            .exclude(**{"timestamp": timestamp, f"{id_field}__lte": obj_id})
+            .order_by("timestamp", id_field))
+    else:
+        if before:
+            timestamp, obj_id = decode_cursor(before)
+            queryset = (queryset
+                .filter(timestamp__lte=timestamp)
+                .exclude(**{"timestamp": timestamp, f"{id_field}__gte": obj_id}))
+        queryset = queryset.order_by("-timestamp", f"-{id_field}")
+    return queryset, size
+
+
+# Turns the first "size" + 1 rows of a seek() queryset into a page and its next cursor
+def finish_page(page, size, request, id_field):
+    has_more = len(page) > size
+    page = page[:size]
+    if request.GET.get("after"):
+        page.reverse()
+        next_cursor = encode_cursor(page[0], id_field) if has_more else None
+    else:
+        next_cursor = encode_cursor(page[-1], id_field) if has_more else None
+    return page, next_cursor
+
+
+# Merges the pages that paginate() returned for the same request over several
+# querysets into a single page, dropping duplicates by id. Every source already
+# holds its best "size" items, so the merged page is exact.
+def merge_pages(results, request, default_size=PAGE_SIZE):
+    size = page_size(request, default_size)
+    has_more = any(next_cursor is not None for page, next_cursor in results)
+    items = {}
+    for page, next_cursor in results:
+        for obj in page:
+            items[obj.id] = obj
+    merged = sorted(items.values(), key=lambda obj: (obj.timestamp, obj.id), reverse=True)
+    has_more = has_more or len(merged) > size
+
+    if request.GET.get("after"):
+        merged = merged[-size:]
+        next_cursor = encode_cursor(merged[0]) if has_more and merged else None
+    else:
+        merged = merged[:size]
+        next_cursor = encode_cursor(merged[-1]) if has_more and merged else None
+    return merged, next_cursor
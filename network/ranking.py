@@ -0,0 +1,37 @@
+import math
+import time
+
+from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import Greatest, Log
+
+
+# Posts are ranked for the top feed by log10 of their engagement plus their age
+# measured in TOP_FEED_DECAY_SECONDS, the time after which a post needs ten times the
+# engagement to rank with a new one. Engagement is the likes plus the comments, each
+# worth TOP_FEED_COMMENT_WEIGHT likes. Time only enters through the creation time,
+# so a score changes when the post gets likes or comments and never needs
+# recomputing as it ages.
+def decay():
+    return getattr(settings, "TOP_FEED_DECAY_SECONDS", 45000)
+
+
+def comment_weight():
+    return getattr(settings, "TOP_FEED_COMMENT_WEIGHT", 2)
+
+
+def score(likes, timestamp, comments=0):
+    return math.log10(max(likes + comment_weight() * comments, 1)) + timestamp.timestamp() / decay()
+
+
+# Score of a post created now, before it has any likes
+def initial_score():
+    return time.time() / decay()
+
+
+# The score of a post once its likeNumber changes by "likes" and its comment_count
+# by "comments", as an expression to update it with in the same statement as them
+def rescored(likes=0, comments=0):
+    engagement = F("likeNumber") + comment_weight() * F("comment_count")
+    delta = likes + comment_weight() * comments
+    return F("score") - Log(10, Greatest(engagement, 1)) + Log(10, Greatest(engagement + delta, 1))
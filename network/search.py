@@ -0,0 +1,159 @@
+import math
+import re
+import threading
+from collections import Counter
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection, transaction
+from django.db.models import F, Q
+
+from . import cache
+from .models import Posts
+from .pagination import decode_rank_cursor, encode_rank_cursor, page_size
+from .timeline import POST_FIELDS
+
+
+# Text search configuration of the trigger that fills Posts.search_vector
+SEARCH_CONFIG = "english"
+
+# Logged version of the searchable text of the posts, incremented with the ids of
+# the posts written or deleted by each transaction (see cache.log_change)
+SEARCH_VERSION = "search"
+
+# Largest number of versions the index catches up with by reading the logged posts
+# again; an index further behind is rebuilt
+MAX_REPLAY = 1000
+
+WORD = re.compile(r"\w+")
+
+BATCH_SIZE = 2000
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def tokenize(text):
+    return WORD.findall(text.lower())
+
+
+# Returns one page of the posts matching "query", best match first, and the cursor
+# for the next page. Pages seek on (rank, id) after the "before" cursor. On
+# PostgreSQL the posts are matched through the GIN index on search_vector and
+# ranked with ts_rank; elsewhere they come from the in-memory InvertedIndex.
+def search_posts(query, request):
+    size = page_size(request)
+    before = request.GET.get("before")
+    after = decode_rank_cursor(before) if before else None
+    if connection.vendor == "postgresql":
+        page = database_search(query, after, size)
+    else:
+        page = indexed_search(query, after, size)
+    next_cursor = encode_rank_cursor(page[size - 1].rank, page[size - 1].id) if len(page) > size else None
+    return page[:size], next_cursor
+
+
+def database_search(query, after, size):
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    posts = (Posts.objects
+        .filter(search_vector=search_query)
+        .annotate(rank=SearchRank(F("search_vector"), search_query))
+        .only(*POST_FIELDS))
+    if after:
+        rank, post_id = after
+        posts = posts.filter(Q(rank__lt=rank) | Q(rank=rank, id__lt=post_id))
+    return list(posts.order_by("-rank", "-id")[:size + 1])
+
+
+def indexed_search(query, after, size):
+    results = get_index().search(tokenize(query))
+    if after:
+        results = [result for result in results if result < after]
+    results = results[:size + 1]
+    posts = Posts.objects.only(*POST_FIELDS).in_bulk([post_id for rank, post_id in results])
+    page = []
+    for rank, post_id in results:
+        if post_id in posts:
+            posts[post_id].rank = rank
+            page.append(posts[post_id])
+    return page
+
+
+# Term frequencies of every post in memory, for databases without full-text search.
+# It is built from the posts table once per process and then kept up to date from
+# the posts logged by changed(), so it is meant for development and test databases
+# rather than large ones.
+class InvertedIndex:
+    def __init__(self, version):
+        self.version = version
+        self.postings = {}
+        self.terms = {}
+
+    @classmethod
+    def build(cls, version):
+        index = cls(version)
+        for post_id, text in Posts.objects.values_list("id", "text").iterator(chunk_size=BATCH_SIZE):
+            index.add(post_id, text)
+        return index
+
+    def add(self, post_id, text):
+        self.terms[post_id] = Counter(tokenize(text))
+        for term, count in self.terms[post_id].items():
+            self.postings.setdefault(term, {})[post_id] = count
+
+    def remove(self, post_id):
+        for term in self.terms.pop(post_id, ()):
+            del self.postings[term][post_id]
+            if not self.postings[term]:
+                del self.postings[term]
+
+    # Reads the posts of "post_ids" again; those that are gone leave the index
+    def update(self, post_ids):
+        texts = dict(Posts.objects.filter(id__in=post_ids).values_list("id", "text"))
+        for post_id in post_ids:
+            self.remove(post_id)
+            if post_id in texts:
+                self.add(post_id, texts[post_id])
+
+    # The (rank, id) of the posts holding every term, best first. A post ranks by the
+    # frequency of each term weighted by how rare the term is.
+    def search(self, terms):
+        postings = [self.postings.get(term) for term in set(terms)]
+        if not postings or None in postings:
+            return []
+        postings.sort(key=len)
+        weights = [math.log(1 + len(self.terms) / len(posts)) for posts in postings]
+        matches = set(postings[0]).intersection(*postings[1:])
+        return sorted(
+            ((sum(posts[post_id] * weight for posts, weight in zip(postings, weights)), post_id)
+             for post_id in matches),
+            reverse=True,
+        )
+
+
+# Records that the posts of "post_ids" were written or deleted in the current
+# transaction; once it commits they are logged for every process's index
+def changed(post_ids):
+    post_ids = list(post_ids)
+    transaction.on_commit(lambda: cache.log_change(SEARCH_VERSION, post_ids))
+
+
+# Records that posts were written without going through changed(), such as by bulk
+# inserts, so that every index is rebuilt
+def reset():
+    transaction.on_commit(lambda: cache.log_change(SEARCH_VERSION))
+
+
+# The index of this process, brought up to date with the posts logged since its
+# version, or rebuilt when the log does not go back far enough
+def get_index():
+    global _index
+    version = cache.logged_version(SEARCH_VERSION)
+    with _index_lock:
+        if _index is not None and _index.version < version <= _index.version + MAX_REPLAY:
+            changes = cache.logged_changes(SEARCH_VERSION, _index.version, version)
+            if changes is not None:
+                _index.update({post_id for change in changes for post_id in change})
+                _index.version = version
+        if _index is None or _index.version != version:
+            _index = InvertedIndex.build(version)
+        return _index
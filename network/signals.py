@@ -0,0 +1,59 @@
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from . import cache, graph, search
+from .models import User, Posts, Followers
+
+
+@receiver(post_save, sender=Posts)
+@receiver(post_delete, sender=Posts)
+def invalidate_post_card(sender, instance, **kwargs):
+    cache.invalidate_posts([instance.id])
+    cache.bump_versions([cache.POSTS_VERSION, cache.user_version(instance.user_id)])
+
+
+@receiver(post_save, sender=Posts)
+@receiver(post_delete, sender=Posts)
+def invalidate_search(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or "text" in update_fields:
+        search.changed([instance.id])
+
+
+# Fields of User shown in the cards of cache.load_user_cards()
+USER_CARD_FIELDS = {
+    "first_name", "last_name", "username", "bio", "date_joined", "profile_image", "profile_banner",
+    "image_variants", "post_count", "follower_count", "following_count",
+}
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_card(sender, instance, update_fields=None, **kwargs):
+    # Saves of other fields, such as last_login on every login, leave the card alone
+    if update_fields is not None and not USER_CARD_FIELDS.intersection(update_fields):
+        return
+    cache.invalidate_users([instance.id])
+    # Author cards are part of every list of posts
+    cache.bump_versions([cache.POSTS_VERSION, cache.user_version(instance.id)])
+
+
+# The profiles of the authors "instance" commented on show the commenter's card in
+# their comment previews. Deletes are handled before the comments cascade away.
+@receiver(post_save, sender=User)
+@receiver(pre_delete, sender=User)
+def invalidate_comment_previews(sender, instance, update_fields=None, created=False, **kwargs):
+    if created or update_fields is not None and not USER_CARD_FIELDS.intersection(update_fields):
+        return
+    author_ids = Posts.objects.filter(comments__user_id=instance.id).values_list("user_id", flat=True).distinct()
+    cache.bump_versions([cache.user_version(author_id) for author_id in author_ids])
+
+
+@receiver(post_save, sender=Followers)
+def add_follow(sender, instance, created, **kwargs):
+    if created:
+        graph.changed("add", [(instance.follower_id, instance.user_id)])
+
+
+@receiver(post_delete, sender=Followers)
+def remove_follow(sender, instance, **kwargs):
+    graph.changed("remove", [(instance.follower_id, instance.user_id)])
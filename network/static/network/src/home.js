@@ -75,6 +75,18 @@ function reducer(homeInfo, action) {
                 posts: action.payload
             }
         }
+        case "appendPosts": {
+            return {
+                ...homeInfo,
+                posts: [...homeInfo.posts, ...action.payload]
+            }
+        }
+        case "setNextCursor": {
+            return {
+                ...homeInfo,
+                nextCursor: action.payload
+            }
+        }
         case "setPostCount": {
             return {
                 ...homeInfo,
@@ -87,6 +99,34 @@ function reducer(homeInfo, action) {
                 posts: action.payload
             }
         }
+        case "prependPost": {
+            if (!homeInfo.posts || homeInfo.posts.some(post => post.id === action.payload.id)) {
+                return homeInfo;
+            }
+            return {
+                ...homeInfo,
+                posts: [action.payload, ...homeInfo.posts],
+                postCount: homeInfo.postCount+1
+            }
+        }
+        case "updatePost": {
+            return {
+                ...homeInfo,
+                posts: homeInfo.posts && homeInfo.posts.map(post =>
+                    post.id === action.payload.id ? {...post, ...action.payload} : post
+                )
+            }
+        }
+        case "removePost": {
+            if (!homeInfo.posts || !homeInfo.posts.some(post => post.id === action.payload.id)) {
+                return homeInfo;
+            }
+            return {
+                ...homeInfo,
+                posts: homeInfo.posts.filter(post => post.id !== action.payload.id),
+                postCount: homeInfo.postCount-1
+            }
+        }
     }
 }
 
@@ -875,6 +915,7 @@ function App() {
     const initObj = {}
     const userId = document.querySelector("#root").dataset.userid;
     const [homeInfo, homeDispatch] = useReducer(reducer, initObj);
+    const isFetchingRef = useRef(false);
 
     const handleFetchInfo = () => {
         fetch(`users/posts/following`,{
@@ -888,12 +929,52 @@ function App() {
             homeDispatch({type: "setIsAuth", payload: result.is_authenticated});
             homeDispatch({type: "setPosts", payload: result.posts});
             homeDispatch({type: "setPostCount", payload: result.postCount});
+            homeDispatch({type: "setNextCursor", payload: result.next_cursor});
+        });
+    }
+
+    // Loads the next page of older posts with the cursor of the last response.
+    const handleFetchMore = () => {
+        isFetchingRef.current = true;
+        fetch(`users/posts/following?` + new URLSearchParams({before: homeInfo.nextCursor}),{
+        method: "GET",
+        mode: "same-origin"
+    })
+        .then(response => response.json())
+        .then(result => {
+            homeDispatch({type: "appendPosts", payload: result.posts});
+            homeDispatch({type: "setNextCursor", payload: result.next_cursor});
+            isFetchingRef.current = false;
         });
     }
+
+    // Fetches the next page when the user scrolls near the bottom of the page.
+    useEffect(() => {
+        const handleScroll = () => {
+            const nearBottom = window.innerHeight + window.scrollY >= document.body.offsetHeight - 600;
+            if (homeInfo.nextCursor && nearBottom && !isFetchingRef.current) {
+                handleFetchMore();
+            }
+        };
+        window.addEventListener("scroll", handleScroll);
+        return () => window.removeEventListener("scroll", handleScroll);
+    }, [homeInfo.nextCursor]);
     
     useEffect(() => {
         handleFetchInfo();
     }, []);
+
+    // Keeps the timeline fresh with the events pushed by the server instead of polling.
+    // A reset event means this page missed events and reloads the first page.
+    useEffect(() => {
+        const source = new EventSource("users/events");
+        source.addEventListener("post", e => homeDispatch({type: "prependPost", payload: JSON.parse(e.data)}));
+        source.addEventListener("edit", e => homeDispatch({type: "updatePost", payload: JSON.parse(e.data)}));
+        source.addEventListener("like", e => homeDispatch({type: "updatePost", payload: JSON.parse(e.data)}));
+        source.addEventListener("delete", e => homeDispatch({type: "removePost", payload: JSON.parse(e.data)}));
+        source.addEventListener("reset", () => handleFetchInfo());
+        return () => source.close();
+    }, []);
     return (
         <div className="d-flex justify-content-center">
             <header role="banner" className="d-flex">
@@ -429,7 +429,6 @@ function PostContainer({ post, posts, setPosts, postCount, setPostCount }) {
         is_faved, 
         likeNumber, 
         name, 
-        num_pages, 
         text, 
         timestamp, 
         userId, 
@@ -507,11 +506,13 @@ function AllPostsCenterRoof({ postCount }) {
 
 // Fetching and rendering all posts for #Discover section.
 function DiscoverAllPosts({ posts, setPosts, postCount, setPostCount }) {
-    const pageNum = 1;
-    const page = {page: pageNum};
+    const [nextCursor, setNextCursor] = useState(null);
+    const isFetchingRef = useRef(false);
+    const postsRef = useRef(posts);
+    postsRef.current = posts;
     const allPosts = [];
     const handleFetchPosts = () => {
-        fetch(`users/posts?` + new URLSearchParams({page: pageNum}), {
+        fetch(`users/posts`, {
             method: "GET",
             mode: "same-origin",
         })
@@ -519,6 +520,22 @@ function DiscoverAllPosts({ posts, setPosts, postCount, setPostCount }) {
             .then(result => {
                 setPosts([...result.post]);
                 setPostCount(result.postCount);
+                setNextCursor(result.next_cursor);
+            });
+    };
+
+    // Loads the next page of older posts with the cursor of the last response.
+    const handleFetchMore = () => {
+        isFetchingRef.current = true;
+        fetch(`users/posts?` + new URLSearchParams({before: nextCursor}), {
+            method: "GET",
+            mode: "same-origin",
+        })
+            .then(response => response.json())
+            .then(result => {
+                setPosts(posts => [...posts, ...result.post]);
+                setNextCursor(result.next_cursor);
+                isFetchingRef.current = false;
             });
     };
 
@@ -526,6 +543,48 @@ function DiscoverAllPosts({ posts, setPosts, postCount, setPostCount }) {
         handleFetchPosts()
     }, []);
 
+    // Keeps the posts fresh with the events pushed by the server instead of polling.
+    // Anonymous visitors are refused the stream and keep the posts they loaded.
+    // A reset event means this page missed events and reloads the first page.
+    useEffect(() => {
+        const source = new EventSource("users/events?" + new URLSearchParams({feed: "all"}));
+        source.addEventListener("post", e => {
+            const post = JSON.parse(e.data);
+            if (!postsRef.current.some(oldPost => oldPost.id === post.id)) {
+                setPosts(posts => [post, ...posts]);
+                setPostCount(postCount => postCount+1);
+            }
+        });
+        const handleUpdate = e => {
+            const update = JSON.parse(e.data);
+            setPosts(posts => posts.map(post => post.id === update.id ? {...post, ...update} : post));
+        };
+        source.addEventListener("edit", handleUpdate);
+        source.addEventListener("like", handleUpdate);
+        // Deletes made from this page have already removed the post and counted it
+        source.addEventListener("delete", e => {
+            const { id } = JSON.parse(e.data);
+            if (postsRef.current.some(post => post.id === id)) {
+                setPosts(posts => posts.filter(post => post.id !== id));
+                setPostCount(postCount => postCount-1);
+            }
+        });
+        source.addEventListener("reset", () => handleFetchPosts());
+        return () => source.close();
+    }, []);
+
+    // Fetches the next page when the user scrolls near the bottom of the page.
+    useEffect(() => {
+        const handleScroll = () => {
+            const nearBottom = window.innerHeight + window.scrollY >= document.body.offsetHeight - 600;
+            if (nextCursor && nearBottom && !isFetchingRef.current) {
+                handleFetchMore();
+            }
+        };
+        window.addEventListener("scroll", handleScroll);
+        return () => window.removeEventListener("scroll", handleScroll);
+    }, [nextCursor]);
+
     for(let i=0; i<posts.length; i++) {
         allPosts.push(
             <PostContainer 
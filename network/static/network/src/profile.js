@@ -75,6 +75,18 @@ function reducer(profileInfo, action) {
                 posts: action.payload
             }
         }
+        case "appendPosts": {
+            return {
+                ...profileInfo,
+                posts: [...profileInfo.posts, ...action.payload]
+            }
+        }
+        case "setNextCursor": {
+            return {
+                ...profileInfo,
+                nextCursor: action.payload
+            }
+        }
         case "setPostCount": {
             return {
                 ...profileInfo,
@@ -577,7 +589,7 @@ function SendPost() {
             <form onSubmit={handleSubmit}>
                 <div className="d-flex mt-3">
                     <div className="d-flex pe-3 img-cont">
-                        <img src={profileInfo.info.profile_image}
+                        <img src={profileInfo.info.avatar}
                         width="48" height="48" class="rounded-circle"
                         />
                     </div>
@@ -1229,6 +1241,7 @@ function App() {
     const initObj = {}
     const userId = document.querySelector("#root").dataset.userid;
     const [profileInfo, profileDispatch] = useReducer(reducer, initObj);
+    const isFetchingRef = useRef(false);
 
     const handleFetchInfo = () => {
         fetch(`users/${userId}/info`,{
@@ -1243,8 +1256,36 @@ function App() {
             profileDispatch({type: "setPosts", payload: result.posts});
             profileDispatch({type: "setPostCount", payload: result.postCount});
             profileDispatch({type: "setUserId", payload: userId});
+            profileDispatch({type: "setNextCursor", payload: result.next_cursor});
         });
     }
+
+    // Loads the next page of older posts with the cursor of the last response.
+    const handleFetchMore = () => {
+        isFetchingRef.current = true;
+        fetch(`users/${userId}/posts?` + new URLSearchParams({before: profileInfo.nextCursor}),{
+        method: "GET",
+        mode: "same-origin"
+    })
+        .then(response => response.json())
+        .then(result => {
+            profileDispatch({type: "appendPosts", payload: result.post});
+            profileDispatch({type: "setNextCursor", payload: result.next_cursor});
+            isFetchingRef.current = false;
+        });
+    }
+
+    // Fetches the next page when the user scrolls near the bottom of the page.
+    useEffect(() => {
+        const handleScroll = () => {
+            const nearBottom = window.innerHeight + window.scrollY >= document.body.offsetHeight - 600;
+            if (profileInfo.nextCursor && nearBottom && !isFetchingRef.current) {
+                handleFetchMore();
+            }
+        };
+        window.addEventListener("scroll", handleScroll);
+        return () => window.removeEventListener("scroll", handleScroll);
+    }, [profileInfo.nextCursor]);
     
     useEffect(() => {
         handleFetchInfo();
@@ -0,0 +1,77 @@
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+from .timeline import POST_FIELDS, serialize_posts
+from .users import serialize_users
+
+
+CHUNK_SIZE = 500
+
+
+# Listing endpoints stream their whole result instead of one page with ?stream=true
+def wants_stream(request):
+    return request.GET.get("stream") == "true"
+
+
+# Splits an iterator into lists of at most CHUNK_SIZE items
+def chunked(iterable):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, CHUNK_SIZE)):
+        yield chunk
+
+
+# Encodes chunks of items as the elements of a JSON array, one string per chunk
+def encode_chunks(chunks):
+    encoder = DjangoJSONEncoder()
+    separator = ""
+    for chunk in chunks:
+        if chunk:
+            yield separator + ", ".join(encoder.encode(item) for item in chunk)
+            separator = ", "
+
+
+def stream_list(chunks):
+    yield "["
+    yield from encode_chunks(chunks)
+    yield "]"
+
+
+# Streams {**head, key: [items]} with the items of "chunks" written as they are produced
+def stream_object(head, key, chunks):
+    head = json.dumps(head, cls=DjangoJSONEncoder)
+    yield head[:-1] + (", " if head != "{}" else "") + json.dumps(key) + ": ["
+    yield from encode_chunks(chunks)
+    yield "]}"
+
+
+# Serializes every post of "queryset", newest first, reading CHUNK_SIZE rows at a time
+def post_chunks(queryset, viewer):
+    posts = queryset.only(*POST_FIELDS).order_by("-timestamp", "-id").iterator(chunk_size=CHUNK_SIZE)
+    for chunk in chunked(posts):
+        yield serialize_posts(chunk, viewer)
+
+
+# Serializes the users of a values_list queryset of user ids a chunk at a time
+def user_chunks(user_ids, viewer):
+    for chunk in chunked(user_ids.iterator(chunk_size=CHUNK_SIZE)):
+        yield serialize_users(chunk, viewer)
+
+
+# Produces the parts of a synchronous stream one at a time for an ASGI server, which
+# would otherwise read the whole iterator into memory before sending anything
+async def aiterate(parts):
+    parts = iter(parts)
+    done = object()
+    while (part := await sync_to_async(next)(parts, done)) is not done:
+        yield part
+
+
+def streaming_json_response(request, content):
+    if isinstance(request, ASGIRequest):
+        content = aiterate(content)
+    return StreamingHttpResponse(content, content_type="application/json")
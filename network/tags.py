@@ -0,0 +1,160 @@
+import re
+from collections import Counter
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import User, Posts, Hashtags, Mentions, TagCounts
+
+
+HASHTAG = re.compile(r"(?<![\w&#])#(\w{1,64})(?!\w)")
+MENTION = re.compile(r"(?<![\w@])@(\w{1,150})(?!\w)")
+
+BATCH_SIZE = 1000
+
+
+# The distinct hashtags of "text", lowercased, in the order they appear
+def hashtags(text):
+    return list(dict.fromkeys(tag.lower() for tag in HASHTAG.findall(text)))
+
+
+def mentioned_usernames(text):
+    return list(dict.fromkeys(MENTION.findall(text)))
+
+
+# Start of the hour of "timestamp", the trending counts are kept per hour
+def bucket_of(timestamp):
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+def add_to_counts(tags, bucket, delta):
+    for tag in tags:
+        counts = TagCounts.objects.filter(tag=tag, bucket=bucket)
+        if counts.update(count=F("count") + delta):
+            continue
+        try:
+            with transaction.atomic():
+                TagCounts.objects.create(tag=tag, bucket=bucket, count=delta)
+        except IntegrityError:
+            # Another request created the row in the meantime
+            counts.update(count=F("count") + delta)
+
+
+def add_tags(post, tags):
+    Hashtags.objects.bulk_create([Hashtags(post=post, tag=tag, timestamp=post.timestamp) for tag in tags])
+    add_to_counts(tags, bucket_of(post.timestamp), 1)
+
+
+def remove_tags(post, tags):
+    Hashtags.objects.filter(post=post, tag__in=tags).delete()
+    add_to_counts(tags, bucket_of(post.timestamp), -1)
+
+
+def mentioned_user_ids(text):
+    usernames = mentioned_usernames(text)
+    if not usernames:
+        return set()
+    return set(User.objects.filter(username__in=usernames).values_list("id", flat=True))
+
+
+# Records the hashtags and mentions of a new post; call in the transaction that saves it
+def post_created(post):
+    posts_created([post])
+
+
+# Same as post_created for many posts, with a query per hashtag and hour rather than per post
+def posts_created(posts):
+    tags, mentions, counts = [], [], {}
+    for post in posts:
+        for tag in hashtags(post.text):
+            tags.append(Hashtags(post=post, tag=tag, timestamp=post.timestamp))
+            counts.setdefault(bucket_of(post.timestamp), []).append(tag)
+        mentions += [(post, username) for username in mentioned_usernames(post.text)]
+    Hashtags.objects.bulk_create(tags, batch_size=BATCH_SIZE)
+    for bucket, bucket_tags in counts.items():
+        for tag, count in Counter(bucket_tags).items():
+            add_to_counts([tag], bucket, count)
+    if mentions:
+        user_ids = dict(
+            User.objects.filter(username__in={username for post, username in mentions}).values_list("username", "id")
+        )
+        Mentions.objects.bulk_create(
+            [Mentions(post=post, user_id=user_ids[username], timestamp=post.timestamp)
+             for post, username in mentions if username in user_ids],
+            batch_size=BATCH_SIZE,
+        )
+
+
+# Brings the hashtags and mentions of an edited post in line with its new text
+def post_edited(post):
+    old_tags = set(post.hashtags.values_list("tag", flat=True))
+    new_tags = hashtags(post.text)
+    remove_tags(post, list(old_tags.difference(new_tags)))
+    add_tags(post, [tag for tag in new_tags if tag not in old_tags])
+
+    old_mentions = set(post.mentions.values_list("user_id", flat=True))
+    new_mentions = mentioned_user_ids(post.text)
+    Mentions.objects.filter(post=post, user_id__in=old_mentions - new_mentions).delete()
+    Mentions.objects.bulk_create(
+        [Mentions(post=post, user_id=user_id, timestamp=post.timestamp) for user_id in new_mentions - old_mentions]
+    )
+
+
+def tags_of(post):
+    return list(post.hashtags.values_list("tag", flat=True))
+
+
+# Takes "tags", the hashtags tags_of() read before a post was deleted, out of the
+# trending counts; its Hashtags and Mentions rows went with it
+def post_deleted(post, tags):
+    add_to_counts(tags, bucket_of(post.timestamp), -1)
+
+
+# The most used hashtags of the last "hours" hours as (tag, count) pairs, summed from
+# the hourly counts with one range scan over the recent buckets
+def trending(hours, limit):
+    since = bucket_of(timezone.now() - timedelta(hours=hours - 1))
+    return list(
+        TagCounts.objects.filter(bucket__gte=since)
+        .values("tag")
+        .annotate(total=Sum("count"))
+        .filter(total__gt=0)
+        .order_by("-total", "tag")
+        .values_list("tag", "total")[:limit]
+    )
+
+
+# Extracts the hashtags and mentions of every existing post again and recounts the
+# trending counts, e.g. for posts written before they were extracted
+def rebuild_tags():
+    with transaction.atomic():
+        Hashtags.objects.all().delete()
+        Mentions.objects.all().delete()
+        TagCounts.objects.all().delete()
+        usernames = {}
+        tags, mentions, counts = [], [], {}
+        for post in Posts.objects.only("id", "text", "timestamp").iterator(chunk_size=BATCH_SIZE):
+            for tag in hashtags(post.text):
+                tags.append(Hashtags(post_id=post.id, tag=tag, timestamp=post.timestamp))
+                key = (tag, bucket_of(post.timestamp))
+                counts[key] = counts.get(key, 0) + 1
+            for username in mentioned_usernames(post.text):
+                mentions.append((post.id, post.timestamp, username))
+                usernames[username] = None
+        usernames = list(usernames)
+        user_ids = {}
+        for i in range(0, len(usernames), BATCH_SIZE):
+            user_ids.update(User.objects.filter(username__in=usernames[i:i + BATCH_SIZE]).values_list("username", "id"))
+        mentions = [
+            Mentions(post_id=post_id, user_id=user_ids[username], timestamp=timestamp)
+            for post_id, timestamp, username in mentions if username in user_ids
+        ]
+        Hashtags.objects.bulk_create(tags, batch_size=BATCH_SIZE)
+        Mentions.objects.bulk_create(mentions, batch_size=BATCH_SIZE)
+        TagCounts.objects.bulk_create(
+            [TagCounts(tag=tag, bucket=bucket, count=count) for (tag, bucket), count in counts.items()],
+            batch_size=BATCH_SIZE,
+        )
+    return len(tags), len(mentions)
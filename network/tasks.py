@@ -0,0 +1,39 @@
+from . import tags
+from .fanout import fan_out_posts, backfill_timeline_from, backfill_followers, is_celebrity
+from .jobs import handler
+from .models import User, Posts, Followers, Hashtags, Mentions
+
+
+# The side effects of new posts that can wait until after the response: copying
+# them into home timelines and extracting their hashtags and mentions. Posts
+# deleted in the meantime are skipped, and so are the tags of posts edited in the
+# meantime, which tags.post_edited() has already recorded.
+@handler("posts_created")
+def posts_created(post_ids):
+    posts = list(Posts.objects.filter(id__in=post_ids).select_related("user").order_by("id"))
+    by_author = {}
+    for post in posts:
+        by_author.setdefault(post.user_id, []).append(post)
+    for author_posts in by_author.values():
+        fan_out_posts(author_posts[0].user, author_posts)
+    tagged = set(Hashtags.objects.filter(post_id__in=post_ids).values_list("post_id", flat=True))
+    tagged.update(Mentions.objects.filter(post_id__in=post_ids).values_list("post_id", flat=True))
+    tags.posts_created([post for post in posts if post.id not in tagged])
+
+
+# Copies the latest posts of the users of "user_ids" into the home timeline of their
+# new follower, skipping those they have unfollowed in the meantime
+@handler("backfill_timeline")
+def backfill_timeline(follower_id, user_ids):
+    followed = Followers.objects.filter(follower_id=follower_id, user_id__in=user_ids).values_list("user_id", flat=True)
+    backfill_timeline_from(User(id=follower_id), list(followed))
+
+
+# Fans out the posts of the user of "user_id", who has dropped back to
+# CELEBRITY_THRESHOLD followers, unless they have crossed it again in the meantime
+@handler("celebrity_demoted")
+def celebrity_demoted(user_id):
+    user = User.objects.filter(pk=user_id).first()
+    if user is not None and not is_celebrity(user):
+        backfill_followers(user)
+
@@ -1,3 +1,1370 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import AsyncClient, Client, TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from PIL import Image
+
+from . import cache, comments, counters, events, graph, jobs, likes, metrics, ranking, search, tags, wire
+from .graph import GraphIndex
+from .cache import get_cache
+from .fanout import fan_out_post, rebuild_timeline
+from .likes import flush_like_counters
+from .models import User, Posts, Comments, Likes, Followers, Jobs, TimelineEntries, Mentions, TagCounts
+from .pagination import encode_cursor
+
+
+
+class NetworkTestCase(TestCase):
+    def setUp(self):
+        # Cached cards would otherwise outlive the rolled back rows of earlier tests
+        cache.get_cache().clear()
+
+
+class TimelineQueryCountTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        Followers.objects.create(follower=self.viewer, user=self.author)
+        self.client.force_login(self.viewer)
+
+    def add_posts(self, count):
+        for i in range(count):
+            post = Posts.objects.create(user=self.author, text=f"post {i}")
+            fan_out_post(post)
+            if i % 2 == 0:
+                Likes.objects.create(user=self.viewer, post=post)
+            if i % 3 == 0:
+                comments.add_comment(self.viewer, post, f"comment on {i}")
+
+    def count_queries(self, url):
+        # Warm the post and user card cache so both runs are all hits
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_timelines_run_constant_number_of_queries(self):
+        urls = [
+            "/users/posts/following",
+            f"/users/{self.author.id}/info",
+            f"/users/{self.author.id}/posts",
+            "/users/posts",
+        ]
+        self.add_posts(3)
+        small = [self.count_queries(url) for url in urls]
+        self.add_posts(30)
+        large = [self.count_queries(url) for url in urls]
+        self.assertEqual(small, large)
+
+    def test_is_faved_is_resolved_per_post(self):
+        self.add_posts(4)
+        response = self.client.get("/users/posts")
+        faved = {post["text"]: post["is_faved"] for post in response.json()["post"]}
+        self.assertEqual(faved, {
+            "post 0": "true",
+            "post 1": "false",
+            "post 2": "true",
+            "post 3": "false",
+        })
+
+
+class CursorPaginationTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.posts = [Posts.objects.create(user=self.author, text=f"post {i}") for i in range(45)]
+        # Give some posts the same timestamp so ties are broken by id
+        Posts.objects.filter(id__in=[p.id for p in self.posts[10:20]]).update(
+            timestamp=self.posts[10].timestamp
+        )
+
+    def walk(self, url, key):
+        seen = []
+        cursor = None
+        while True:
+            response = self.client.get(url, {"before": cursor} if cursor else {})
+            self.assertEqual(response.status_code, 200)
+            seen += [post["id"] for post in response.json()[key]]
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                return seen
+
+    def test_before_cursor_walks_every_post_once_newest_first(self):
+        expected = list(
+            Posts.objects.order_by("-timestamp", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(self.walk("/users/posts", "post"), expected)
+        self.assertEqual(self.walk(f"/users/{self.author.id}/posts", "post"), expected)
+
+    def test_after_cursor_returns_newer_posts(self):
+        newest = Posts.objects.order_by("-timestamp", "-id")[0]
+        Posts.objects.create(user=self.author, text="newer")
+        response = self.client.get("/users/posts", {"after": encode_cursor(newest)})
+        self.assertEqual([post["text"] for post in response.json()["post"]], ["newer"])
+        self.assertIsNone(response.json()["next_cursor"])
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get("/users/posts", {"before": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+
+class HomeTimelineFanoutTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.client.force_login(self.viewer)
+
+    def post_as(self, user, text):
+        self.client.force_login(user)
+        response = self.client.post("/posts", json.dumps({"text": text}), content_type="application/json")
+        self.client.force_login(self.viewer)
+        return response.json()["post"]["id"]
+
+    def follow(self, user):
+        return self.client.post("/users/following", json.dumps({"user_id": user.id}),
+                                content_type="application/json")
+
+    def home_texts(self):
+        return [post["text"] for post in self.client.get("/users/posts/following").json()["posts"]]
+
+    def test_posts_are_fanned_out_to_followers(self):
+        self.follow(self.author)
+        self.post_as(self.author, "hello")
+        self.post_as(self.viewer, "mine")
+        self.assertEqual(self.home_texts(), ["mine", "hello"])
+        self.assertEqual(TimelineEntries.objects.filter(owner=self.viewer).count(), 2)
+
+    def test_follow_backfills_and_unfollow_removes(self):
+        self.post_as(self.author, "before follow")
+        self.assertEqual(self.home_texts(), [])
+        self.follow(self.author)
+        self.assertEqual(self.home_texts(), ["before follow"])
+        self.client.delete(f"/users/following/{self.author.id}")
+        self.assertEqual(self.home_texts(), [])
+
+    def test_deleted_posts_leave_home_timelines(self):
+        self.follow(self.author)
+        post_id = self.post_as(self.author, "short lived")
+        self.client.force_login(self.author)
+        self.client.delete(f"/posts/{post_id}")
+        self.client.force_login(self.viewer)
+        self.assertEqual(self.home_texts(), [])
+
+    def test_celebrity_posts_are_merged_on_read(self):
+        self.follow(self.author)
+        self.post_as(self.viewer, "mine")
+        with mock.patch("network.fanout.CELEBRITY_THRESHOLD", 0):
+            self.post_as(self.author, "famous")
+            self.assertFalse(TimelineEntries.objects.filter(owner=self.viewer, post__user=self.author).exists())
+            self.assertEqual(self.home_texts(), ["famous", "mine"])
+
+    def test_posts_fanned_out_before_an_author_became_a_celebrity_are_counted_once(self):
+        self.follow(self.author)
+        self.post_as(self.author, "early")
+        with mock.patch("network.fanout.CELEBRITY_THRESHOLD", 0):
+            self.post_as(self.author, "famous")
+            response = self.client.get("/users/posts/following").json()
+        self.assertEqual([post["text"] for post in response["posts"]], ["famous", "early"])
+        self.assertEqual(response["postCount"], 2)
+
+    def test_posts_of_former_celebrities_are_fanned_out(self):
+        other = User.objects.create_user("other", "other@example.com", "password")
+        self.follow(self.author)
+        self.client.force_login(other)
+        self.follow(self.author)
+        with mock.patch("network.fanout.CELEBRITY_THRESHOLD", 1):
+            self.post_as(self.author, "famous")
+            self.assertFalse(TimelineEntries.objects.filter(owner=self.viewer, post__user=self.author).exists())
+            self.client.force_login(other)
+            self.client.delete(f"/users/following/{self.author.id}")
+            self.client.force_login(self.viewer)
+            self.assertEqual(self.home_texts(), ["famous"])
+        self.assertTrue(TimelineEntries.objects.filter(owner=self.viewer, post__user=self.author).exists())
+
+
+class CounterTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.client.force_login(self.viewer)
+
+    def test_writes_keep_counters_in_sync(self):
+        self.client.post("/users/following", json.dumps({"user_id": self.author.id}),
+                         content_type="application/json")
+        response = self.client.post("/posts", json.dumps({"text": "one"}), content_type="application/json")
+        self.client.post("/posts", json.dumps({"text": "two"}), content_type="application/json")
+        self.assertEqual(response.json()["postCount"], 1)
+        self.client.delete(f"/posts/{response.json()['post']['id']}")
+
+        info = self.client.get(f"/users/{self.viewer.id}/info").json()["info"]
+        self.assertEqual((info["postCount"], info["followerCount"], info["followingCount"]), (1, 0, 1))
+        info = self.client.get(f"/users/{self.author.id}/info").json()["info"]
+        self.assertEqual((info["postCount"], info["followerCount"], info["followingCount"]), (0, 1, 0))
+        self.assertEqual(self.client.get("/users/posts").json()["postCount"], 1)
+
+        self.client.delete(f"/users/following/{self.author.id}")
+        self.author.refresh_from_db()
+        self.assertEqual(self.author.follower_count, 0)
+
+    def test_deletes_that_lose_a_race_leave_counters_alone(self):
+        post = Posts.objects.create(user=self.viewer, text="twice")
+        Followers.objects.create(follower=self.viewer, user=self.author)
+        counters.rebuild_counters()
+
+        # Each model's row is deleted by "another request" right after the view read it
+        def read_then_lose(manager):
+            get = manager.get
+            def wrapper(*args, **kwargs):
+                obj = get(*args, **kwargs)
+                manager.filter(pk=obj.pk).delete()
+                return obj
+            return mock.patch.object(manager, "get", wrapper)
+
+        with read_then_lose(Posts.objects):
+            self.assertEqual(self.client.delete(f"/posts/{post.id}").status_code, 204)
+        with read_then_lose(Followers.objects):
+            self.client.delete(f"/users/following/{self.author.id}")
+        self.viewer.refresh_from_db()
+        self.author.refresh_from_db()
+        self.assertEqual((self.viewer.post_count, self.viewer.following_count, self.author.follower_count), (1, 1, 1))
+        self.assertEqual(counters.get(counters.POSTS), 1)
+
+    def test_rebuild_counters_repairs_drift(self):
+        Posts.objects.create(user=self.author, text="untracked")
+        Followers.objects.create(follower=self.viewer, user=self.author)
+        call_command("rebuild_counters", stdout=StringIO())
+        self.author.refresh_from_db()
+        self.viewer.refresh_from_db()
+        self.assertEqual((self.author.post_count, self.author.follower_count), (1, 1))
+        self.assertEqual(self.viewer.following_count, 1)
+        self.assertEqual(counters.get(counters.POSTS), 1)
+
+
+class LikeTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.post = Posts.objects.create(user=self.viewer, text="likeable")
+        self.client.force_login(self.viewer)
+
+    def like(self):
+        return self.client.post("/users/likes", json.dumps({"post_id": self.post.id}),
+                                content_type="application/json").status_code
+
+    def test_like_and_unlike_update_counter_once(self):
+        self.assertEqual(self.like(), 201)
+        self.assertEqual(self.like(), 404)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likeNumber, 1)
+
+        self.assertEqual(self.client.delete(f"/users/likes/{self.post.id}").status_code, 201)
+        self.assertEqual(self.client.delete(f"/users/likes/{self.post.id}").status_code, 404)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likeNumber, 0)
+
+    def test_rebuild_counters_repairs_like_numbers(self):
+        Likes.objects.create(user=self.viewer, post=self.post)
+        call_command("rebuild_counters", stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likeNumber, 1)
+
+@override_settings(LIKE_COUNTER_WRITE_BEHIND=True)
+class WriteBehindLikeTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.post = Posts.objects.create(user=self.viewer, text="viral")
+        self.client.force_login(self.viewer)
+
+    def listed_like_number(self):
+        return self.client.get("/users/posts").json()["post"][0]["likeNumber"]
+
+    def test_unflushed_likes_are_visible_and_flushed_later(self):
+        self.client.post("/users/likes", json.dumps({"post_id": self.post.id}), content_type="application/json")
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likeNumber, 0)
+        self.assertEqual(self.listed_like_number(), 1)
+
+        call_command("flush_like_counters", stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likeNumber, 1)
+        self.assertEqual(self.listed_like_number(), 1)
+
+        self.client.delete(f"/users/likes/{self.post.id}")
+        self.assertEqual(self.listed_like_number(), 0)
+        flush_like_counters()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likeNumber, 0)
+
+class CardCacheTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.post = Posts.objects.create(user=self.viewer, text="original")
+        self.client.force_login(self.viewer)
+
+    def listed_post(self):
+        return self.client.get("/users/posts").json()["post"][0]
+
+    def test_edits_invalidate_cached_cards(self):
+        self.assertEqual(self.listed_post()["text"], "original")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(f"/posts/{self.post.id}", json.dumps({"text": "edited"}),
+                            content_type="application/json")
+        self.assertEqual(self.listed_post()["text"], "edited")
+
+        self.assertEqual(self.listed_post()["name"], " ")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.viewer.first_name = "Ada"
+            self.viewer.save()
+        self.assertEqual(self.listed_post()["name"], "Ada ")
+
+    def test_logins_leave_cards_and_versions_alone(self):
+        self.listed_post()
+        before = cache.get_versions([cache.POSTS_VERSION])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.logout()
+            self.client.login(username="viewer", password="password")
+        self.assertEqual(cache.get_versions([cache.POSTS_VERSION]), before)
+
+    def test_counter_changes_invalidate_profile_header(self):
+        self.assertEqual(self.client.get(f"/users/{self.viewer.id}/info").json()["info"]["postCount"], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/posts", json.dumps({"text": "another"}), content_type="application/json")
+        self.assertEqual(self.client.get(f"/users/{self.viewer.id}/info").json()["info"]["postCount"], 1)
+
+    def test_repeated_reads_are_cache_hits(self):
+        self.listed_post()
+        before = cache.stats()
+        self.listed_post()
+        after = cache.stats()
+        self.assertEqual(after["misses"], before["misses"])
+        self.assertEqual(after["hits"] - before["hits"], 2)
+
+    def test_stats_are_for_staff_only(self):
+        self.assertEqual(self.client.get("/stats/cache").status_code, 302)
+        User.objects.filter(pk=self.viewer.id).update(is_staff=True)
+        self.assertIn("hit_rate", self.client.get("/stats/cache").json())
+
+@mock.patch("network.streaming.CHUNK_SIZE", 3)
+class StreamingTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.fans = [User.objects.create_user(f"fan{i}", "", "password") for i in range(7)]
+        self.posts = [Posts.objects.create(user=self.viewer, text=f"post {i}") for i in range(25)]
+        for fan in self.fans:
+            Followers.objects.create(follower=fan, user=self.viewer)
+        self.client.force_login(self.viewer)
+
+    def streamed_json(self, url):
+        response = self.client.get(url, {"stream": "true"})
+        self.assertTrue(response.streaming)
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_listings_stream_every_post(self):
+        paged = self.client.get("/users/posts").json()
+        streamed = self.streamed_json("/users/posts")
+        self.assertEqual(len(streamed["post"]), 25)
+        self.assertEqual(streamed["post"][:len(paged["post"])], paged["post"])
+        self.assertEqual(len(self.streamed_json(f"/users/{self.viewer.id}/posts")["post"]), 25)
+
+    def test_follow_lists_stream_user_cards(self):
+        expected = sorted(fan.username for fan in self.fans)
+        streamed = self.streamed_json(f"/users/{self.viewer.id}/followers")["users"]
+        self.assertEqual(sorted(card["username"] for card in streamed), expected)
+        listed = self.client.get(f"/users/{self.viewer.id}/followers").json()["users"]
+        self.assertEqual(sorted(card["username"] for card in listed), expected)
+        self.assertEqual(self.streamed_json(f"/users/{self.viewer.id}/following")["users"], [])
+
+    def test_follow_lists_page_by_follow_time(self):
+        Followers.objects.create(follower=self.viewer, user=self.fans[2])
+        # Most recent followers first, a page at a time
+        followers = []
+        params = {"limit": 3}
+        while True:
+            page = self.client.get(f"/users/{self.viewer.id}/followers", params).json()
+            followers += page["users"]
+            if not page["next_cursor"]:
+                break
+            params["before"] = page["next_cursor"]
+        self.assertEqual([user["username"] for user in followers], [fan.username for fan in reversed(self.fans)])
+        self.assertEqual(
+            [user["username"] for user in followers if user["is_followed_by_viewer"] == "true"], ["fan2"]
+        )
+        self.assertEqual(self.client.get(f"/users/{self.viewer.id}/followers", {"before": "x"}).status_code, 400)
+
+    def test_follow_list_queries_do_not_grow_with_page_size(self):
+        for fan in self.fans:
+            Followers.objects.create(follower=self.viewer, user=fan)
+        url = f"/users/{self.fans[0].id}/followers"
+        # Warms the user card cache
+        self.client.get(url)
+        self.client.get(f"/users/{self.viewer.id}/following")
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(url, {"limit": 1})
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(f"/users/{self.viewer.id}/following", {"limit": 7})
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+
+# Runs EXPLAIN on every query the read endpoints make against a seeded database and
+# fails if a plan reads a whole table or sorts rows instead of walking an index.
+class QueryPlanTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        User.objects.bulk_create([User(username=f"user{i}") for i in range(30)])
+        self.users = list(User.objects.order_by("id"))
+        self.viewer = self.users[0]
+        Posts.objects.bulk_create([
+            Posts(user=user, text=f"{user.username} post {i}") for user in self.users for i in range(10)
+        ])
+        Followers.objects.bulk_create([
+            Followers(follower=user, user=self.users[(n + step) % len(self.users)])
+            for n, user in enumerate(self.users) for step in range(1, 6)
+        ])
+        Likes.objects.bulk_create([Likes(user=self.viewer, post=post) for post in Posts.objects.all()[:50]])
+        Comments.objects.bulk_create([
+            Comments(user=user, post=post, text="comment") for post in Posts.objects.all()[:100:4] for user in self.users[:5]
+        ])
+        counters.rebuild_counters()
+        rebuild_timeline(self.viewer)
+        self.client.force_login(self.viewer)
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            if connection.vendor == "sqlite":
+                cursor.execute("EXPLAIN QUERY PLAN " + sql)
+                return [row[-1] for row in cursor.fetchall()]
+            cursor.execute("EXPLAIN (FORMAT JSON) " + sql)
+            plan = cursor.fetchone()[0]
+            return json.loads(plan)[0]["Plan"] if isinstance(plan, str) else plan[0]["Plan"]
+
+    # Plan steps that read a whole table or index or sort rows. Walking a whole index
+    # is only accepted for queries without a WHERE clause, which list rows in index
+    # order on purpose, and scanning the rows of a subquery only reads what it found.
+    # PostgreSQL is asked to avoid sequential scans and sorts, so it only picks them
+    # when no index can serve the query.
+    def plan_problems(self, sql, plan):
+        filtered = " WHERE " in sql
+        if connection.vendor == "sqlite":
+            return [line for line in plan
+                    if "TEMP B-TREE" in line
+                    or (line.startswith("SCAN ") and (" USING " not in line or filtered)
+                        and not line.startswith(("SCAN (subquery", "SCAN qualify")))]
+
+        problems = []
+        nodes = [plan]
+        while nodes:
+            node = nodes.pop()
+            nodes += node.get("Plans", [])
+            if node["Node Type"] in ("Seq Scan", "Sort", "Incremental Sort"):
+                problems.append(node["Node Type"])
+            elif "Index" in node["Node Type"] and filtered and "Index Cond" not in node:
+                problems.append(f"{node['Node Type']} on {node.get('Relation Name')} without Index Cond")
+        return problems
+
+    def assert_indexed(self, url, params=None):
+        self.client.get(url, params or {})
+        get_cache().clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params or {})
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET enable_seqscan = off; SET enable_sort = off")
+        for query in context.captured_queries:
+            if not query["sql"].lstrip().upper().startswith("SELECT"):
+                continue
+            problems = self.plan_problems(query["sql"], self.explain(query["sql"]))
+            self.assertEqual(problems, [], f"{url}: {query['sql']}")
+
+    def test_read_endpoints_use_indexes(self):
+        user = self.users[3]
+        first_page = self.client.get("/users/posts").json()
+        self.assert_indexed("/users/posts")
+        self.assert_indexed("/users/posts", {"before": first_page["next_cursor"]})
+        self.assert_indexed("/users/posts", {"after": first_page["next_cursor"]})
+        self.assert_indexed("/users/posts", {"stream": "true"})
+        self.assert_indexed("/users/posts/following")
+        self.assert_indexed(f"/users/{user.id}/info")
+        self.assert_indexed(f"/users/{user.id}/posts")
+        self.assert_indexed(f"/users/{user.id}/posts", {"stream": "true"})
+        self.assert_indexed(f"/users/{user.id}/following")
+        self.assert_indexed(f"/users/{user.id}/followers")
+        self.assert_indexed("/users/tags/django/posts")
+        top_page = self.client.get("/users/posts", {"order": "top"}).json()
+        self.assert_indexed("/users/posts", {"order": "top"})
+        self.assert_indexed("/users/posts", {"order": "top", "before": top_page["next_cursor"]})
+        self.assert_indexed(f"/users/{user.id}/mentions")
+        commented = Comments.objects.first().post_id
+        self.assert_indexed(f"/posts/{commented}/comments")
+        comment_page = self.client.get(f"/posts/{commented}/comments", {"limit": 2}).json()
+        self.assert_indexed(f"/posts/{commented}/comments", {"before": comment_page["next_cursor"]})
+
+
+class AsyncViewTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        Followers.objects.create(follower=self.viewer, user=self.author)
+        counters.rebuild_counters()
+        for i in range(3):
+            fan_out_post(Posts.objects.create(user=self.author, text=f"post {i}"))
+        self.async_client.force_login(self.viewer)
+
+    async def test_read_views_under_asgi(self):
+        response = await self.async_client.get(f"/users/{self.author.id}/info")
+        self.assertEqual(response.json()["info"]["following"], "true")
+        self.assertEqual(len(response.json()["posts"]), 3)
+
+        response = await self.async_client.get("/users/posts/following")
+        self.assertEqual([post["text"] for post in response.json()["posts"]], ["post 2", "post 1", "post 0"])
+
+        response = await self.async_client.get(f"/users/{self.viewer.id}/following")
+        self.assertEqual([card["id"] for card in response.json()["users"]], [self.author.id])
+
+    async def test_streams_are_async_under_asgi(self):
+        response = await self.async_client.get(f"/users/{self.author.id}/posts?stream=true")
+        content = b"".join([part async for part in response.streaming_content])
+        self.assertEqual(len(json.loads(content)["post"]), 3)
+
+    async def test_home_requires_login(self):
+        response = await AsyncClient().get("/users/posts/following")
+        self.assertEqual(response.status_code, 302)
+
+
+class LiveEventTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        Followers.objects.create(follower=self.viewer, user=self.author)
+        self.client.force_login(self.author)
+        self.async_client.force_login(self.viewer)
+
+    def test_writes_publish_events_after_commit(self):
+        with mock.patch("network.events.get_broker") as get_broker:
+            with self.captureOnCommitCallbacks(execute=True):
+                post_id = self.client.post("/posts", {"text": "hello"}, content_type="application/json").json()["post"]["id"]
+                self.client.post("/users/likes", {"post_id": post_id}, content_type="application/json")
+                self.client.put(f"/posts/{post_id}", {"text": "edited"}, content_type="application/json")
+                self.client.delete(f"/posts/{post_id}")
+        published = [call.args for call in get_broker.return_value.publish.call_args_list]
+        self.assertEqual([event["type"] for channels, event in published], ["post", "like", "edit", "delete"])
+        self.assertTrue(all(channels == [events.author_channel(self.author.id), events.ALL] for channels, event in published))
+        self.assertEqual(published[1][1]["data"], {"id": post_id, "likeNumber": 1})
+
+    async def test_stream_pushes_events_of_followed_authors(self):
+        response = await self.async_client.get("/users/events")
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = response.streaming_content
+        first = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        events.get_broker().publish([events.author_channel(self.author.id)], {"type": "edit", "data": {"id": 1}})
+        self.assertEqual(await first, b'event: edit\ndata: {"id": 1}\n\n')
+        # The ASGI handler cancels the response when the client disconnects
+        second = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        second.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await second
+        self.assertEqual(events.get_broker().subscribers, {})
+
+    async def test_slow_consumers_are_bounded(self):
+        subscription = events.Subscription([events.ALL], size=2)
+        for likeNumber in range(5):
+            subscription.put({"type": "like", "data": {"likeNumber": likeNumber}, "key": "like:1"})
+        self.assertEqual((await subscription.get())["data"], {"likeNumber": 4})
+
+        for i in range(3):
+            subscription.put({"type": "post", "data": {"id": i}})
+        self.assertEqual((await subscription.get())["type"], "reset")
+        self.assertFalse(subscription.pending)
+
+        # Events put after an overflow are read right after the reset
+        for i in range(3):
+            subscription.put({"type": "post", "data": {"id": i}})
+        subscription.put({"type": "post", "data": {"id": 3}})
+        self.assertEqual((await subscription.get())["type"], "reset")
+        self.assertEqual((await asyncio.wait_for(subscription.get(), 1))["data"], {"id": 3})
+
+
+class ConditionalGetTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.post = Posts.objects.create(user=self.author, text="post")
+        self.client.force_login(self.viewer)
+
+    def test_unchanged_responses_cost_only_the_session_lookup(self):
+        for url in [f"/users/{self.author.id}/info", "/users/posts"]:
+            etag = self.client.get(url)["ETag"]
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+            self.assertLessEqual(len(context.captured_queries), 1)
+
+            # The response depends on the viewer
+            self.client.force_login(self.author)
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+            self.client.force_login(self.viewer)
+
+    def test_writes_change_the_etag(self):
+        url = f"/users/{self.author.id}/info"
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/users/likes", {"post_id": self.post.id}, content_type="application/json")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["posts"][0]["likeNumber"], 1)
+
+        etag = response["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/users/following", {"user_id": self.author.id}, content_type="application/json")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.json()["info"]["following"], "true")
+
+    def test_commenter_changes_change_the_etag(self):
+        url = f"/users/{self.author.id}/info"
+        with self.captureOnCommitCallbacks(execute=True):
+            comments.add_comment(self.viewer, self.post, "comment")
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.viewer.first_name = "Renamed"
+            self.viewer.save(update_fields=["first_name"])
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["posts"][0]["comments"][0]["name"], "Renamed ")
+
+        etag = response["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.viewer.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["posts"][0]["comments"], [])
+
+
+@override_settings(IMAGE_PROCESSING_WORKERS=0)
+class ProfileImageTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_settings = override_settings(MEDIA_ROOT=media_root.name)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.user = User.objects.create_user("user", "user@example.com", "password")
+        self.client.force_login(self.user)
+
+    def upload(self, name, size):
+        buffer = BytesIO()
+        Image.new("RGB", size, "red").save(buffer, "JPEG")
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+    def test_uploads_are_served_as_resized_variants(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/settings/profile", {
+                "bio": "bio",
+                "email": "user@example.com",
+                "profile_image": self.upload("face.jpg", (1200, 900)),
+                "profile_banner": self.upload("banner.jpg", (3000, 1000)),
+            })
+        self.assertEqual(response.status_code, 302)
+
+        self.user.refresh_from_db()
+        variants = self.user.image_variants["profile_image"]
+        self.assertEqual(variants["source"], self.user.profile_image.name)
+        with self.user.profile_image.storage.open(variants["avatar"]["webp"]) as file:
+            self.assertEqual(Image.open(file).size, (48, 48))
+        with self.user.profile_image.storage.open(variants["profile"]["jpeg"]) as file:
+            self.assertEqual(Image.open(file).size, (400, 400))
+
+        Posts.objects.create(user=self.user, text="post")
+        post = self.client.get("/users/posts").json()["post"][0]
+        self.assertTrue(post["profile_image"].endswith("face_avatar.webp"))
+        info = self.client.get(f"/users/{self.user.id}/info").json()["info"]
+        self.assertTrue(info["profile_image"].endswith("face_profile.webp"))
+        self.assertTrue(info["profile_banner"].endswith("banner_banner.webp"))
+
+
+    @override_settings(IMAGE_UPLOAD_MAX_BYTES=1024)
+    def test_oversize_uploads_are_cut_off(self):
+        upload = SimpleUploadedFile("big.jpg", b"\xff" * 100_000, content_type="image/jpeg")
+        response = self.client.post("/settings/profile", {"profile_image": upload, "bio": "", "email": ""})
+        self.assertContains(response, "Image file is too large")
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image.name, "default_profile_400x400.png")
+
+    @override_settings(IMAGE_MAX_PIXELS=100 * 100)
+    def test_images_are_refused_from_their_header(self):
+        response = self.client.post("/settings/profile", {
+            "bio": "", "email": "", "profile_image": self.upload("wide.jpg", (101, 100)),
+        })
+        self.assertContains(response, "Image dimensions are too large")
+        response = self.client.post("/settings/profile", {
+            "bio": "", "email": "",
+            "profile_image": SimpleUploadedFile("text.jpg", b"not an image", content_type="image/jpeg"),
+        })
+        self.assertContains(response, "Unsupported media type")
+
+
+@override_settings(GRAPH_INDEX=True)
+class GraphIndexTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.friends = [User.objects.create_user(f"friend{i}", "", "password") for i in range(3)]
+        self.others = [User.objects.create_user(f"other{i}", "", "password") for i in range(3)]
+        for friend in self.friends:
+            Followers.objects.create(follower=self.viewer, user=friend)
+        # other0 is followed by all three friends, other1 by two and other2 by one
+        for i, other in enumerate(self.others):
+            for friend in self.friends[:3 - i]:
+                Followers.objects.create(follower=friend, user=other)
+        Followers.objects.create(follower=self.friends[0], user=self.viewer)
+        self.index = graph.rebuild()
+        self.addCleanup(setattr, graph, "_index", None)
+        self.client.force_login(self.viewer)
+
+    def test_index_follows_follows_and_unfollows(self):
+        self.assertTrue(self.index.is_following(self.viewer.id, self.friends[0].id))
+        self.assertFalse(self.index.is_following(self.friends[0].id, self.friends[1].id))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/users/following", json.dumps({"user_id": self.others[2].id}),
+                             content_type="application/json")
+        self.assertTrue(self.index.is_following(self.viewer.id, self.others[2].id))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/users/following/{self.friends[1].id}")
+        self.assertFalse(self.index.is_following(self.viewer.id, self.friends[1].id))
+        self.assertEqual(self.index.follower_ids(self.friends[1].id), [])
+        self.assertEqual(self.index.stats()["follows"], GraphIndex.build().stats()["follows"])
+
+    def test_suggestions_match_the_database(self):
+        response = self.client.get("/users/suggestions")
+        users = response.json()["users"]
+        self.assertEqual([user["username"] for user in users], ["other0", "other1", "other2"])
+        self.assertEqual([user["followedByFollowingCount"] for user in users], [3, 2, 1])
+        self.assertEqual(self.client.get("/users/suggestions", {"limit": 2}).json()["users"][1]["username"], "other1")
+        with override_settings(GRAPH_INDEX=False):
+            self.assertEqual(graph.suggestions(self.viewer.id, 10), self.index.suggestions(self.viewer.id, 10))
+            self.assertEqual(self.client.get("/users/suggestions").json()["users"], users)
+
+    def test_follow_checks_skip_the_database(self):
+        with self.assertNumQueries(0):
+            self.assertTrue(graph.is_following(self.friends[0].id, self.viewer.id))
+            self.assertEqual(graph.followed_ids(self.viewer.id, [u.id for u in self.others + self.friends]),
+                             {friend.id for friend in self.friends})
+
+    def test_index_replays_changes_of_other_processes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/users/following", json.dumps({"user_id": self.others[2].id}),
+                             content_type="application/json")
+        # Changes this process made itself are already covered
+        self.assertEqual(self.index.version, graph.current_version())
+
+        # Another process follows and unfollows; only the log tells this one
+        Followers.objects.create(follower=self.viewer, user=self.others[1])
+        Followers.objects.filter(follower=self.viewer, user=self.friends[0]).delete()
+        cache.log_change(graph.GRAPH_VERSION, [[self.viewer.id, self.others[1].id]])
+        version = cache.log_change(graph.GRAPH_VERSION, [[self.viewer.id, self.friends[0].id]])
+        with self.assertNumQueries(1):
+            self.assertTrue(graph.catch_up(self.index, version))
+        self.assertTrue(self.index.is_following(self.viewer.id, self.others[1].id))
+        self.assertFalse(self.index.is_following(self.viewer.id, self.friends[0].id))
+        self.assertEqual(self.index.version, version)
+
+        # A change missing from the log can only be caught up with by a rebuild
+        self.assertFalse(graph.catch_up(self.index, cache.log_change(graph.GRAPH_VERSION)))
+
+    def test_profile_follow_state_is_read_from_the_database(self):
+        # Followed by another process, which this index has not caught up with yet
+        Followers.objects.create(follower=self.viewer, user=self.others[2])
+        self.assertFalse(self.index.is_following(self.viewer.id, self.others[2].id))
+        info = self.client.get(f"/users/{self.others[2].id}/info").json()["info"]
+        self.assertEqual(info["following"], "true")
+
+    def test_benchmark_compares_index_and_orm(self):
+        with tempfile.NamedTemporaryFile("r", suffix=".json") as output:
+            call_command("benchmark_graph", samples=5, output=output.name, stdout=StringIO())
+            results = json.load(output)["results"]
+        self.assertEqual(set(results), {"is_following", "followees", "suggestions"})
+
+
+class SearchTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.texts = ["python python django", "python tips", "django release", "coffee with python and django"]
+        self.posts = [Posts.objects.create(user=self.author, text=text) for text in self.texts]
+
+    def search(self, q, **params):
+        return self.client.get("/users/posts/search", {"q": q, **params})
+
+    def test_results_match_every_term_best_first(self):
+        self.assertEqual([post["text"] for post in self.search("Python")
+                          .json()["post"]][0], "python python django")
+        texts = [post["text"] for post in self.search("django python").json()["post"]]
+        self.assertEqual(texts, ["python python django", "coffee with python and django"])
+        self.assertEqual(self.search("golang").json()["post"], [])
+        self.assertEqual(self.search(" ").status_code, 400)
+        self.assertEqual(self.search("python", before="x").status_code, 400)
+
+    def test_results_page_by_rank(self):
+        ids = []
+        params = {"limit": 1}
+        while True:
+            page = self.search("python", **params).json()
+            ids += [post["id"] for post in page["post"]]
+            if not page["next_cursor"]:
+                break
+            params["before"] = page["next_cursor"]
+        self.assertEqual(ids, [post["id"] for post in self.search("python").json()["post"]])
+        self.assertEqual(len(ids), 3)
+
+    def test_edited_and_deleted_posts_are_searched_by_their_new_text(self):
+        self.search("python")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.force_login(self.author)
+            self.client.put(f"/posts/{self.posts[2].id}", json.dumps({"text": "python release"}),
+                            content_type="application/json")
+            self.posts[1].delete()
+        texts = [post["text"] for post in self.search("python").json()["post"]]
+        self.assertIn("python release", texts)
+        self.assertNotIn("python tips", texts)
+
+    def test_writes_update_the_index_without_rebuilding_it(self):
+        self.search("python")
+        with self.captureOnCommitCallbacks(execute=True):
+            Posts.objects.create(user=self.author, text="python again")
+            self.posts[0].delete()
+        with mock.patch.object(search.InvertedIndex, "build") as build:
+            texts = [post["text"] for post in self.search("python").json()["post"]]
+        build.assert_not_called()
+        self.assertEqual(sorted(texts), ["coffee with python and django", "python again", "python tips"])
+
+
+class TagTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.reader = User.objects.create_user("reader", "reader@example.com", "password")
+        self.client.force_login(self.author)
+
+    def post(self, text):
+        return self.client.post("/posts", json.dumps({"text": text}), content_type="application/json").json()["post"]
+
+    def trending(self):
+        return {tag["tag"]: tag["count"] for tag in self.client.get("/users/tags/trending").json()["tags"]}
+
+    def test_extraction(self):
+        self.assertEqual(tags.hashtags("#Django and #python, #django again, a&#39; x#y"), ["django", "python"])
+        self.assertEqual(tags.mentioned_usernames("hi @reader, mail me@example.com @reader"), ["reader"])
+
+    def test_over_long_tags_are_skipped(self):
+        self.assertEqual(tags.hashtags(f"#{'a' * 64} #{'b' * 65} #ok"), ["a" * 64, "ok"])
+        self.assertEqual(tags.mentioned_usernames(f"@{'r' * 151} @reader"), ["reader"])
+
+    def test_tag_timelines_and_mentions(self):
+        first = self.post("Shipping #Django today, thanks @reader")
+        self.post("more #django")
+        self.post("no tags @nobody")
+        texts = [post["text"] for post in self.client.get("/users/tags/DJANGO/posts").json()["post"]]
+        self.assertEqual(texts, ["more #django", "Shipping #Django today, thanks @reader"])
+        page = self.client.get("/users/tags/django/posts", {"limit": 1}).json()
+        page = self.client.get("/users/tags/django/posts", {"limit": 1, "before": page["next_cursor"]}).json()
+        self.assertEqual([post["id"] for post in page["post"]], [first["id"]])
+        mentions = self.client.get(f"/users/{self.reader.id}/mentions").json()["post"]
+        self.assertEqual([post["id"] for post in mentions], [first["id"]])
+        self.assertEqual(self.client.get("/users/999999/mentions").status_code, 404)
+
+    def test_trending_counts_follow_edits_and_deletes(self):
+        first = self.post("#django #python")
+        self.post("#django")
+        self.assertEqual(self.trending(), {"django": 2, "python": 1})
+        self.client.put(f"/posts/{first['id']}", json.dumps({"text": "#python #react @reader"}),
+                        content_type="application/json")
+        self.assertEqual(self.trending(), {"django": 1, "python": 1, "react": 1})
+        self.assertEqual(Mentions.objects.get().user, self.reader)
+        self.client.delete(f"/posts/{first['id']}")
+        self.assertEqual(self.trending(), {"django": 1})
+        self.assertFalse(Mentions.objects.exists())
+        # Counts older than the window are left out
+        TagCounts.objects.update(bucket=timezone.now() - timedelta(days=2))
+        self.assertEqual(self.trending(), {})
+
+    def test_rebuild_matches_incremental_counts(self):
+        self.post("#django @reader")
+        self.post("#django #python")
+        before = self.trending()
+        self.assertEqual(tags.rebuild_tags(), (3, 1))
+        self.assertEqual(self.trending(), before)
+
+
+@override_settings(REQUEST_METRICS=True)
+class RequestMetricsTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password", is_staff=True)
+        for i in range(3):
+            Posts.objects.create(user=self.viewer, text=f"post {i}")
+        self.client.force_login(self.viewer)
+        self.addCleanup(metrics._samples.clear)
+
+    def test_server_timing_counts_the_queries_of_the_request(self):
+        with CaptureQueriesContext(connection) as context, self.assertLogs("network.metrics", "INFO") as logs:
+            response = self.client.get("/users/posts")
+        self.assertIn(f'desc="{len(context.captured_queries)} queries"', response["Server-Timing"])
+        self.assertIn("serialize;dur=", response["Server-Timing"])
+        sample = json.loads(logs.records[0].getMessage())
+        self.assertEqual((sample["view"], sample["status"]), ("all_posts", 200))
+        self.assertEqual(sample["bytes"], len(response.content))
+
+        stats = self.client.get("/stats/requests").json()["views"]["all_posts"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(sum(stats["histogram"].values()), 1)
+
+    async def test_async_views_are_measured(self):
+        client = AsyncClient()
+        await client.aforce_login(self.viewer)
+        response = await client.get(f"/users/{self.viewer.id}/posts")
+        self.assertNotIn('desc="0 queries"', response["Server-Timing"])
+
+    @override_settings(REQUEST_METRICS_DUPLICATE_QUERIES=2)
+    def test_repeated_queries_are_logged(self):
+        post = Posts.objects.first()
+        # The edit reads the post again after saving it
+        with self.assertLogs("network.metrics", "WARNING") as logs:
+            self.client.put(f"/posts/{post.id}", json.dumps({"text": "edited"}), content_type="application/json")
+        self.assertIn("manage_post ran the same query 2 times", logs.output[0])
+
+
+class WireFormatTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.posts = [Posts.objects.create(user=self.author, text=f"post {i}") for i in range(12)]
+        Likes.objects.create(user=self.viewer, post=self.posts[-1])
+        self.client.force_login(self.viewer)
+
+    def test_v1_stays_the_default(self):
+        response = self.client.get("/users/posts")
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.json()["post"][0]["is_faved"], "true")
+        self.assertIn("Accept", response["Vary"])
+
+    def test_v2_sends_each_author_once(self):
+        response = self.client.get("/users/posts", HTTP_ACCEPT=wire.V2_JSON)
+        self.assertEqual(response["Content-Type"], wire.V2_JSON)
+        data = json.loads(response.content)
+        self.assertEqual(data["version"], 2)
+        self.assertIn("postCount", data)
+        self.assertIn("nextCursor", data)
+        self.assertEqual(list(data["authors"]), [str(self.author.id)])
+        self.assertEqual(data["authors"][str(self.author.id)]["username"], "author")
+        first = data["posts"][0]
+        self.assertEqual((first["id"], first["authorId"], first["faved"]), (self.posts[-1].id, self.author.id, True))
+        self.assertEqual(first["timestamp"], int(self.posts[-1].timestamp.timestamp() * 1000))
+        self.assertIs(data["posts"][1]["faved"], False)
+
+    def test_v2_is_compressed_when_accepted(self):
+        response = self.client.get("/users/posts", HTTP_ACCEPT=wire.V2_JSON, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(response.content))["version"], 2)
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_refused_encodings_are_not_used(self):
+        response = self.client.get("/users/posts", HTTP_ACCEPT=wire.V2_JSON, HTTP_ACCEPT_ENCODING="gzip;q=0, br;q=0")
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(json.loads(response.content)["version"], 2)
+        self.assertEqual(wire.parse_encodings("gzip;q=0.5, br ; q=0, *"), {"gzip": 0.5, "br": 0.0, "*": 1.0})
+
+    def test_formats_have_their_own_etags(self):
+        etag = self.client.get("/users/posts")["ETag"]
+        response = self.client.get("/users/posts", HTTP_ACCEPT=wire.V2_JSON, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class TopFeedTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.fans = [User.objects.create_user(f"fan{i}", "", "password") for i in range(10)]
+        now = timezone.now()
+        # A day old post, a post from an hour ago and a new one
+        self.old, self.recent, self.new = [
+            Posts.objects.create(user=self.viewer, text=text) for text in ("old", "recent", "new")
+        ]
+        for post, age in ((self.old, timedelta(days=1)), (self.recent, timedelta(hours=1)), (self.new, timedelta())):
+            Posts.objects.filter(pk=post.pk).update(timestamp=now - age, score=ranking.score(0, now - age))
+
+    def like(self, post, fans):
+        for fan in fans:
+            self.client.force_login(fan)
+            self.client.post("/users/likes", json.dumps({"post_id": post.id}), content_type="application/json")
+
+    def top(self, **params):
+        return [post["text"] for post in self.client.get("/users/posts", {"order": "top", **params}).json()["post"]]
+
+    def test_likes_update_the_score(self):
+        self.assertEqual(self.top(), ["new", "recent", "old"])
+        self.like(self.recent, self.fans[:3])
+        self.like(self.old, self.fans)
+        self.assertEqual(self.top(), ["recent", "new", "old"])
+        post = Posts.objects.get(pk=self.recent.pk)
+        self.assertAlmostEqual(post.score, ranking.score(3, post.timestamp))
+
+        self.client.force_login(self.fans[0])
+        self.client.delete(f"/users/likes/{self.recent.id}")
+        self.assertAlmostEqual(Posts.objects.get(pk=self.recent.pk).score, ranking.score(2, post.timestamp))
+        Posts.objects.update(score=0)
+        counters.rebuild_counters()
+        old = Posts.objects.get(pk=self.old.pk)
+        self.assertAlmostEqual(old.score, ranking.score(10, old.timestamp))
+
+    def test_top_feed_pages_by_score(self):
+        self.like(self.recent, self.fans[:3])
+        texts = []
+        params = {"limit": 1}
+        while True:
+            page = self.client.get("/users/posts", {"order": "top", **params}).json()
+            texts += [post["text"] for post in page["post"]]
+            if not page["next_cursor"]:
+                break
+            params["before"] = page["next_cursor"]
+        self.assertEqual(texts, self.top())
+
+
+class CommentTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.readers = [User.objects.create_user(f"reader{i}", "", "password") for i in range(4)]
+        self.post = Posts.objects.create(user=self.author, text="post")
+        self.quiet = Posts.objects.create(user=self.author, text="no comments")
+
+    def comment(self, user, text):
+        self.client.force_login(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f"/posts/{self.post.id}/comments", json.dumps({"text": text}), content_type="application/json"
+            )
+        self.assertEqual(response.status_code, 201)
+        return response.json()
+
+    def test_comments_keep_the_count_and_the_score(self):
+        for i, reader in enumerate(self.readers):
+            created = self.comment(reader, f"comment {i}")
+        self.assertEqual(created["commentCount"], 4)
+        self.assertEqual(created["comment"]["username"], "reader3")
+        post = Posts.objects.get(pk=self.post.pk)
+        self.assertEqual(post.comment_count, 4)
+        self.assertAlmostEqual(post.score, ranking.score(0, post.timestamp, 4))
+
+        comment = Comments.objects.get(text="comment 0")
+        self.client.force_login(self.readers[1])
+        self.assertEqual(self.client.delete(f"/comments/{comment.id}").status_code, 401)
+        # The author of the post may delete any comment on it
+        self.client.force_login(self.author)
+        self.assertEqual(self.client.delete(f"/comments/{comment.id}").status_code, 204)
+        post.refresh_from_db()
+        self.assertEqual(post.comment_count, 3)
+        self.assertAlmostEqual(post.score, ranking.score(0, post.timestamp, 3))
+        # Deleting it again, as a request that lost a race would, changes nothing
+        self.assertFalse(comments.delete_comment(comment))
+        post.refresh_from_db()
+        self.assertEqual(post.comment_count, 3)
+
+        Posts.objects.update(comment_count=0)
+        counters.rebuild_counters()
+        self.assertEqual(Posts.objects.get(pk=self.post.pk).comment_count, 3)
+
+    def test_comments_page_newest_first(self):
+        for i, reader in enumerate(self.readers):
+            self.comment(reader, f"comment {i}")
+        texts = []
+        params = {"limit": 3}
+        while True:
+            page = self.client.get(f"/posts/{self.post.id}/comments", params).json()
+            texts += [comment["text"] for comment in page["comments"]]
+            if not page["next_cursor"]:
+                break
+            params["before"] = page["next_cursor"]
+        self.assertEqual(texts, ["comment 3", "comment 2", "comment 1", "comment 0"])
+        self.assertEqual(self.client.get("/posts/0/comments").status_code, 404)
+
+    @override_settings(COMMENT_PREVIEW_SIZE=2)
+    def test_timelines_show_the_newest_comments(self):
+        for i, reader in enumerate(self.readers):
+            self.comment(reader, f"comment {i}")
+        posts = {post["text"]: post for post in self.client.get("/users/posts").json()["post"]}
+        self.assertEqual(posts["post"]["commentCount"], 4)
+        self.assertEqual([comment["text"] for comment in posts["post"]["comments"]], ["comment 3", "comment 2"])
+        self.assertEqual(posts["post"]["comments"][0]["username"], "reader3")
+        self.assertEqual(posts["no comments"]["comments"], [])
+
+        data = self.client.get("/users/posts", HTTP_ACCEPT=wire.V2_JSON).json()
+        commented = next(post for post in data["posts"] if post["id"] == self.post.id)
+        self.assertEqual(commented["commentCount"], 4)
+        self.assertEqual(data["authors"][str(commented["comments"][0]["authorId"])]["username"], "reader3")
+
+    def test_comments_are_validated(self):
+        self.client.logout()
+        response = self.client.post(
+            f"/posts/{self.post.id}/comments", json.dumps({"text": "hi"}), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 403)
+        self.client.force_login(self.readers[0])
+        for body in ({"text": ""}, {"text": "x" * 281}, {"text": 1}, {}, []):
+            response = self.client.post(
+                f"/posts/{self.post.id}/comments", json.dumps(body), content_type="application/json"
+            )
+            self.assertEqual(response.status_code, 400)
+        response = self.client.post(f"/posts/{self.post.id}/comments", "{", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Comments.objects.exists())
+
+
+class BatchWriteTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer", "viewer@example.com", "password")
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.fan = User.objects.create_user("fan", "fan@example.com", "password")
+        Followers.objects.create(follower=self.fan, user=self.viewer)
+        counters.rebuild_counters()
+        self.client.force_login(self.viewer)
+
+    def batch(self, url, key, items):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, json.dumps({key: items}), content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        return [result["status"] for result in response.json()["results"]]
+
+    def post_queries(self, count):
+        with CaptureQueriesContext(connection) as context:
+            self.batch("/posts/batch", "posts", [{"text": f"#bulk post {i} for @fan"} for i in range(count)])
+        return len(context.captured_queries)
+
+    def test_posts_are_written_in_bulk(self):
+        statuses = self.batch("/posts/batch", "posts", [{"text": "#hello @fan"}, {"text": ""}, {"text": "second"}])
+        self.assertEqual(statuses, ["created", "invalid", "created"])
+        self.assertEqual(User.objects.get(pk=self.viewer.pk).post_count, 2)
+        self.assertEqual(counters.get(counters.POSTS), 2)
+        self.assertEqual(TimelineEntries.objects.filter(owner=self.fan).count(), 2)
+        self.assertTrue(Mentions.objects.filter(user=self.fan).exists())
+        self.assertEqual(tags.trending(1, 10), [("hello", 1)])
+        # The first batch creates the hourly count of #bulk, the others update it
+        self.post_queries(1)
+        self.assertEqual(self.post_queries(5), self.post_queries(50))
+
+    def test_likes_report_each_item(self):
+        posts = [Posts.objects.create(user=self.author, text=f"post {i}") for i in range(3)]
+        Likes.objects.create(user=self.viewer, post=posts[0])
+        Posts.objects.filter(pk=posts[0].pk).update(likeNumber=1)
+        statuses = self.batch("/users/likes/batch", "likes", [
+            {"post_id": posts[0].id}, {"post_id": posts[1].id}, {"post_id": posts[1].id},
+            {"post_id": posts[2].id}, {"post_id": 0}, {"post": 1},
+        ])
+        self.assertEqual(statuses, ["exists", "created", "exists", "created", "not_found", "invalid"])
+        self.assertEqual(list(Posts.objects.order_by("id").values_list("likeNumber", flat=True)), [1, 1, 1])
+        self.assertAlmostEqual(Posts.objects.get(pk=posts[1].pk).score, ranking.score(1, posts[1].timestamp))
+
+    def test_follows_report_each_item(self):
+        Posts.objects.create(user=self.author, text="backfilled")
+        statuses = self.batch("/users/following/batch", "follows", [
+            {"user_id": self.author.id}, {"user_id": self.fan.id}, {"user_id": self.viewer.id}, {"user_id": 0},
+        ])
+        self.assertEqual(statuses, ["created", "created", "invalid", "not_found"])
+        self.assertEqual(self.batch("/users/following/batch", "follows", [{"user_id": self.author.id}]), ["exists"])
+        viewer, author = User.objects.get(pk=self.viewer.pk), User.objects.get(pk=self.author.pk)
+        self.assertEqual((viewer.following_count, viewer.follower_count, author.follower_count), (2, 1, 1))
+        self.assertTrue(TimelineEntries.objects.filter(owner=self.viewer, post__text="backfilled").exists())
+
+    @override_settings(BATCH_WRITE_MAX_ITEMS=2)
+    def test_batches_are_bounded(self):
+        response = self.client.post(
+            "/users/likes/batch", json.dumps({"likes": [{"post_id": 1}] * 3}), content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post("/users/likes/batch", json.dumps({"likes": 1}), content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(JOB_QUEUE=True, JOB_RETRY_DELAY=0, JOB_MAX_ATTEMPTS=2)
+class JobQueueTests(NetworkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.fan = User.objects.create_user("fan", "fan@example.com", "password")
+        Followers.objects.create(follower=self.fan, user=self.author)
+
+    def runworker(self):
+        output = StringIO()
+        call_command("runworker", burst=True, stdout=output)
+        return output.getvalue()
+
+    def test_side_effects_run_in_the_worker(self):
+        self.client.force_login(self.author)
+        response = self.client.post("/posts", json.dumps({"text": "#queued"}), content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        post_id = response.json()["post"]["id"]
+        self.assertEqual(list(Jobs.objects.values_list("name", flat=True)), ["posts_created"])
+        self.assertFalse(TimelineEntries.objects.filter(owner=self.fan, post_id=post_id).exists())
+
+        self.assertIn("Ran 1 jobs. 0 queued", self.runworker())
+        self.assertTrue(TimelineEntries.objects.filter(owner=self.fan, post_id=post_id).exists())
+        self.assertEqual(tags.trending(1, 10), [("queued", 1)])
+        self.assertFalse(Jobs.objects.exists())
+
+    def test_jobs_with_the_same_key_are_queued_once(self):
+        other = User.objects.create_user("other", "other@example.com", "password")
+        self.client.force_login(self.fan)
+
+        def refollow():
+            self.client.post("/users/following", json.dumps({"user_id": other.id}), content_type="application/json")
+            self.client.delete(f"/users/following/{other.id}")
+
+        refollow()
+        refollow()
+        self.assertEqual(Jobs.objects.filter(name="backfill_timeline").count(), 1)
+        self.runworker()
+        # Once it has run, the key can be queued again
+        refollow()
+        self.assertEqual(Jobs.objects.filter(name="backfill_timeline").count(), 1)
+
+    def test_like_events_are_published_by_the_request(self):
+        post = Posts.objects.create(user=self.author, text="post")
+        with mock.patch.object(events, "get_broker") as get_broker:
+            with self.assertRaises(RuntimeError), self.captureOnCommitCallbacks(execute=True), transaction.atomic():
+                likes.like_post(self.fan, post)
+                raise RuntimeError
+            get_broker.return_value.publish.assert_not_called()
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertTrue(likes.like_post(self.fan, post))
+        channels, event = get_broker.return_value.publish.call_args.args
+        self.assertEqual((event["type"], event["data"]["likeNumber"]), ("like", 1))
+        self.assertFalse(Jobs.objects.exists())
+
+    def test_failed_jobs_are_retried_then_kept(self):
+        Jobs.objects.create(name="no_such_job", payload={})
+        with self.assertLogs("network.jobs", "ERROR") as logs:
+            self.runworker()
+        self.assertEqual(len(logs.records), 2)
+        job = Jobs.objects.get()
+        self.assertEqual((job.status, job.attempts), (Jobs.FAILED, 2))
+        self.assertIn("No handler is registered", job.last_error)
+        self.assertEqual(jobs.stats()["failed"], 1)
+
+    def test_jobs_of_stopped_workers_are_queued_again(self):
+        post = Posts.objects.create(user=self.author, text="post")
+        Jobs.objects.create(
+            name="posts_created", payload={"post_ids": [post.id]}, status=Jobs.RUNNING,
+            attempts=1, locked_at=timezone.now() - timedelta(hours=1), locked_by="gone",
+        )
+        self.runworker()
+        self.assertFalse(Jobs.objects.exists())
+        self.assertTrue(TimelineEntries.objects.filter(owner=self.fan, post=post).exists())
+
+
+class SeedAndBenchmarkTests(NetworkTestCase):
+    def test_seed_then_benchmark_writes_results(self):
+        call_command("seed_network", users=30, posts=120, likes=200, follows=5, seed=1, stdout=StringIO())
+        self.assertEqual(User.objects.filter(username__startswith="seed").count(), 30)
+        self.assertEqual(Posts.objects.count(), 120)
+        self.assertTrue(TimelineEntries.objects.exists())
+
+        with tempfile.NamedTemporaryFile("r", suffix=".json") as output:
+            call_command("benchmark", requests=3, warmup=1, memory_requests=1, output=output.name, stdout=StringIO())
+            results = json.load(output)["results"]
+        self.assertEqual(set(results), {"home_info", "user_info", "all_posts", "search_posts", "manage_likes", "create_post"})
+        self.assertTrue(all(result["p50_ms"] <= result["p99_ms"] for result in results.values()))
+        # The benchmark's own writes are rolled back
+        self.assertEqual(Posts.objects.count(), 120)
+
+
+@skipUnlessDBFeature("test_db_allows_multiple_connections")
+class ConcurrentLikeTests(TransactionTestCase):
+    def setUp(self):
+        cache.get_cache().clear()
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.post = Posts.objects.create(user=self.author, text="viral")
+        User.objects.bulk_create([User(username=f"fan{i}") for i in range(200)])
+        self.fans = list(User.objects.filter(username__startswith="fan"))
+
+    def like_as(self, user):
+        try:
+            client = Client()
+            client.force_login(user)
+            return client.post("/users/likes", json.dumps({"post_id": self.post.id}),
+                               content_type="application/json").status_code
+        finally:
+            connection.close()
+
+    def test_simultaneous_likes_are_counted_exactly(self):
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            statuses = list(executor.map(self.like_as, self.fans + self.fans[:50]))
+        self.assertEqual(statuses.count(201), 200)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likeNumber, 200)
+        self.assertEqual(Likes.objects.filter(post=self.post).count(), 200)
+
+
+@skipUnlessDBFeature("test_db_allows_multiple_connections")
+class ConcurrentBatchTests(TransactionTestCase):
+    def setUp(self):
+        cache.get_cache().clear()
+        self.author = User.objects.create_user("author", "author@example.com", "password")
+        self.fan = User.objects.create_user("fan", "fan@example.com", "password")
+        User.objects.bulk_create([User(username=f"user{i}") for i in range(50)])
+        self.users = list(User.objects.filter(username__startswith="user"))
+        self.posts = Posts.objects.bulk_create([Posts(user=self.author, text=f"post {i}") for i in range(50)])
+
+    def post_as_fan(self, url, data):
+        try:
+            client = Client()
+            client.force_login(self.fan)
+            response = client.post(url, json.dumps(data), content_type="application/json")
+            if url.endswith("batch"):
+                return sum(result["status"] == "created" for result in response.json()["results"])
+            return int(response.status_code == 201)
+        finally:
+            connection.close()
+
+    # Single likes and follows of the fan race a batch of the same ones; each is
+    # counted by whichever request inserted it
+    def test_batches_count_only_their_own_rows(self):
+        requests = [("/users/likes/batch", {"likes": [{"post_id": post.id} for post in self.posts]})]
+        requests += [("/users/likes", {"post_id": post.id}) for post in self.posts]
+        requests += [("/users/following/batch", {"follows": [{"user_id": user.id} for user in self.users]})]
+        requests += [("/users/following", {"user_id": user.id}) for user in self.users]
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            created = list(executor.map(lambda request: self.post_as_fan(*request), requests))
+        self.assertEqual(sum(created), 100)
+        self.assertEqual(sorted(Posts.objects.values_list("likeNumber", flat=True).distinct()), [1])
+        fan = User.objects.get(pk=self.fan.pk)
+        self.assertEqual(fan.following_count, 50)
+        self.assertEqual(sorted(User.objects.filter(username__startswith="user")
+                                .values_list("follower_count", flat=True).distinct()), [1])
 
-# Create your tests here.
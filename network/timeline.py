@@ -0,0 +1,110 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+
+from . import cache, comments, metrics
+from .images import variant_url
+from .likes import apply_pending_likes
+from .models import Likes
+
+
+# Columns of Posts needed to serialize a page; everything else comes from the cache
+POST_FIELDS = ("id", "timestamp", "user", "likeNumber", "comment_count")
+
+
+# Returns the ids of the posts in "post_ids" liked by "viewer" with a single query
+def faved_post_ids(viewer, post_ids):
+    if not viewer.is_authenticated or not post_ids:
+        return set()
+    return set(
+        Likes.objects.filter(user=viewer, post_id__in=post_ids).values_list("post_id", flat=True)
+    )
+
+
+async def afaved_post_ids(viewer, post_ids):
+    if not viewer.is_authenticated or not post_ids:
+        return set()
+    return {
+        post_id async for post_id in
+        Likes.objects.filter(user=viewer, post_id__in=post_ids).values_list("post_id", flat=True)
+    }
+
+
+# Serializes a post as it is shown on timelines from its cached card and its author's,
+# with its newest comments
+def serialize_post(post_card, author_card, likeNumber, is_faved, commentCount, latest_comments):
+    postSerialized = dict(post_card)
+    postSerialized["name"] = author_card["first_name"]+" "+author_card["last_name"]
+    postSerialized["username"] = author_card["username"]
+    postSerialized["profile_image"] = author_card["avatar"]
+    postSerialized["likeNumber"] = likeNumber
+    postSerialized["is_faved"] = "true" if is_faved else "false"
+    postSerialized["commentCount"] = commentCount
+    postSerialized["comments"] = latest_comments
+    return postSerialized
+
+
+# Serializes a post its author has just written, as it is shown on timelines,
+# without reading it back
+def serialize_new_post(post, author):
+    return {
+        "name": author.first_name+" "+author.last_name,
+        "username": author.username,
+        "id": post.id,
+        "text": post.text,
+        "likeNumber": post.likeNumber,
+        "timestamp": post.timestamp,
+        "is_faved": "false",
+        "userId": author.id,
+        "profile_image": variant_url(author, "profile_image", "avatar"),
+        "commentCount": 0,
+        "comments": [],
+    }
+
+
+# Serializes a page of posts for "viewer" with a constant number of queries.
+# Only the POST_FIELDS columns of "posts" are used; the text and the authors are
+# read from the cache with one multi-get each, and the newest comments of the
+# whole page with one query, see comments.latest_comments().
+@metrics.timed("serialize")
+def serialize_posts(posts, viewer):
+    posts = list(posts)
+    apply_pending_likes(posts)
+    post_ids = [post.id for post in posts]
+    faved = faved_post_ids(viewer, post_ids)
+    post_cards = cache.post_cards(post_ids)
+    latest = comments.latest_comments(posts)
+    user_cards = cache.user_cards(
+        [post.user_id for post in posts] + [comment.user_id for page in latest.values() for comment in page]
+    )
+    return assemble_posts(posts, faved, post_cards, user_cards, latest)
+
+
+# Same as serialize_posts, with the likes, the comments and the two card lookups run
+# concurrently. The cards of commenters who wrote none of the posts are read after.
+@metrics.timed("serialize")
+async def aserialize_posts(posts, viewer):
+    posts = list(posts)
+    await sync_to_async(apply_pending_likes)(posts)
+    post_ids = [post.id for post in posts]
+    faved, post_cards, user_cards, latest = await asyncio.gather(
+        afaved_post_ids(viewer, post_ids),
+        sync_to_async(cache.post_cards)(post_ids),
+        sync_to_async(cache.user_cards)([post.user_id for post in posts]),
+        sync_to_async(comments.latest_comments)(posts),
+    )
+    commenter_ids = {comment.user_id for page in latest.values() for comment in page}
+    if not commenter_ids <= user_cards.keys():
+        user_cards.update(await sync_to_async(cache.user_cards)(list(commenter_ids - user_cards.keys())))
+    return assemble_posts(posts, faved, post_cards, user_cards, latest)
+
+
+def assemble_posts(posts, faved, post_cards, user_cards, latest):
+    return [
+        serialize_post(
+            post_cards[post.id], user_cards[post.user_id], post.likeNumber, post.id in faved,
+            post.comment_count, comments.assemble_comments(latest.get(post.id, ()), user_cards),
+        )
+        for post in posts
+        if post.id in post_cards and post.user_id in user_cards
+    ]
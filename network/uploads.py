@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.files.uploadhandler import StopUpload, TemporaryFileUploadHandler
+
+
+# Streams every uploaded file to a temporary file, so an upload never holds more
+# than one chunk in memory, and stops reading the request as soon as a file goes
+# over IMAGE_UPLOAD_MAX_BYTES. The rest of the request body is read and dropped.
+class BoundedUploadHandler(TemporaryFileUploadHandler):
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.max_bytes = getattr(settings, "IMAGE_UPLOAD_MAX_BYTES", 10 * 1024 * 1024)
+        # Name of the field whose file was too large
+        self.rejected = None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_bytes:
+            self.rejected = self.field_name
+            raise StopUpload(connection_reset=False)
+        return super().receive_data_chunk(raw_data, start)
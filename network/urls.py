@@ -15,21 +15,42 @@ urlpatterns = [
     # Create a new post
     path("posts", views.create_post, name="create_post"),
 
+    # Create many posts in one request
+    path("posts/batch", views.batch_posts, name="batch_posts"),
+
     # Edit or delete a post
     path("posts/<int:post_id>", views.manage_post, name="manage_post"),
 
+    # List the comments of a post or comment on it
+    path("posts/<int:post_id>/comments", views.post_comments, name="post_comments"),
+
+    # Delete a comment
+    path("comments/<int:comment_id>", views.manage_comment, name="manage_comment"),
+
     # Let the user to like a post with "post_id"
     path("users/likes", views.manage_likes, name="manage_likes"),
 
+    # Like many posts in one request
+    path("users/likes/batch", views.batch_likes, name="batch_likes"),
+
     # Let the user  to unlike a post with "post_id"
     path("users/likes/<int:post_id>", views.manage_unlike, name="manage_unlike"),
 
     # Allows a user to follow another user
     path("users/following", views.following, name="following"),
 
+    # Follow many users in one request
+    path("users/following/batch", views.batch_follows, name="batch_follows"),
+
     # Allows a user to unfollow another user ID
     path("users/following/<int:user_id>", views.unfollowing, name="unfollowing"),
 
+    # Suggests accounts for the authenticated user to follow
+    path("users/suggestions", views.who_to_follow, name="who_to_follow"),
+
+    # Pushes new, edited and deleted posts and like counts as Server-Sent Events
+    path("users/events", views.live_events, name="live_events"),
+
     # Access to posts published by the user with "user_id"
     path("users/<int:user_id>/posts", views.user_timeline, name="user_timeline"),
 
@@ -39,6 +60,18 @@ urlpatterns = [
     # Access to posts published by the authenticated user's following
     path("users/posts/following", views.home_info, name="home_info"),
 
+    # Access to posts with a hashtag, given without the "#"
+    path("users/tags/<str:tag>/posts", views.tag_timeline, name="tag_timeline"),
+
+    # The most used hashtags of the last hours
+    path("users/tags/trending", views.trending_tags, name="trending_tags"),
+
+    # Access to posts that mention the user with "user_id"
+    path("users/<int:user_id>/mentions", views.user_mentions, name="user_mentions"),
+
+    # Searches the text of all posts with the "q" query parameter
+    path("users/posts/search", views.search_posts, name="search_posts"),
+
     # Access to all posts
     path("users/posts", views.all_posts, name="all_posts"),
 
@@ -48,6 +81,15 @@ urlpatterns = [
     # Query for the user's followers
     path("users/<int:user_id>/followers", views.lookup_user_followers, name="lookup_user_followers"),
 
+    # Hit and miss counts of the post and user card cache, for staff only
+    path("stats/cache", views.cache_stats, name="cache_stats"),
+
+    # Latency and query counts of the recent requests of each view, for staff only
+    path("stats/requests", views.request_stats, name="request_stats"),
+
+    # Number of queued, running and failed jobs, for staff only
+    path("stats/jobs", views.job_stats, name="job_stats"),
+
     ######################################################################################################
 
     # To access a user's profile with username
@@ -0,0 +1,28 @@
+from asgiref.sync import sync_to_async
+
+from . import cache, graph, metrics
+
+
+# Returns the ids of the users in "user_ids" that "viewer" follows with a single query
+def followed_user_ids(viewer, user_ids):
+    if not viewer.is_authenticated or not user_ids:
+        return set()
+    return graph.followed_ids(viewer.id, user_ids)
+
+
+# Serializes a list of users for "viewer" from their cached cards, in the order of
+# "user_ids", with one multi-get for the cards and one query for the follow flags
+@metrics.timed("serialize")
+def serialize_users(user_ids, viewer):
+    cards = cache.user_cards(user_ids)
+    followed = followed_user_ids(viewer, user_ids)
+    users = []
+    for user_id in user_ids:
+        if user_id in cards:
+            user = dict(cards[user_id])
+            user["is_followed_by_viewer"] = "true" if user_id in followed else "false"
+            users.append(user)
+    return users
+
+
+aserialize_users = sync_to_async(serialize_users)
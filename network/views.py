@@ -1,16 +1,35 @@
+import asyncio
 import json
-from django.core.paginator import Paginator
+from asgiref.sync import sync_to_async
 from django.contrib.auth import authenticate, login, logout
-from django.db import IntegrityError
+from django.contrib.auth.views import redirect_to_login
+from django.db import IntegrityError, transaction
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.urls import reverse
 from django import forms
-from PIL import Image
-from PIL import UnidentifiedImageError
-from django.utils.datastructures import MultiValueDictKeyError
-from .models import User, Posts, Likes, Followers
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from . import batch, cache, comments, counters, events, graph, images, jobs, metrics, search, tags, wire
+from .conditional import conditional_get
+from .models import User, Posts, Comments, Likes, Followers, Hashtags, Mentions
+from .images import variant_url
+from .uploads import BoundedUploadHandler
+from .fanout import remove_from_timeline, follower_removed, ahome_timeline
+from .likes import like_post, unlike_post, apply_pending_likes
+from .pagination import InvalidCursor, paginate, apaginate, apaginate_ranked, page_size
+from .streaming import wants_stream, streaming_json_response, stream_object, post_chunks, user_chunks
+from .timeline import POST_FIELDS, serialize_new_post, serialize_posts, aserialize_posts
+from .users import aserialize_users
+
+
+# Resolves the lazy request.user, which reads the session and the user row, off the
+# event loop so async views can use it
+async def get_viewer(request):
+    await sync_to_async(lambda: request.user.is_authenticated)()
+    return request.user
 
 
 #To render requested user's home page
@@ -32,121 +51,90 @@ def home_view(request):
 
 
 # Access to posts published by the authenticated user's following as JSON
-@login_required
-def home_info(request):
+async def home_info(request):
+    user = await get_viewer(request)
+    if not user.is_authenticated:
+        return redirect_to_login(request.get_full_path())
     if request.method == "GET":
-        user = request.user
-        following = [user.id]
-        for f in Followers.objects.filter(follower__id=user.id):
-            following.append(f.user.id)
-        posts = Posts.objects.filter(user_id__in=following).order_by('-timestamp')
-        postCount = len(posts)
-        jsonPost = []
+        try:
+            page, next_cursor, postCount = await ahome_timeline(user, request)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
         info = {}
         jsonHome = {}
-        following = "true"
 
-        for post in posts:
-            try:
-                Likes.objects.get(post=post,user=request.user)
-            except Likes.DoesNotExist:
-                fav = "false"
-            else:
-                fav = "true"
-
-            postSerialized = {}
-            postSerialized["name"] = post.user.first_name+" "+post.user.last_name
-            postSerialized["id"] = post.id
-            postSerialized["username"] = post.user.username
-            postSerialized["text"] = post.text
-            postSerialized["timestamp"] = post.timestamp
-            postSerialized["likeNumber"] = post.likeNumber
-            postSerialized["is_faved"] = fav
-            postSerialized["profile_image"] = post.user.profile_image.url
-            jsonPost.append(postSerialized)
         jsonHome["postCount"] = postCount
-        jsonHome["posts"] = jsonPost
+        jsonHome["posts"] = await aserialize_posts(page, user)
+        jsonHome["next_cursor"] = next_cursor
         jsonHome["is_authenticated"] = "true"
         info["id"] = user.id
         info["first_name"] = user.first_name
         info["last_name"] = user.last_name
         info["username"] = user.username
-        info["profile_image"] = user.profile_image.url
+        info["profile_image"] = variant_url(user, "profile_image", "avatar")
+        info["followerCount"] = user.follower_count
+        info["followingCount"] = user.following_count
 
         jsonHome["info"] = info
             
-        return JsonResponse(jsonHome, safe=False)
+        return wire.timeline_response(request, jsonHome, "posts")
     else:
         return JsonResponse({"error": "Http request method must be 'GET'."}, status=404)
 
-
-def resizeProfileImage(img):
-    if img.height > 400 or img.width > 400:
-        output_size = (400, 400)
-        img.thumbnail(output_size)
-        img.save(self.profile_image.path)
-
-
-# To upload/update profile picture, profile banner and profile information
+# To upload/update profile picture, profile banner and profile information.
+# Uploads go through BoundedUploadHandler; the CSRF check reads the request body,
+# so it runs once the handler is in place.
+@csrf_exempt
 @login_required
 def set_profile(request):
+    upload_handler = BoundedUploadHandler(request)
+    request.upload_handlers = [upload_handler]
+    return edit_profile(request, upload_handler)
+
+
+@csrf_protect
+def edit_profile(request, upload_handler):
     if request.method == "GET":
         content = {}
-        content["profile_image"] = request.user.profile_image.url
+        content["profile_image"] = variant_url(request.user, "profile_image", "profile")
         content["bio"] = request.user.bio
         content["email"] = request.user.email
-        try:
-            content["profile_banner"] = request.user.profile_banner.url
-        except:
-            content["profile_banner"] = ""
+        content["profile_banner"] = variant_url(request.user, "profile_banner", "banner") or ""
         return render(request, "network/setprofile.html", {
             "content": content
             })
     elif request.method == "POST":
         user = request.user
         content = {}
-        content["profile_image"] = request.user.profile_image.url
+        content["profile_image"] = variant_url(request.user, "profile_image", "profile")
         content["bio"] = request.user.bio
         content["email"] = request.user.email
-        try:
-            content["profile_banner"] = request.user.profile_banner.url
-        except:
-            content["profile_banner"] = ""
-
-        # To check if the uploaded file is an image or if it is uploaded
-        try:
-            profile_image = Image.open(request.FILES["profile_image"].file)
-        except UnidentifiedImageError:
-            content["message"] = "Unsupported media type"
-            return render(request, "network/setprofile.html", {
-                "content": content
-                })
-        except MultiValueDictKeyError:
-            profImageIsUploaded = False
-        else:
-            profImageIsUploaded = True
-
-        try:
-            profile_banner = Image.open(request.FILES["profile_banner"].file)
-        except UnidentifiedImageError:
-            content["message"] = "Unsupported media type"
+        content["profile_banner"] = variant_url(request.user, "profile_banner", "banner") or ""
+
+        # To check if the uploaded files are images of an acceptable size. Reading
+        # request.FILES runs the upload handler.
+        files = request.FILES
+        message = "Image file is too large" if upload_handler.rejected else None
+        uploads = {}
+        for field in ("profile_image", "profile_banner"):
+            if message is None and field in files:
+                message = images.check_upload(files[field])
+                uploads[field] = files[field]
+        if message:
+            content["message"] = message
             return render(request, "network/setprofile.html", {
                 "content": content
                 })
-        except MultiValueDictKeyError:
-            profBannerIsUploaded = False
-        else:
-            profBannerIsUploaded = True
 
-        if profBannerIsUploaded:
-            user.profile_banner = request.FILES["profile_banner"]
-
-        if profImageIsUploaded:
-            user.profile_image = request.FILES["profile_image"]
+        for field, upload in uploads.items():
+            setattr(user, field, upload)
 
         user.bio = request.POST["bio"]
         user.email = request.POST["email"]
-        user.save()
+        # Only the edited fields, so the counters are not overwritten with stale values
+        user.save(update_fields=["profile_image", "profile_banner", "bio", "email"])
+        # The resized variants are written in the background
+        images.schedule(user, list(uploads))
 
         return HttpResponseRedirect(reverse("home"))
 
@@ -247,55 +235,42 @@ def register(request):
         return render(request, "network/register.html")
 
 
+# Read from the database rather than the graph index, which may lag behind the
+# version of the user that the response is cached under
+async def is_following(viewer, user_id):
+    if not viewer.is_authenticated:
+        return False
+    return await Followers.objects.filter(follower_id=viewer.id, user_id=user_id).aexists()
+
+
 # Returns the profile information and posts of the requested user as JSON
-def user_info(request,user_id):
+@conditional_get(lambda request, user_id: [cache.user_version(user_id)])
+async def user_info(request,user_id):
     
     jsonProfile = {}
-    jsonPost = []
-    info = {}
-    following = "false"
+    viewer = await get_viewer(request)
 
+    # The profile header comes from the cache, only the follow state depends on the viewer.
+    # The header, the posts and the follow state are read concurrently.
+    posts = Posts.objects.filter(user_id=user_id).only(*POST_FIELDS)
     try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
+        info, (page, next_cursor), following = await asyncio.gather(
+            sync_to_async(cache.user_card)(user_id),
+            apaginate(posts, request),
+            is_following(viewer, user_id),
+        )
+    except InvalidCursor as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    if info is None:
         return JsonResponse({"error": "User not found"})
-    
-    posts = Posts.objects.filter(user=user).order_by('-timestamp')
-    postCount = len(posts)
-    followerCount = Followers.objects.filter(user=user_id).count()
-    followingCount = Followers.objects.filter(follower=user_id).count()
 
-    jsonProfile["postCount"] = postCount
+    jsonProfile["postCount"] = info["postCount"]
+    jsonProfile["posts"] = await aserialize_posts(page, viewer)
+    jsonProfile["next_cursor"] = next_cursor
 
-    for post in posts:
-        if request.user.is_authenticated:
-            try:
-                Likes.objects.get(post=post,user=request.user)
-            except Likes.DoesNotExist:
-                fav = "false"
-            else:
-                fav = "true"
-        else:
-            fav = "false"
-        postSerialized = {}
-        postSerialized["name"] = post.user.first_name+" "+post.user.last_name
-        postSerialized["id"] = post.id
-        postSerialized["username"] = post.user.username
-        postSerialized["text"] = post.text
-        postSerialized["timestamp"] = post.timestamp
-        postSerialized["likeNumber"] = post.likeNumber
-        postSerialized["is_faved"] = fav
-        postSerialized["profile_image"] = user.profile_image.url
-        jsonPost.append(postSerialized)
-        
-    jsonProfile["posts"] = jsonPost
-
-    if request.user.is_authenticated:
-        querySetLen = Followers.objects.filter(user=user_id, follower=request.user.id).count()
-        if querySetLen == 1:
-            following = "true"
+    if viewer.is_authenticated:
         jsonProfile["is_authenticated"] = "true"
-        if request.user.id == user.id:
+        if viewer.id == user_id:
             jsonProfile["contentType"] = "userProfile"
         else:
             jsonProfile["contentType"] = "profile"
@@ -304,23 +279,8 @@ def user_info(request,user_id):
         jsonProfile["is_authenticated"] = "false"
         jsonProfile["contentType"] = "profile"
 
-    try:
-        profile_banner = user.profile_banner.url
-    except ValueError:
-        profile_banner = None
-
-    info["id"] = user.id
-    info["first_name"] = user.first_name
-    info["last_name"] = user.last_name
-    info["username"] = user.username
-    info["bio"] = user.bio
-    info["date_joined"] = user.date_joined
-    info["postCount"] = postCount
-    info["followerCount"] = followerCount 
-    info["followingCount"] = followingCount
-    info["following"] = following
-    info["profile_image"] = user.profile_image.url
-    info["profile_banner"] = profile_banner
+    info = dict(info)
+    info["following"] = "true" if following else "false"
 
     jsonProfile["info"] = info
 
@@ -338,12 +298,7 @@ def profile_view(request, username):
     if request.user.is_authenticated:
 
         # Checkes if user follows the requested profile
-        try:
-            Followers.objects.get(follower=request.user, user=user_profile)
-        except Followers.DoesNotExist:
-            is_followed = "false"
-        else:
-            is_followed = "true"
+        is_followed = "true" if graph.is_following(request.user.id, user_profile.id) else "false"
         
         # Checkes if requested profile belongs to user
         if request.user.id == user_profile.id:
@@ -375,23 +330,16 @@ def create_post(request):
             user=user,
             text=data["text"],
         )
-    p.save()
-    postCount = len(Posts.objects.all())
-    recentPost = Posts.objects.filter(user=user).order_by("-timestamp")[0];
+    with transaction.atomic():
+        p.save()
+        counters.post_created(user)
+        jobs.enqueue("posts_created", {"post_ids": [p.id]})
+    postCount = counters.get(counters.POSTS)
+    post = serialize_new_post(p, user)
+    events.post_created(post)
     return JsonResponse({
         "postCount": postCount,
-        "post":{
-            "name": user.first_name+" "+user.last_name,
-            "username":user.username,
-            "id": recentPost.id,
-            "text": recentPost.text,
-            "likeNumber": recentPost.likeNumber,
-            "timestamp": recentPost.timestamp,
-            "is_faved": "false",
-            "userId": recentPost.user.id,
-            "profile_image": user.profile_image.url 
-            }
-
+        "post": post
         }, status=201);
     
 
@@ -411,8 +359,12 @@ def manage_post(request, post_id):
     elif request.method == "PUT":
         data = json.loads(request.body)
         post.text = data["text"]
-        post.save()
+        with transaction.atomic():
+            post.save(update_fields=["text"])
+            tags.post_edited(post)
+        events.post_edited(post)
         updatedPost = Posts.objects.get(pk=post_id)
+        apply_pending_likes([updatedPost])
         try:
             Likes.objects.get(post=post,user=user)
         except Likes.DoesNotExist:
@@ -428,11 +380,20 @@ def manage_post(request, post_id):
                             "timestamp": updatedPost.timestamp,
                             "likeNumber": updatedPost.likeNumber,
                             "is_faved": fav,
-                            "profile_image": user.profile_image.url
+                            "profile_image": variant_url(user, "profile_image", "avatar"),
+                            "commentCount": updatedPost.comment_count
 
                             }, status=201);
     elif request.method == "DELETE":
-        post.delete()
+        # Also removes the post from every home timeline it was fanned out to
+        with transaction.atomic():
+            post_tags = tags.tags_of(post)
+            _, deleted = Posts.objects.filter(pk=post.id).delete()
+            # A concurrent request may have deleted it since it was read
+            if deleted.get(Posts._meta.label):
+                events.post_deleted(post)
+                tags.post_deleted(post, post_tags)
+                counters.post_deleted(user)
         return HttpResponse(status=204)
     else:
         return JsonResponse({"error": "HTTP request method must be 'PUT' or 'DELETE'."}, status=404)
@@ -451,18 +412,9 @@ def manage_likes(request):
         except Posts.DoesNotExist:
             return JsonResponse({"error": "Post not found."}, status=404)
 
-        try:
-            l = Likes.objects.get(user=user,post=post)
-        except Likes.DoesNotExist:
-            l = Likes(user=user,post=post)
-        else:
+        if not like_post(user, post):
             return JsonResponse({"error": "The post has been already liked by the user."}, status=404)
 
-        l.save()
-        likeNumber = Likes.objects.filter(post=post).count()
-        post.likeNumber = likeNumber
-        post.save()
-
         return JsonResponse({"message": "Post liked successfully."}, status=201)
     else:
         return JsonResponse({"error": "Http method must be 'POST'."}, status=404)
@@ -480,148 +432,253 @@ def manage_unlike(request, post_id):
         except Posts.DoesNotExist:
             return JsonResponse({"error": "Post not found."}, status=404)
 
-        try:
-            l = Likes.objects.get(user=user,post=post)
-        except Likes.DoesNotExist:
+        if not unlike_post(user, post):
             return JsonResponse({"message": "Post was unliked."}, status=404)
 
-        l.delete()
-        likeNumber = Likes.objects.filter(post=post).count()
-        post.likeNumber = likeNumber
-        post.save()
-
         return JsonResponse({"message": "Post unliked successfully."}, status=201)
     else:
         return JsonResponse({"error": "Http method must be 'DELETE'."}, status=404)
 
+# Applies the array under "key" of the request body with "write", which returns a
+# result per item in the order of the items, for importers and offline clients
+def batch_write(request, key, write):
+    if request.method != "POST":
+        return JsonResponse({"error": "POST request required."}, status=400)
+    try:
+        items = json.loads(request.body)[key]
+    except (ValueError, KeyError, TypeError):
+        items = None
+    if not isinstance(items, list):
+        return JsonResponse({"error": f"Request body must hold a '{key}' array."}, status=400)
+    if len(items) > batch.max_items():
+        return JsonResponse({"error": f"A batch holds at most {batch.max_items()} items."}, status=400)
+    results = write(request.user, items)
+    return JsonResponse({
+        "created": sum(result["status"] == "created" for result in results),
+        "results": results,
+    })
+
+
+# Creates the posts of the "posts" array, each with a "text"
+@login_required
+def batch_posts(request):
+    return batch_write(request, "posts", batch.create_posts)
+
+
+# Likes the posts of the "likes" array, each with a "post_id"
+@login_required
+def batch_likes(request):
+    return batch_write(request, "likes", batch.like_posts)
+
+
+# Follows the users of the "follows" array, each with a "user_id"
+@login_required
+def batch_follows(request):
+    return batch_write(request, "follows", batch.follow_users)
+
+
+# Lists the comments of the post with "post_id", newest first, or adds one from the
+# authenticated user
+async def post_comments(request, post_id):
+    try:
+        post = await Posts.objects.only("id", "user", "comment_count").aget(pk=post_id)
+    except Posts.DoesNotExist:
+        return JsonResponse({"error": "Post not found."}, status=404)
+
+    if request.method == "GET":
+        queryset = Comments.objects.filter(post=post).only(*comments.COMMENT_FIELDS)
+        try:
+            page, next_cursor = await apaginate(queryset, request)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        return JsonResponse({
+            "commentCount": post.comment_count,
+            "comments": await sync_to_async(comments.serialize_comments)(page),
+            "next_cursor": next_cursor,
+        })
+    elif request.method == "POST":
+        viewer = await get_viewer(request)
+        if not viewer.is_authenticated:
+            return JsonResponse({"error": "Login required."}, status=403)
+        try:
+            text = json.loads(request.body)["text"]
+        except (ValueError, KeyError, TypeError):
+            text = None
+        if not isinstance(text, str) or not text.strip() or len(text.strip()) > 280:
+            return JsonResponse({"error": "Comment must be 1 to 280 characters long."}, status=400)
+        text = text.strip()
+        comment = await sync_to_async(comments.add_comment)(viewer, post, text)
+        return JsonResponse({
+            "commentCount": post.comment_count,
+            "comment": (await sync_to_async(comments.serialize_comments)([comment]))[0],
+        }, status=201)
+    else:
+        return JsonResponse({"error": "HTTP request method must be 'GET' or 'POST'."}, status=404)
+
+
+# Deletes a comment; allowed to its author and to the author of the post
+@login_required
+def manage_comment(request, comment_id):
+    if request.method == "DELETE":
+        try:
+            comment = Comments.objects.select_related("post").get(pk=comment_id)
+        except Comments.DoesNotExist:
+            return JsonResponse({"error": "Comment not found."}, status=404)
+
+        if request.user.id not in (comment.user_id, comment.post.user_id):
+            return JsonResponse({"error": "User is not authorized"}, status=401)
+        comments.delete_comment(comment)
+        return HttpResponse(status=204)
+    else:
+        return JsonResponse({"error": "Http method must be 'DELETE'."}, status=404)
+
+
 # Access to posts published by the authenticated user's following
 @login_required
 def following_timeline(request):
     if request.method == "GET":
         
         user = request.user
-        following = []
-        for f in Followers.objects.filter(follower__id=user.id):
-            following.append(f.user.id)
-        posts = Posts.objects.filter(user_id__in=following).order_by('-timestamp')
-        postCount = len(posts)
-        jsonPost = []
+        following = Followers.objects.filter(follower__id=user.id).values_list("user_id", flat=True)
+        posts = Posts.objects.filter(user_id__in=following).only(*POST_FIELDS)
+        try:
+            page, next_cursor = paginate(posts, request, 10)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
         jsonTline = {}
-        jsonTline["postCount"] = postCount
-        pageNum = request.GET.get("page", 1)
-        paginator = Paginator(posts, 10)
-        page_obj = paginator.get_page(pageNum)
+        jsonTline["postCount"] = posts.count()
+        jsonTline["post"] = serialize_posts(page, user)
+        jsonTline["next_cursor"] = next_cursor
 
-        for post in page_obj.object_list:
-            try:
-                Likes.objects.get(post=post,user=request.user)
-            except Likes.DoesNotExist:
-                fav = "false"
-            else:
-                fav = "true"
-
-            postSerialized = {}
-            postSerialized["name"] = post.user.first_name+" "+post.user.last_name
-            postSerialized["id"] = post.id
-            postSerialized["username"] = post.user.username
-            postSerialized["text"] = post.text
-            postSerialized["timestamp"] = post.timestamp
-            postSerialized["likeNumber"] = post.likeNumber
-            postSerialized["is_faved"] = fav
-            postSerialized["userId"] = post.user.id
-            postSerialized["num_pages"] = paginator.num_pages
-
-            jsonPost.append(postSerialized)
-            jsonTline["post"] = jsonPost
-            
         return JsonResponse(jsonTline, safe=False)
     else:
         return JsonResponse({"error": "Http request method must be 'GET'."}, status=404)
 
 
 # Access to posts published by the user with "user_id"
-def user_timeline(request, user_id):
+async def user_timeline(request, user_id):
     if request.method == "GET":
+        viewer = await get_viewer(request)
         try:
-            user = User.objects.get(pk=user_id)
+            user = await User.objects.aget(pk=user_id)
         except User.DoesNotExist:
             return JsonResponse({"error": "User does not exist."}, status=404)
 
         
-        posts = Posts.objects.filter(user=user).order_by('-timestamp')
-        jsonPost = []
+        posts = Posts.objects.filter(user=user).only(*POST_FIELDS)
+        if wants_stream(request):
+            return streaming_json_response(request, stream_object(
+                {"postCount": user.post_count}, "post", post_chunks(posts, viewer)
+            ))
+        try:
+            page, next_cursor = await apaginate(posts, request)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
         jsonUserTimeline = {}
-        postCount = len(posts)
-        jsonUserTimeline["postCount"] = postCount
-
-        for post in posts:
-            if request.user.is_authenticated:
-                try:
-                    Likes.objects.get(post=post,user=request.user)
-                except Likes.DoesNotExist:
-                    fav = "false"
-                else:
-                    fav = "true"
-            else:
-                fav = "false"
-
-            postSerialized = {}
-            postSerialized["name"] = post.user.first_name+" "+post.user.last_name
-            postSerialized["id"] = post.id
-            postSerialized["username"] = post.user.username
-            postSerialized["text"] = post.text
-            postSerialized["timestamp"] = post.timestamp
-            postSerialized["likeNumber"] = post.likeNumber
-            postSerialized["is_faved"] = fav
-
-            jsonPost.append(postSerialized)
-            jsonUserTimeline["post"] = jsonPost
-            
-        return JsonResponse(jsonUserTimeline, safe=False)
+        jsonUserTimeline["postCount"] = user.post_count
+        jsonUserTimeline["post"] = await aserialize_posts(page, viewer)
+        jsonUserTimeline["next_cursor"] = next_cursor
+
+        return wire.timeline_response(request, jsonUserTimeline, "post")
     else:
         return JsonResponse({"error": "Http request method must be 'GET'."}, status=404)
 
 
-# Access to all posts
-def all_posts(request):
+# Returns a page of the posts of "entries", a queryset of Hashtags or Mentions rows,
+# read with one range scan over their timestamp index
+async def entry_timeline(request, entries):
+    viewer = await get_viewer(request)
+    posts = entries.select_related("post").only("timestamp", *(f"post__{field}" for field in POST_FIELDS))
+    try:
+        page, next_cursor = await apaginate(posts, request, id_field="post_id")
+    except InvalidCursor as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    jsonTimeline = {}
+    jsonTimeline["post"] = await aserialize_posts([entry.post for entry in page], viewer)
+    jsonTimeline["next_cursor"] = next_cursor
+    return wire.timeline_response(request, jsonTimeline, "post")
+
+
+# Access to the posts with the hashtag "tag"
+async def tag_timeline(request, tag):
     if request.method == "GET":
+        return await entry_timeline(request, Hashtags.objects.filter(tag=tag.lower()))
+    else:
+        return JsonResponse({"error": "Http request method must be 'GET'."}, status=404)
 
+
+# Access to the posts that mention the user with "user_id"
+async def user_mentions(request, user_id):
+    if request.method == "GET":
+        if not await User.objects.filter(pk=user_id).aexists():
+            return JsonResponse({"error": "User does not exist."}, status=404)
+        return await entry_timeline(request, Mentions.objects.filter(user_id=user_id))
+    else:
+        return JsonResponse({"error": "Http request method must be 'GET'."}, status=404)
+
+
+# The hashtags used in the most posts of the last "hours" hours, 24 by default
+async def trending_tags(request):
+    if request.method == "GET":
         try:
-            posts = Posts.objects.all().order_by('-timestamp')
-        except Posts.DoesNotExist:
-            return JsonResponse({"error": "Posts can not be found."}, status=404)
+            hours = max(1, min(int(request.GET.get("hours", 24)), 24 * 7))
+            limit = page_size(request, 10)
+        except (ValueError, InvalidCursor):
+            return JsonResponse({"error": "Hours and limit must be integers."}, status=400)
+        trending = await sync_to_async(tags.trending)(hours, limit)
+        return JsonResponse({"tags": [{"tag": tag, "count": count} for tag, count in trending]})
+    else:
+        return JsonResponse({"error": "Http request method must be 'GET'."}, status=404)
 
-        jsonPost = []
-        postCount = len(posts)
+
+# Access to all posts, newest first or with ?order=top by their score, see ranking.py
+@conditional_get(lambda request: [cache.POSTS_VERSION])
+async def all_posts(request):
+    if request.method == "GET":
+        viewer = await get_viewer(request)
+
+        posts = Posts.objects.all().only(*POST_FIELDS)
+        # Streams are always newest first
+        if wants_stream(request):
+            postCount = await sync_to_async(counters.get)(counters.POSTS)
+            return streaming_json_response(request, stream_object(
+                {"postCount": postCount}, "post", post_chunks(posts, viewer)
+            ))
+        if request.GET.get("order") == "top":
+            page = apaginate_ranked(posts.only(*POST_FIELDS, "score"), request, "score")
+        else:
+            page = apaginate(posts, request)
+        try:
+            (page, next_cursor), postCount = await asyncio.gather(
+                page,
+                sync_to_async(counters.get)(counters.POSTS),
+            )
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
         jsonHome = {}
         jsonHome["postCount"] = postCount
+        jsonHome["post"] = await aserialize_posts(page, viewer)
+        jsonHome["next_cursor"] = next_cursor
+        return wire.timeline_response(request, jsonHome, "post")
+    else:
+        return HttpResponse(status=404)
 
-        for post in posts:
-            if request.user.is_authenticated:
-                try:
-                    Likes.objects.get(post=post,user=request.user)
-                except Likes.DoesNotExist:
-                    fav = "false"
-                else:
-                    fav = "true"
-            else:
-                fav = "false"
-
-            postSerialized = {}
-            postSerialized["name"] = post.user.first_name+" "+post.user.last_name
-            postSerialized["id"] = post.id
-            postSerialized["username"] = post.user.username
-            postSerialized["text"] = post.text
-            postSerialized["timestamp"] = post.timestamp
-            postSerialized["likeNumber"] = post.likeNumber
-            postSerialized["is_faved"] = fav
-            postSerialized["userId"] = post.user.id
-            postSerialized["profile_image"] = post.user.profile_image.url
-
-            jsonPost.append(postSerialized)
-
-        jsonHome["post"] = jsonPost
-        return JsonResponse(jsonHome, safe=False)
+
+# Searches the text of all posts, best match first
+async def search_posts(request):
+    if request.method == "GET":
+        viewer = await get_viewer(request)
+        query = request.GET.get("q", "").strip()
+        if not query:
+            return JsonResponse({"error": "Search query must not be empty."}, status=400)
+        try:
+            page, next_cursor = await sync_to_async(search.search_posts)(query, request)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        jsonResults = {}
+        jsonResults["post"] = await aserialize_posts(page, viewer)
+        jsonResults["next_cursor"] = next_cursor
+        return wire.timeline_response(request, jsonResults, "post")
     else:
         return HttpResponse(status=404)
 
@@ -648,7 +705,18 @@ def following(request):
         if follower.id == user.id:
             return JsonResponse({"error": "Users can not follow themselves."}, status=404)
         else:
-            f.save()
+            try:
+                with transaction.atomic():
+                    f.save()
+                    counters.followed(follower, user)
+                    jobs.enqueue(
+                        "backfill_timeline",
+                        {"follower_id": follower.id, "user_ids": [user.id]},
+                        key=f"backfill:{follower.id}:{user.id}",
+                    )
+            except IntegrityError:
+                # Another request followed the user in the meantime
+                return JsonResponse({"error": "User has been already followed."}, status=404)
             return JsonResponse({"message": "User followed successfully."}, status=201)
 
 
@@ -668,33 +736,114 @@ def unfollowing(request, user_id):
         except Followers.DoesNotExist:
             return JsonResponse({"message": "User was unfollowed."}, status=403)
         
-        f.delete() 
+        with transaction.atomic():
+            deleted, _ = f.delete()
+            # A concurrent request may have unfollowed since it was read
+            if deleted:
+                counters.unfollowed(follower, user)
+                remove_from_timeline(follower, user)
+                follower_removed(user)
         return JsonResponse({"message": "User unfollowed successfully."}, status=201)
     else:
         return JsonResponse({"error": "Http request method must be 'DELETE'."}, status=404)
 
 
-# Query for the user's followings
-def lookup_user_following(request, user_id):
+# Query for the user's followings, most recently followed first
+async def lookup_user_following(request, user_id):
     if request.method == "GET":
         try:
-            user = User.objects.get(pk=user_id)
+            user = await User.objects.aget(pk=user_id)
         except User.DoesNotExist:
             return JsonResponse({"error": "User not found."}, status=404)
 
-        followings = Followers.objects.filter(follower=user)
-        return JsonResponse([following.user.serialize() for following in followings], safe=False)
+        return await follow_list_response(request, Followers.objects.filter(follower=user), "user")
 
 
-# Query for the user's followers
-def lookup_user_followers(request, user_id):
+# Query for the user's followers, most recent first
+async def lookup_user_followers(request, user_id):
     if request.method == "GET":
         try:
-            user = User.objects.get(pk=user_id)
+            user = await User.objects.aget(pk=user_id)
         except User.DoesNotExist:
             return JsonResponse({"error": "User not found."}, status=404)
 
-        followers = Followers.objects.filter(user=user)
-        return JsonResponse([follower.follower.serialize() for follower in followers], safe=False)
+        return await follow_list_response(request, Followers.objects.filter(user=user), "follower")
+
+
+# Lists the "field" users of a page of "follows" with the cursor for the next page.
+# Each page reads its rows with one range scan, the user cards with one multi-get and
+# the viewer's follow state with one query, however long the list is.
+async def follow_list_response(request, follows, field):
+    viewer = await get_viewer(request)
+    if wants_stream(request):
+        user_ids = follows.order_by("-timestamp", "-id").values_list(f"{field}_id", flat=True)
+        return streaming_json_response(request, stream_object({}, "users", user_chunks(user_ids, viewer)))
+    try:
+        page, next_cursor = await apaginate(follows.only("timestamp", field), request)
+    except InvalidCursor as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    users = await aserialize_users([getattr(follow, f"{field}_id") for follow in page], viewer)
+    return JsonResponse({"users": users, "next_cursor": next_cursor})
+
+
+# Suggests accounts for the viewer to follow: those followed by the most of the
+# accounts they already follow, each with how many of those follow it
+async def who_to_follow(request):
+    if request.method == "GET":
+        viewer = await get_viewer(request)
+        if not viewer.is_authenticated:
+            return JsonResponse({"error": "Login required."}, status=403)
+        try:
+            limit = page_size(request, 10)
+        except InvalidCursor as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+        suggested = await sync_to_async(graph.suggestions)(viewer.id, limit)
+        mutual = dict(suggested)
+        users = await aserialize_users(list(mutual), viewer)
+        for user in users:
+            user["followedByFollowingCount"] = mutual[user["id"]]
+        return JsonResponse({"users": users})
+    else:
+        return JsonResponse({"error": "Http request method must be 'GET'."}, status=404)
+
+
+# Pushes the new, edited and deleted posts and the like counts of the viewer's home
+# timeline, or of all posts with ?feed=all, as Server-Sent Events. Each open stream
+# holds a subscription rather than a worker, so it is only served under ASGI.
+async def live_events(request):
+    viewer = await get_viewer(request)
+    if not viewer.is_authenticated:
+        return JsonResponse({"error": "Login required."}, status=403)
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"error": "Live events are only served over ASGI."}, status=501)
+
+    if request.GET.get("feed") == "all":
+        channels = [events.ALL]
+    else:
+        channels = [events.author_channel(viewer.id)]
+        channels += [events.author_channel(user_id) for user_id in await graph.afollowee_ids(viewer.id)]
+    response = StreamingHttpResponse(events.stream(channels), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Keeps nginx from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+# Hit and miss counts of the post and user card cache in this process
+@staff_member_required
+def cache_stats(request):
+    return JsonResponse(cache.stats())
+
+
+# Latency histograms and query counts of the recent requests of each view in this
+# process, recorded with REQUEST_METRICS on
+@staff_member_required
+def request_stats(request):
+    return JsonResponse(metrics.stats())
 
 
+# Depth of the job queue, see jobs.py
+@staff_member_required
+def job_stats(request):
+    return JsonResponse(jobs.stats())
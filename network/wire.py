@@ -0,0 +1,167 @@
+import json
+
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+# Optional encoders; without them v2 is plain JSON and only gzip is offered
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Media types of the compact format; clients ask for it in the Accept header
+V2_JSON = "application/vnd.network.v2+json"
+V2_MSGPACK = "application/vnd.network.v2+msgpack"
+
+# The "true"/"false" strings of v1 that are booleans in v2
+FLAGS = {"is_authenticated", "is_faved", "is_followed_by_viewer", "following"}
+
+# Responses shorter than this are not worth compressing
+MIN_COMPRESS_LENGTH = 200
+
+
+
+def wants_v2(request):
+    accept = request.headers.get("Accept", "")
+    return V2_JSON in accept or V2_MSGPACK in accept
+
+
+def epoch_ms(timestamp):
+    return int(timestamp.timestamp() * 1000)
+
+
+def camel_case(key):
+    first, *rest = key.split("_")
+    return first + "".join(word.capitalize() for word in rest)
+
+
+def add_author(authors, item):
+    author_id = str(item["userId"])
+    if author_id not in authors:
+        authors[author_id] = {
+            "name": item["name"],
+            "username": item["username"],
+            "avatar": item["profile_image"],
+        }
+
+
+# Splits posts serialized by serialize_posts into compact posts and a table of their
+# authors and commenters by id, so each of them is sent once per page
+def compact_posts(posts):
+    authors = {}
+    compact = []
+    for post in posts:
+        add_author(authors, post)
+        for comment in post["comments"]:
+            add_author(authors, comment)
+        compact.append({
+            "id": post["id"],
+            "authorId": post["userId"],
+            "text": post["text"],
+            "timestamp": epoch_ms(post["timestamp"]),
+            "likeNumber": post["likeNumber"],
+            "faved": post["is_faved"] == "true",
+            "commentCount": post["commentCount"],
+            "comments": [
+                {
+                    "id": comment["id"],
+                    "authorId": comment["userId"],
+                    "text": comment["text"],
+                    "timestamp": epoch_ms(comment["timestamp"]),
+                }
+                for comment in post["comments"]
+            ],
+        })
+    return compact, authors
+
+
+def compact_value(key, value):
+    if isinstance(value, dict):
+        return {camel_case(k): compact_value(k, v) for k, v in value.items()}
+    if key in FLAGS:
+        return value == "true"
+    if hasattr(value, "timestamp"):
+        return epoch_ms(value)
+    return value
+
+
+# The v2 form of a timeline response: the posts under "posts" with their authors
+# under "authors", camelCase keys, booleans and epoch millisecond timestamps
+def to_v2(content, posts_key):
+    data = {"version": 2}
+    for key, value in content.items():
+        if key == posts_key:
+            data["posts"], data["authors"] = compact_posts(value)
+        else:
+            data[camel_case(key)] = compact_value(key, value)
+    return data
+
+
+def encode_v2(request, data):
+    if msgpack is not None and V2_MSGPACK in request.headers.get("Accept", ""):
+        return msgpack.packb(data), V2_MSGPACK
+    if orjson is not None:
+        return orjson.dumps(data), V2_JSON
+    return json.dumps(data, separators=(",", ":")).encode(), V2_JSON
+
+
+# Parses an Accept-Encoding header into its codings and their q-values
+def parse_encodings(header):
+    codings = {}
+    for item in header.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        codings[coding.lower()] = q
+    return codings
+
+
+# A coding is accepted when it, or "*" if it is not listed, has a q-value above 0
+def accepts(codings, coding):
+    return codings.get(coding, codings.get("*", 0)) > 0
+
+
+# Compresses "content" with brotli or gzip when the client accepts it
+def compress(request, response, content):
+    encodings = parse_encodings(request.headers.get("Accept-Encoding", ""))
+    if len(content) >= MIN_COMPRESS_LENGTH:
+        if brotli is not None and accepts(encodings, "br"):
+            content = brotli.compress(content, quality=4)
+            response.headers["Content-Encoding"] = "br"
+        elif accepts(encodings, "gzip"):
+            content = compress_string(content)
+            response.headers["Content-Encoding"] = "gzip"
+    response.content = content
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
+
+
+# Returns a timeline response, a v1 JSON dict whose posts are under "posts_key",
+# as it is (the format of the current React bundles) or, when the client accepts
+# it, in the compact v2 format as JSON or MessagePack, compressed if it can be
+def timeline_response(request, content, posts_key):
+    if not wants_v2(request):
+        response = JsonResponse(content, safe=False)
+    else:
+        body, content_type = encode_v2(request, to_v2(content, posts_key))
+        response = compress(request, HttpResponse(content_type=content_type), body)
+    patch_vary_headers(response, ["Accept"])
+    return response
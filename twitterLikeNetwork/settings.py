@@ -45,6 +45,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Only active with REQUEST_METRICS on, see below
+    'network.metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -89,6 +91,21 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+# Serialized posts and user cards are cached in NETWORK_CACHE_ALIAS. Point it at a
+# shared backend such as Redis or Memcached to share the cache between processes.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+NETWORK_CACHE_ALIAS = 'default'
+
+NETWORK_CACHE_TIMEOUT = 3600
+
 AUTH_USER_MODEL = "network.User"
 
 # Password validation
@@ -135,3 +152,127 @@ MEDIA_URL = '/media/'
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Home timelines
+# Posts are fanned out to followers' home timelines on write, except for accounts
+# with more followers than the threshold, whose posts are merged in on read.
+
+HOME_TIMELINE_CELEBRITY_THRESHOLD = 10000
+
+HOME_TIMELINE_BACKFILL = 800
+
+
+# Like counters
+# With write-behind on, likes are buffered in LikeCounterShards and added to
+# Posts.likeNumber by "manage.py flush_like_counters", so likes on a viral post do
+# not queue up on one row lock.
+
+LIKE_COUNTER_WRITE_BEHIND = False
+
+LIKE_COUNTER_SHARDS = 16
+
+
+# Live events
+# Clients subscribe to new, edited and deleted posts and like counts over
+# Server-Sent Events at users/events, which needs the ASGI server. EVENT_BROKER
+# carries events between processes; the default only reaches this process.
+
+EVENT_BROKER = "network.events.LocalBroker"
+
+EVENT_QUEUE_SIZE = 100
+
+EVENT_KEEPALIVE = 15
+
+
+# Profile images
+# Uploaded profile images and banners are resized into fixed-size WebP and JPEG
+# variants by a pool of IMAGE_PROCESSING_WORKERS threads; 0 resizes them in the
+# request. IMAGE_FORMAT is the format whose URLs are served.
+
+IMAGE_PROCESSING_WORKERS = 2
+
+IMAGE_FORMAT = "webp"
+
+# Uploads over IMAGE_UPLOAD_MAX_BYTES are cut off while they are received, and
+# images of more than IMAGE_MAX_PIXELS pixels are refused from their header.
+
+IMAGE_UPLOAD_MAX_BYTES = 10 * 1024 * 1024
+
+IMAGE_MAX_PIXELS = 40_000_000
+
+
+# Follow graph index
+# With GRAPH_INDEX each process keeps the follow graph in memory, about 16 bytes
+# per follow, to answer follow checks and suggestions without the database. Its
+# own follows apply at once; changes made by other processes are replayed from a
+# change log in the cache at most GRAPH_INDEX_REFRESH seconds later, and the index
+# is rebuilt only when the log does not go back far enough.
+
+GRAPH_INDEX = False
+
+GRAPH_INDEX_REFRESH = 60
+
+
+# Request metrics
+# With REQUEST_METRICS each response carries a Server-Timing header and each
+# request logs its query count, database, serialization and wall time as JSON on
+# the "network.metrics" logger. stats/requests shows the latency histogram of the
+# last REQUEST_METRICS_WINDOW requests of each view, and a request running the same
+# query REQUEST_METRICS_DUPLICATE_QUERIES times or more is logged as a warning.
+
+REQUEST_METRICS = False
+
+REQUEST_METRICS_WINDOW = 1000
+
+REQUEST_METRICS_DUPLICATE_QUERIES = 5
+
+
+# Top feed
+# users/posts?order=top ranks posts by log10 of their likes and comments plus their
+# age in TOP_FEED_DECAY_SECONDS: a post needs ten times the engagement to rank with
+# one that much newer. A comment counts as TOP_FEED_COMMENT_WEIGHT likes. Changing
+# either needs "manage.py rebuild_counters" to rescore the posts.
+
+TOP_FEED_DECAY_SECONDS = 45000
+
+TOP_FEED_COMMENT_WEIGHT = 2
+
+
+# Comments
+# Timelines show the newest COMMENT_PREVIEW_SIZE comments under each post; 0 leaves
+# them out.
+
+COMMENT_PREVIEW_SIZE = 3
+
+
+# Batch writes
+# posts/batch, users/likes/batch and users/following/batch take at most
+# BATCH_WRITE_MAX_ITEMS items per request.
+
+BATCH_WRITE_MAX_ITEMS = 5000
+
+
+# Job queue
+# With JOB_QUEUE on, fan-out, tag extraction and timeline backfills are queued
+# in the transaction of the write and run by "manage.py runworker" rather than in
+# the request. Live events are still published by the request, whose broker
+# reaches its own subscribers. Failed jobs are retried JOB_MAX_ATTEMPTS
+# times, JOB_RETRY_DELAY seconds apart and doubling; jobs still running after
+# JOB_TIMEOUT seconds are assumed lost with their worker and queued again. On
+# SQLite, run several workers only with "transaction_mode": "IMMEDIATE" in the
+# database OPTIONS, or their transactions fail with "database is locked".
+
+JOB_QUEUE = False
+
+JOB_WORKER_THREADS = 4
+
+JOB_WORKER_PROCESSES = 1
+
+JOB_POLL_INTERVAL = 1
+
+JOB_MAX_ATTEMPTS = 5
+
+JOB_RETRY_DELAY = 10
+
+JOB_TIMEOUT = 300